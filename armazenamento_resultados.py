@@ -0,0 +1,209 @@
+# ===============================================================
+# Armazenamento persistente de resultados (SQLite)
+#
+# Cada execução é indexada por uma chave de conteúdo: o hash SHA-256
+# do nome do método, dos dados de entrada e dos parâmetros. Repetir
+# o mesmo problema devolve o resultado gravado, sem recalcular.
+#
+# Guardados por registro: solução x (formato .npy), tempo original,
+# status, traço (ações/passos ou a tabela de iterações) e parâmetros.
+# ===============================================================
+
+import datetime
+import functools
+import hashlib
+import inspect
+import io
+import json
+import os
+import sqlite3
+
+import numpy as np
+
+CAMINHO_PADRAO = os.path.join("logs", "resultados.sqlite3")
+
+# Opções que fazem o método devolver matrizes em passos; essas execuções
+# não são armazenadas (o traço gravado é só texto).
+OPCOES_COM_MATRIZES = ("mostrar_matrizes", "mostrar_LU", "mostrar_L", "registrar_iteracoes")
+
+
+def _agora():
+    return datetime.datetime.now().isoformat(timespec="seconds")
+
+
+def _para_bytes(x):
+    if x is None:
+        return None
+    buffer = io.BytesIO()
+    np.save(buffer, np.asarray(x), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def _de_bytes(dados):
+    if dados is None:
+        return None
+    return np.load(io.BytesIO(dados), allow_pickle=False)
+
+
+def _normalizar(valor):
+    """Converte parâmetros para algo serializável de forma determinística."""
+    if isinstance(valor, np.ndarray):
+        return {"dtype": str(valor.dtype), "forma": list(valor.shape), "dados": valor.tolist()}
+    if isinstance(valor, (np.floating, np.integer)):
+        return valor.item()
+    return valor
+
+
+def chave_conteudo(metodo, entradas=(), parametros=None):
+    """Hash SHA-256 de método, arrays de entrada (forma, dtype e bytes) e parâmetros."""
+    h = hashlib.sha256()
+    h.update(metodo.encode("utf-8"))
+    for entrada in entradas:
+        entrada = np.ascontiguousarray(entrada)
+        h.update(f"|{entrada.dtype.str}|{entrada.shape}|".encode("utf-8"))
+        h.update(entrada.tobytes())
+    parametros = {k: _normalizar(v) for k, v in (parametros or {}).items()}
+    h.update(json.dumps(parametros, sort_keys=True, default=repr).encode("utf-8"))
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _versao_solvers_lineares(ML):
+    """Hash do código de metodos_lineares: corrigir um solver (ou a escolha do Automático) invalida os registros antigos."""
+    try:
+        fonte = inspect.getsource(ML)
+    except (OSError, TypeError):
+        fonte = repr(sorted(ML.METODOS))
+    return hashlib.sha256(fonte.encode("utf-8")).hexdigest()
+
+
+def _fonte_funcoes_raizes(MR):
+    """Código de f, f' e phi: editar a função do problema invalida os registros antigos."""
+    partes = []
+    for nome in ("f", "f_derivada", "phi"):
+        funcao = getattr(MR, nome, None)
+        try:
+            partes.append(inspect.getsource(funcao))
+        except (OSError, TypeError):
+            partes.append(repr(getattr(funcao, "__code__", funcao)))
+    return "\n".join(partes)
+
+
+class ArmazemResultados:
+    def __init__(self, caminho=CAMINHO_PADRAO):
+        pasta = os.path.dirname(caminho)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        self.caminho = caminho
+        self.conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self.conexao.execute("""
+            CREATE TABLE IF NOT EXISTS resultados (
+                chave TEXT PRIMARY KEY,
+                metodo TEXT NOT NULL,
+                criado_em TEXT NOT NULL,
+                ultimo_acesso TEXT NOT NULL,
+                acessos INTEGER NOT NULL DEFAULT 0,
+                tempo REAL,
+                status TEXT,
+                x BLOB,
+                traco TEXT,
+                parametros TEXT
+            )""")
+        self.conexao.execute("CREATE INDEX IF NOT EXISTS idx_ultimo_acesso ON resultados (ultimo_acesso)")
+        self.conexao.commit()
+
+    def fechar(self):
+        self.conexao.close()
+
+    # ---------------- operações básicas ----------------
+    def buscar(self, chave):
+        """Retorna o registro como dicionário, ou None se a chave não existir."""
+        linha = self.conexao.execute(
+            "SELECT metodo, criado_em, tempo, status, x, traco, parametros FROM resultados WHERE chave = ?",
+            (chave,)).fetchone()
+        if linha is None:
+            return None
+        self.conexao.execute("UPDATE resultados SET ultimo_acesso = ?, acessos = acessos + 1 WHERE chave = ?",
+                             (_agora(), chave))
+        self.conexao.commit()
+        metodo, criado_em, tempo, status, x, traco, parametros = linha
+        return {"chave": chave, "metodo": metodo, "criado_em": criado_em, "tempo": tempo, "status": status,
+                "x": _de_bytes(x), "traco": json.loads(traco) if traco else None,
+                "parametros": json.loads(parametros) if parametros else {}}
+
+    def salvar(self, chave, metodo, tempo, status, x=None, traco=None, parametros=None):
+        agora = _agora()
+        self.conexao.execute(
+            "INSERT OR REPLACE INTO resultados (chave, metodo, criado_em, ultimo_acesso, tempo, status, x, traco, parametros) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (chave, metodo, agora, agora, tempo, status, _para_bytes(x),
+             json.dumps(traco, ensure_ascii=False, default=repr),
+             json.dumps({k: _normalizar(v) for k, v in (parametros or {}).items()}, ensure_ascii=False, default=repr)))
+        self.conexao.commit()
+
+    def __len__(self):
+        return self.conexao.execute("SELECT COUNT(*) FROM resultados").fetchone()[0]
+
+    # ---------------- execução com reaproveitamento ----------------
+    def resolver_linear(self, A, b, metodo, **opcoes):
+        """Como METODOS[metodo](A, b, retornar_passos=True, **opcoes), consultando o armazenamento antes.
+
+        Retorna (x, tempo, status, passos, do_armazenamento).
+        """
+        import metodos_lineares as ML
+
+        A = np.asarray(A, dtype=float)
+        b = np.asarray(b, dtype=float).reshape(-1)
+        armazenavel = not any(opcoes.get(nome) for nome in OPCOES_COM_MATRIZES)
+        chave = chave_conteudo(metodo, (A, b), {**opcoes, "versao_solvers": _versao_solvers_lineares(ML)})
+
+        if armazenavel:
+            registro = self.buscar(chave)
+            if registro is not None:
+                return registro["x"], registro["tempo"], registro["status"], registro["traco"] or {}, True
+
+        x, tempo, status, passos = ML.METODOS[metodo](A, b, retornar_passos=True, **opcoes)
+        if armazenavel and x is not None:
+            # só a parte textual/escalar de passos vai para o traço
+            traco = {k: v for k, v in passos.items()
+                     if isinstance(v, (str, int, float, bool, type(None))) or k == "acoes"
+                     or (isinstance(v, list) and all(isinstance(e, (int, str)) for e in v))}
+            self.salvar(chave, metodo, tempo, status, x, traco, opcoes)
+        return x, tempo, status, passos, False
+
+    def resolver_raiz(self, nome, dados):
+        """Executa MR.METODOS[nome](dados, saida) ou devolve o texto gravado.
+
+        Retorna (texto, do_armazenamento).
+        """
+        import metodos_raizes as MR
+
+        parametros = {"a": dados.a, "b": dados.b, "x0": dados.x0, "x1": dados.x1,
+                      "tol": dados.tol, "max_iter": dados.max_iter, "funcoes": _fonte_funcoes_raizes(MR)}
+        chave = chave_conteudo(nome, (), parametros)
+        registro = self.buscar(chave)
+        if registro is not None:
+            return registro["traco"], True
+
+        saida = io.StringIO()
+        MR.METODOS[nome](dados, saida)
+        texto = saida.getvalue()
+        parametros.pop("funcoes")
+        self.salvar(chave, nome, None, "Concluído", None, texto, parametros)
+        return texto, False
+
+    # ---------------- retenção ----------------
+    def compactar(self, max_registros=None, max_dias=None):
+        """Remove registros antigos (por último acesso) e compacta o arquivo. Retorna quantos removeu."""
+        antes = len(self)
+        if max_dias is not None:
+            limite = (datetime.datetime.now() - datetime.timedelta(days=max_dias)).isoformat(timespec="seconds")
+            self.conexao.execute("DELETE FROM resultados WHERE ultimo_acesso < ?", (limite,))
+        if max_registros is not None:
+            self.conexao.execute(
+                "DELETE FROM resultados WHERE chave NOT IN "
+                "(SELECT chave FROM resultados ORDER BY ultimo_acesso DESC LIMIT ?)", (max_registros,))
+        self.conexao.commit()
+        self.conexao.execute("VACUUM")
+        return antes - len(self)
+
@@ -0,0 +1,212 @@
+# ===============================================================
+# Atualização de posto baixo de fatorações já calculadas
+#
+# Quando A muda pouco (algumas linhas/entradas editadas), a fatoração
+# não é refeita do zero:
+#   - LU: a mudança A' = A + U V^T é absorvida pela fórmula de
+#     Sherman-Morrison-Woodbury, reaproveitando os fatores de A;
+#   - Cholesky: a mudança simétrica vira atualizações/reduções de
+#     posto 1 do próprio fator L, em O(n²) cada.
+# Cada coluna de atualização custa O(n²). Quando o custo acumulado
+# passa de uma fração do custo de refatorar, a fatoração é refeita.
+#
+# Retorno de resolver_com_atualizacao no padrão de metodos_lineares:
+#   x, tempo, status  ou  x, tempo, status, passos
+# ===============================================================
+
+import time
+
+import numpy as np
+
+import metodos_lineares as ML
+
+# Refatora quando as atualizações acumuladas custarem esta fração de uma fatoração nova
+LIMIAR_REFATORACAO = 0.5
+
+
+def _cholesky_posto1(L, w, sinal=1.0):
+    """L L^T + sinal·w w^T, no lugar de L. Retorna False se a redução deixar de ser definida positiva."""
+    w = np.array(w, dtype=float)
+    n = L.shape[0]
+    for k in range(n):
+        quadrado = L[k, k] ** 2 + sinal * w[k] ** 2
+        if quadrado <= 0.0:
+            return False
+        r = np.sqrt(quadrado)
+        c = r / L[k, k]
+        s = w[k] / L[k, k]
+        L[k, k] = r
+        if k + 1 < n:
+            L[k + 1:, k] = (L[k + 1:, k] + sinal * s * w[k + 1:]) / c
+            w[k + 1:] = c * w[k + 1:] - s * L[k + 1:, k]
+    return True
+
+
+class FatoracaoAtualizavel:
+    """Fatoração LU (com pivoteamento parcial) ou de Cholesky de A que aceita mudanças de posto baixo."""
+
+    def __init__(self, A, tipo="lu"):
+        if tipo not in ("lu", "cholesky"):
+            raise ValueError(f"Tipo de fatoração desconhecido: {tipo}")
+        self.tipo = tipo
+        self.A = np.array(A, dtype=float)
+        self.n = self.A.shape[0]
+        self.refatoracoes = 0
+        self.usos = 0
+        self._fatorar()
+
+    # ---------------- fatoração base ----------------
+    def _fatorar(self):
+        if self.tipo == "lu":
+            self.LU, self.piv = ML._fatorar_lu(self.A, pivotear=True)
+            if self.LU is None:
+                raise np.linalg.LinAlgError(f"Matriz singular (pivô nulo na etapa {self.piv}).")
+        else:
+            self.L = np.linalg.cholesky(self.A)
+        # termos de Woodbury (só LU): A atual = A_fatorada + U V^T, Z = A_fatorada^{-1} U
+        self.U = np.zeros((self.n, 0))
+        self.V = np.zeros((self.n, 0))
+        self.Z = np.zeros((self.n, 0))
+        self.capacitancia = np.zeros((0, 0))
+        self.posto = 0
+        self.custo_acumulado = 0.0
+
+    @property
+    def custo_fatoracao(self):
+        return (2.0 if self.tipo == "lu" else 1.0) * self.n ** 3 / 3.0
+
+    def _resolver_base(self, B):
+        if self.tipo == "lu":
+            return ML._resolver_lu(self.LU, self.piv, np.asarray(B, dtype=float))
+        return ML._substituicao_regressiva(self.L.T, ML._substituicao_progressiva(self.L, B))
+
+    def resolver(self, b):
+        """Resolve A x = b com a A atual (fatores base + correção de Woodbury, se houver)."""
+        x = self._resolver_base(b)
+        if self.posto:
+            x = x - self.Z @ np.linalg.solve(self.capacitancia, self.V.T @ x)
+        return x
+
+    def refatorar(self):
+        self.refatoracoes += 1
+        self._fatorar()
+
+    def _vale_atualizar(self, colunas):
+        custo = 2.0 * self.n ** 2 * colunas
+        return self.custo_acumulado + custo <= LIMIAR_REFATORACAO * self.custo_fatoracao
+
+    # ---------------- atualizações ----------------
+    def atualizar(self, U, V):
+        """A ← A + U V^T (LU). Retorna "woodbury" ou "refatorada"."""
+        U = np.array(U, dtype=float).reshape(self.n, -1)
+        V = np.array(V, dtype=float).reshape(self.n, -1)
+        if self.tipo != "lu":
+            raise ValueError("Use atualizar_simetrica para a fatoração de Cholesky.")
+        self.A += U @ V.T
+        if not self._vale_atualizar(U.shape[1]):
+            self.refatorar()
+            return "refatorada"
+
+        self.U = np.hstack([self.U, U])
+        self.V = np.hstack([self.V, V])
+        self.Z = np.hstack([self.Z, self._resolver_base(U)])
+        self.capacitancia = np.eye(self.U.shape[1]) + self.V.T @ self.Z
+        self.posto = self.U.shape[1]
+        self.custo_acumulado += 2.0 * self.n ** 2 * U.shape[1]
+        # capacitância mal condicionada: a fórmula perderia precisão
+        if np.linalg.cond(self.capacitancia) > 1e12:
+            self.refatorar()
+            return "refatorada"
+        return "woodbury"
+
+    def atualizar_simetrica(self, W, sinais):
+        """A ← A + Σ sinais[i]·W[:, i] W[:, i]^T (Cholesky). Retorna "posto1" ou "refatorada"."""
+        W = np.array(W, dtype=float).reshape(self.n, -1)
+        sinais = np.broadcast_to(np.asarray(sinais, dtype=float), (W.shape[1],))
+        if self.tipo != "cholesky":
+            raise ValueError("Use atualizar para a fatoração LU.")
+        self.A += (W * sinais) @ W.T
+        if not self._vale_atualizar(W.shape[1]):
+            self.refatorar()
+            return "refatorada"
+
+        L = self.L.copy()
+        for i in range(W.shape[1]):
+            if not _cholesky_posto1(L, W[:, i], sinais[i]):
+                # redução falhou (perda de definição positiva ou arredondamento): refatora para confirmar
+                self.refatorar()
+                return "refatorada"
+        self.L = L
+        self.custo_acumulado += 2.0 * self.n ** 2 * W.shape[1]
+        return "posto1"
+
+    def atualizar_matriz(self, A_nova):
+        """Absorve A_nova - A como mudança de posto baixo. Retorna (modo, posto da mudança)."""
+        A_nova = np.asarray(A_nova, dtype=float)
+        if A_nova.shape != self.A.shape:
+            raise ValueError("A nova matriz tem dimensões diferentes.")
+        delta = A_nova - self.A
+        linhas = np.flatnonzero(np.any(delta != 0, axis=1))
+        colunas = np.flatnonzero(np.any(delta != 0, axis=0))
+        if linhas.size == 0:
+            return "inalterada", 0
+
+        if self.tipo == "lu":
+            # Δ só tem linhas em R (ou colunas em C): Δ = E_R Δ[R] (ou Δ[:, C] E_C^T)
+            if linhas.size <= colunas.size:
+                U = np.zeros((self.n, linhas.size))
+                U[linhas, np.arange(linhas.size)] = 1.0
+                V = delta[linhas].T
+            else:
+                U = delta[:, colunas]
+                V = np.zeros((self.n, colunas.size))
+                V[colunas, np.arange(colunas.size)] = 1.0
+            return self.atualizar(U, V), U.shape[1]
+
+        if not np.allclose(delta, delta.T):
+            raise ValueError("A mudança não é simétrica; Cholesky exige A simétrica.")
+        # Δ simétrica tem suporte R x R: Δ = Σ λ_i (E_R v_i)(E_R v_i)^T
+        autovalores, autovetores = np.linalg.eigh(delta[np.ix_(linhas, linhas)])
+        relevantes = np.abs(autovalores) > 1e-14 * np.abs(autovalores).max()
+        W = np.zeros((self.n, int(relevantes.sum())))
+        W[linhas] = autovetores[:, relevantes] * np.sqrt(np.abs(autovalores[relevantes]))
+        return self.atualizar_simetrica(W, np.sign(autovalores[relevantes])), W.shape[1]
+
+
+def resolver_com_atualizacao(fatoracao, A, b, retornar_passos=False):
+    """Atualiza fatoracao para A (se mudou) e resolve A x = b.
+
+    Em caso de erro (A deixou de ser fatorável) a fatoração fica inconsistente e deve ser descartada.
+    """
+    inicio = time.time()
+    b = np.array(b, dtype=float).reshape(-1)
+    passos = {"matrizes": [], "acoes": []}
+    nome = "Fatoração LU com pivoteamento parcial" if fatoracao.tipo == "lu" else "Fatoração de Cholesky"
+
+    try:
+        modo, posto = fatoracao.atualizar_matriz(A)
+    except np.linalg.LinAlgError as e:
+        status = f"ERRO: {nome} não aplicável após a atualização — {e}"
+        return ML._empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+
+    if modo == "inalterada" and fatoracao.usos == 0:
+        passos["acoes"].append("Fatoração calculada (fica guardada para as próximas mudanças de A)")
+        detalhe = "calculada"
+    elif modo == "inalterada":
+        passos["acoes"].append("A não mudou: fatoração reaproveitada")
+        detalhe = "reaproveitada"
+    elif modo == "refatorada":
+        passos["acoes"].append(f"Mudança de posto {posto}: atualizar sairia mais caro, A refatorada")
+        detalhe = "refatorada"
+    elif modo == "woodbury":
+        passos["acoes"].append(f"Mudança de posto {posto} absorvida por Woodbury (posto acumulado {fatoracao.posto})")
+        detalhe = f"atualizada por Woodbury, posto acumulado {fatoracao.posto}"
+    else:
+        passos["acoes"].append(f"Mudança de posto {posto} aplicada como atualizações de posto 1 de L")
+        detalhe = f"com {posto} atualizações de posto 1"
+
+    x = fatoracao.resolver(b)
+    fatoracao.usos += 1
+    tempo = time.time() - inicio
+    status = f"Sucesso ({nome} {detalhe})."
+    return ML._empacotar_retorno(x, tempo, status, passos, retornar_passos)
@@ -0,0 +1,359 @@
+# ===============================================================
+# Autovalores — potência, inversa com deslocamento e Lanczos
+#
+# Calcula só os k autopares pedidos, sem np.linalg.eig em A inteira:
+#   - potencia: iteração de subespaço (k vetores + QR + Rayleigh-Ritz),
+#     autovalores de maior módulo;
+#   - inversa_deslocada: a mesma iteração com (A - sigma I)⁻¹, autovalores
+#     mais próximos de sigma. A - sigma I é fatorada uma única vez (LU em
+#     blocos de metodos_lineares; LU esparsa com RCM se A for esparsa) e a
+#     fatoração fica em cache para novas chamadas com o mesmo deslocamento;
+#   - lanczos: A simétrica, com reortogonalização completa; os k maiores,
+#     os k menores ou, com sigma, os k mais próximos de sigma
+#     (deslocamento e inversão, usando a mesma fatoração em cache).
+# A pode ser densa ou matriz_esparsa.MatrizEsparsa (produtos A·v e LU
+# esparsa, sem formar a matriz densa).
+#
+# diagnostico_espectral resume o que interessa aos solvers lineares:
+# extremos do espectro, número de condição e raios espectrais de
+# Jacobi e Gauss-Seidel.
+#
+# Retorno no padrão de metodos_lineares, com x = (autovalores, autovetores):
+#   (valores, vetores), tempo, status  ou  ..., passos
+# ===============================================================
+
+import hashlib
+import time
+
+import numpy as np
+
+import metodos_lineares as ML
+from matriz_esparsa import MatrizEsparsa
+
+LIMITE_CACHE_FATORACOES = 4  # fatorações de A - sigma I mantidas em memória
+SOBREAMOSTRAGEM = 5          # vetores extras na iteração de subespaço (acelera autovalores próximos)
+LIMITE_DENSA_DESLOCADA = 3000  # ordem máxima de MatrizEsparsa para recorrer à LU densa com pivoteamento
+QUEBRA_LANCZOS = 1e-12       # beta relativo a ||A v_j|| abaixo do qual o subespaço de Krylov é invariante
+_fatoracoes = {}
+
+
+# ---------------------------------------------------------------
+# Operadores
+# ---------------------------------------------------------------
+
+def _produto(A):
+    """Função V ↦ A V (V vetor ou n x k)."""
+    if isinstance(A, MatrizEsparsa):
+        return A.produto
+    return lambda V: A @ V
+
+
+def _autovalores(k):
+    return "1 autovalor" if k == 1 else f"{k} autovalores"
+
+
+def _como_matriz(A):
+    return A if isinstance(A, MatrizEsparsa) else np.asarray(A, dtype=float)
+
+
+def _validar_k(k, n):
+    if not 1 <= k <= n:
+        raise ValueError(f"k deve estar entre 1 e n = {n}; recebido {k}")
+
+
+def _chave(A, sigma):
+    resumo = hashlib.sha1(repr((A.shape, float(sigma))).encode())
+    if isinstance(A, MatrizEsparsa):
+        for vetor in (A.linhas, A.colunas, A.valores):
+            resumo.update(vetor.tobytes())
+    else:
+        resumo.update(np.ascontiguousarray(A).tobytes())
+    return resumo.hexdigest()
+
+
+def _resolvedor_denso(A, sigma):
+    """(A - sigma I)⁻¹ por LU com pivoteamento parcial (em blocos) da matriz densa."""
+    M = A.densa() if isinstance(A, MatrizEsparsa) else np.array(A, dtype=float)
+    M[np.diag_indices_from(M)] -= sigma
+    perm, _ = ML._fatorar_lu_blocos(M)  # LinAlgError se sigma for autovalor (A - sigma I singular)
+    L = np.tril(M, -1) + np.eye(M.shape[0])
+    U = np.triu(M)
+    pivos = np.abs(np.diag(U))
+    if pivos.min() <= 1e-10 * pivos.max():
+        raise np.linalg.LinAlgError("A - sigma I é (quase) singular.")
+
+    def resolver(Y):
+        return ML._substituicao_regressiva(U, ML._substituicao_progressiva(L, np.asarray(Y)[perm]))
+    return resolver
+
+
+def _resolvedor_esparso(A, sigma):
+    """(A - sigma I)⁻¹ pela LU esparsa de metodos_lineares (ordenação RCM + LU em banda), O(n p²).
+
+    A LU em banda não pivoteia: retorna None se aparecer pivô pequeno ou se
+    uma solução de teste tiver erro regressivo acima de LIMITE_ERRO_REGRESSIVO.
+    """
+    n = A.shape[0]
+    indices = np.arange(n)
+    M = A - MatrizEsparsa(indices, indices, np.full(n, float(sigma)), A.shape)
+    analise, _ = ML.obter_analise(M)
+    p, q = analise["p"], analise["q"]
+    B, etapa = ML._fatorar_esparsa(M, analise)
+    pivos = np.abs(B[:, p])
+    if etapa is not None or pivos.min() <= 1e-10 * pivos.max():
+        return None
+    resolver = ML._permutado(lambda Y: ML._resolver_lu_banda(B, p, q, Y), analise["perm"])
+
+    z = np.random.default_rng(0).standard_normal(n)
+    r = M.produto(z)
+    x = resolver(r)
+    norma_M = np.bincount(M.linhas, weights=np.abs(M.valores), minlength=n).max()
+    erro = np.abs(r - M.produto(x)).max() / (norma_M * np.abs(x).max() + np.abs(r).max())
+    return resolver if erro <= ML.LIMITE_ERRO_REGRESSIVO else None
+
+
+def resolvedor_deslocado(A, sigma=0.0):
+    """Retorna (resolver, reaproveitada): resolver(Y) = (A - sigma I)⁻¹ Y, com a fatoração em cache.
+
+    MatrizEsparsa usa a LU esparsa (RCM + banda); só se ela for instável
+    (não pivoteia) recorre à LU densa com pivoteamento, até LIMITE_DENSA_DESLOCADA.
+    """
+    chave = _chave(A, sigma)
+    if chave in _fatoracoes:
+        return _fatoracoes[chave], True
+
+    resolver = _resolvedor_esparso(A, sigma) if isinstance(A, MatrizEsparsa) else None
+    if resolver is None:
+        if isinstance(A, MatrizEsparsa) and A.shape[0] > LIMITE_DENSA_DESLOCADA:
+            raise np.linalg.LinAlgError("LU esparsa de A - sigma I instável (sem pivoteamento) e A grande "
+                                        "demais para a LU densa; tente outro sigma.")
+        resolver = _resolvedor_denso(A, sigma)
+
+    if len(_fatoracoes) >= LIMITE_CACHE_FATORACOES:
+        del _fatoracoes[next(iter(_fatoracoes))]
+    _fatoracoes[chave] = resolver
+    return resolver, False
+
+
+def _resolvedor_seguro(A, sigma, passos):
+    """resolvedor_deslocado; se sigma for (quase) um autovalor, desloca-o levemente."""
+    try:
+        resolver, reaproveitada = resolvedor_deslocado(A, sigma)
+    except np.linalg.LinAlgError:
+        sigma = sigma + 1e-6 * max(1.0, abs(sigma))
+        passos["acoes"].append(f"A - sigma I singular; deslocamento ajustado para {sigma:.10g}")
+        resolver, reaproveitada = resolvedor_deslocado(A, sigma)
+    passos["acoes"].append(f"Fatoração de A - {sigma:.6g} I " + ("reaproveitada do cache" if reaproveitada else "calculada"))
+    return resolver, sigma
+
+
+# ---------------------------------------------------------------
+# Iteração de subespaço (potência e inversa)
+# ---------------------------------------------------------------
+
+def _iteracao_subespaco(A, aplicar, k, tol, max_iter, semente, ordem, passos):
+    """Itera Q ← qr(aplicar(Q)) e extrai os pares de Rayleigh-Ritz de A. Retorna (valores, vetores, iterações, convergiu).
+
+    O subespaço tem k + SOBREAMOSTRAGEM vetores; só os k primeiros pares precisam convergir.
+    """
+    produto = _produto(A)
+    n = A.shape[0]
+    Q, _ = np.linalg.qr(np.random.default_rng(semente).standard_normal((n, min(n, k + SOBREAMOSTRAGEM))))
+    for it in range(1, max_iter + 1):
+        Q, _ = np.linalg.qr(aplicar(Q))
+        AQ = produto(Q)
+        valores, S = np.linalg.eig(Q.T @ AQ)
+        if np.all(np.isreal(valores)):
+            valores, S = valores.real, S.real
+        indices = ordem(valores)[:k]
+        valores, vetores = valores[indices], Q @ S[:, indices]
+        residuos = np.linalg.norm(AQ @ S[:, indices] - vetores * valores, axis=0)
+        if np.all(residuos <= tol * max(1.0, np.abs(valores).max())):
+            passos["residuos"] = residuos
+            return valores, vetores, it, True
+    passos["residuos"] = residuos
+    return valores, vetores, max_iter, False
+
+
+def potencia(A, k=1, tol=1e-8, max_iter=1000, semente=0, retornar_passos=False):
+    """Os k autovalores de maior módulo (e autovetores)."""
+    inicio = time.time()
+    A = _como_matriz(A)
+    _validar_k(k, A.shape[0])
+    passos = {"acoes": []}
+    produto = _produto(A)
+    valores, vetores, it, convergiu = _iteracao_subespaco(
+        A, produto, k, tol, max_iter, semente, lambda v: np.argsort(-np.abs(v)), passos)
+    if convergiu:
+        status = f"Convergiu em {it} iterações (potência, {_autovalores(k)} de maior módulo)."
+    else:
+        status = "Atenção: não convergiu dentro do número máximo de iterações (potência)."
+    return ML._empacotar_retorno((valores, vetores), time.time() - inicio, status, passos, retornar_passos)
+
+
+def inversa_deslocada(A, sigma=0.0, k=1, tol=1e-8, max_iter=200, semente=0, retornar_passos=False):
+    """Os k autovalores mais próximos de sigma (sigma = 0: os de menor módulo)."""
+    inicio = time.time()
+    A = _como_matriz(A)
+    _validar_k(k, A.shape[0])
+    passos = {"acoes": []}
+    resolver, sigma = _resolvedor_seguro(A, sigma, passos)
+    valores, vetores, it, convergiu = _iteracao_subespaco(
+        A, resolver, k, tol, max_iter, semente, lambda v: np.argsort(np.abs(v - sigma)), passos)
+    if convergiu:
+        status = f"Convergiu em {it} iterações (inversa com deslocamento {sigma:.6g}, {_autovalores(k)})."
+    else:
+        status = "Atenção: não convergiu dentro do número máximo de iterações (inversa com deslocamento)."
+    return ML._empacotar_retorno((valores, vetores), time.time() - inicio, status, passos, retornar_passos)
+
+
+# ---------------------------------------------------------------
+# Lanczos (A simétrica)
+# ---------------------------------------------------------------
+
+def lanczos(A, k=1, qual="maiores", sigma=None, tol=1e-8, max_iter=None, semente=0, retornar_passos=False):
+    """k autopares de A simétrica: qual = "maiores" ou "menores"; com sigma, os k mais próximos de sigma."""
+    inicio = time.time()
+    A = _como_matriz(A)
+    passos = {"acoes": []}
+    n = A.shape[0]
+    _validar_k(k, n)
+    if qual not in ("maiores", "menores"):
+        raise ValueError(f"qual deve ser 'maiores' ou 'menores'; recebido {qual}")
+    if sigma is None:
+        aplicar = _produto(A)
+        escolher = (lambda t: np.argsort(-t)) if qual == "maiores" else (lambda t: np.argsort(t))
+    else:
+        # deslocamento e inversão: os autovalores mais próximos de sigma viram os maiores em módulo
+        aplicar, sigma = _resolvedor_seguro(A, sigma, passos)
+        escolher = lambda t: np.argsort(-np.abs(t))
+    max_iter = min(n, max(k, max_iter or max(20 * k, 300)))
+
+    V = np.zeros((n, max_iter + 1))
+    alfas, betas = [], []
+    gerador = np.random.default_rng(semente)
+    v = gerador.standard_normal(n)
+    V[:, 0] = v / np.linalg.norm(v)
+    convergiu = False
+    inicio_bloco = 0  # passo em que começou o bloco atual (após a última quebra)
+    for j in range(max_iter):
+        w = aplicar(V[:, j])
+        norma_w = np.linalg.norm(w)
+        alfas.append(np.dot(V[:, j], w))
+        # reortogonalização completa (duas passagens de Gram-Schmidt)
+        for _ in range(2):
+            w -= V[:, :j + 1] @ (V[:, :j + 1].T @ w)
+        beta = np.linalg.norm(w)
+        # quebra: o subespaço de Krylov é invariante (os autovalores de T dele são exatos),
+        # mas autovalores repetidos ou ortogonais ao vetor inicial podem ter ficado de fora
+        quebra = beta <= QUEBRA_LANCZOS * norma_w or beta == 0.0
+
+        if j + 1 >= k:
+            T = np.diag(alfas) + np.diag(betas, 1) + np.diag(betas, -1)
+            theta, S = np.linalg.eigh(T)
+            indices = escolher(theta)[:k]
+        if quebra and j + 1 == n:
+            convergiu = True  # o espaço inteiro foi gerado: T tem todos os autovalores
+            break
+        if quebra and j + 1 < max_iter:
+            # recomeça com um vetor ortogonal aos anteriores (beta = 0, T em blocos)
+            passos["acoes"].append(f"Quebra do Lanczos no passo {j + 1}; recomeçando com vetor ortogonal")
+            w = gerador.standard_normal(n)
+            for _ in range(2):
+                w -= V[:, :j + 1] @ (V[:, :j + 1].T @ w)
+            betas.append(0.0)
+            V[:, j + 1] = w / np.linalg.norm(w)
+            inicio_bloco = j + 1
+            continue
+
+        if j + 1 >= k and j + 1 - inicio_bloco >= k:
+            # resíduo de Ritz: ||A y - theta y|| = beta·|último componente de s|, relativo a cada theta
+            limites = beta * np.abs(S[-1, indices])
+            escala = np.maximum(np.abs(theta[indices]), np.finfo(float).eps * np.abs(theta).max())
+            convergiu = bool(np.all(limites <= tol * escala))
+            if convergiu and sigma is not None:
+                # com deslocamento e inversão o limite acima pode enganar (theta enorme perto de sigma):
+                # confirma com o resíduo verdadeiro em A
+                y = V[:, :j + 1] @ S[:, indices]
+                lam = sigma + 1.0 / theta[indices]
+                verdadeiros = np.linalg.norm(_produto(A)(y) - y * lam, axis=0)
+                convergiu = bool(np.all(verdadeiros <= tol * np.maximum(1.0, np.abs(lam))))
+        if convergiu or j + 1 == max_iter:
+            break
+        betas.append(beta)
+        V[:, j + 1] = w / beta
+
+    valores = theta[indices]
+    vetores = V[:, :j + 1] @ S[:, indices]
+    if sigma is not None:
+        valores = sigma + 1.0 / valores
+    passos["passos_lanczos"] = j + 1
+    if convergiu:
+        alvo = f"mais próximos de {sigma:.6g}" if sigma is not None else qual
+        status = f"Convergiu em {j + 1} passos (Lanczos, {_autovalores(k)} {alvo})."
+    else:
+        status = "Atenção: não convergiu dentro do número máximo de iterações (Lanczos)."
+    return ML._empacotar_retorno((valores, vetores), time.time() - inicio, status, passos, retornar_passos)
+
+
+# ---------------------------------------------------------------
+# Diagnóstico espectral para os solvers lineares
+# ---------------------------------------------------------------
+
+def _eh_simetrica(A):
+    if isinstance(A, MatrizEsparsa):
+        # nas triplas, sem formar a densa
+        diferenca = A - A.T
+        return diferenca.nnz == 0 or np.abs(diferenca.valores).max() <= 1e-8 * max(1.0, np.abs(A.valores).max())
+    return bool(np.allclose(A, A.T))
+
+
+def _raios_iteracao(A):
+    """Raios espectrais estimados de Jacobi e Gauss-Seidel (estimar_raio_espectral, nas triplas se A for esparsa)."""
+    if not isinstance(A, MatrizEsparsa):
+        return ML.estimar_raio_espectral(A, "jacobi"), ML.estimar_raio_espectral(A, "seidel")
+    n = A.shape[0]
+    D = A.diagonal()
+    if np.any(np.abs(D) < ML.EPS):
+        return np.inf, np.inf
+    superior = A.colunas > A.linhas
+    U = MatrizEsparsa(A.linhas[superior], A.colunas[superior], A.valores[superior], A.shape)
+    L = MatrizEsparsa(A.linhas[A.colunas < A.linhas], A.colunas[A.colunas < A.linhas],
+                      A.valores[A.colunas < A.linhas], A.shape)
+
+    def seidel(v):
+        # (D + L) y = -U v, linha a linha
+        y = -U.produto(v)
+        for i in range(n):
+            colunas, valores = L.linha(i)
+            y[i] = (y[i] - np.dot(valores, y[colunas])) / D[i]
+        return y
+
+    jacobi = lambda v: -(A.produto(v) - D * v) / D
+    return ML._estimar_raio(jacobi, n), ML._estimar_raio(seidel, n)
+
+
+def diagnostico_espectral(A, tol=1e-6):
+    """Extremos do espectro, número de condição (razão dos módulos) e raios de Jacobi/Gauss-Seidel."""
+    A = _como_matriz(A)
+    simetrica = _eh_simetrica(A)
+    if simetrica:
+        (maior, _), _, _ = lanczos(A, 1, "maiores", tol=tol)
+        (menor, _), _, _ = lanczos(A, 1, "menores", tol=tol)
+        (proximo_zero, _), _, _ = inversa_deslocada(A, 0.0, tol=tol)
+        extremos = (float(menor[0]), float(maior[0]))
+    else:
+        (maior, _), _, _ = potencia(A, 2, tol=tol)
+        (proximo_zero, _), _, _ = inversa_deslocada(A, 0.0, tol=tol)
+        extremos = None
+    maior_modulo = float(np.abs(maior).max()) if not simetrica else max(abs(extremos[0]), abs(extremos[1]))
+    raio_jacobi, raio_gauss_seidel = _raios_iteracao(A)
+    return {
+        "simetrica": simetrica,
+        "extremos": extremos,
+        "maior_modulo": maior_modulo,
+        "menor_modulo": float(np.abs(proximo_zero[0])),
+        "condicao": maior_modulo / float(np.abs(proximo_zero[0])),
+        "raio_jacobi": raio_jacobi,
+        "raio_gauss_seidel": raio_gauss_seidel,
+    }
@@ -0,0 +1,71 @@
+# ===============================================================
+# Benchmark do tempo de inicialização da interface gráfica
+#
+# Mede, em processos Python novos, o tempo desde o início do processo
+# até a primeira pintura da janela de App (root.update() concluído),
+# comparando a inicialização preguiçosa atual com a importação
+# antecipada de numpy e dos módulos de métodos.
+#
+# Uso:
+#   python benchmark_inicializacao.py [repeticoes]
+#
+# Requer um display (X11, Windows ou macOS).
+# ===============================================================
+
+import statistics
+import subprocess
+import sys
+
+# O processo filho marca o tempo logo na primeira linha, antes de importar tkinter.
+CODIGO_FILHO = """
+import time
+inicio = time.perf_counter()
+{importacoes_antecipadas}
+import tkinter as tk
+from interface_gui import App
+try:
+    root = tk.Tk()
+except tk.TclError as e:
+    print("SEM_DISPLAY", e)
+    raise SystemExit(0)
+app = App(root)
+root.update_idletasks()
+root.update()
+print(time.perf_counter() - inicio)
+root.destroy()
+"""
+
+CENARIOS = {
+    "preguiçosa (atual)": "",
+    "antecipada (numpy + métodos)": "import numpy, metodos_lineares, metodos_raizes",
+}
+
+
+def medir(importacoes_antecipadas, repeticoes):
+    """Executa o processo filho várias vezes e retorna os tempos até a primeira pintura."""
+    codigo = CODIGO_FILHO.format(importacoes_antecipadas=importacoes_antecipadas)
+    tempos = []
+    for _ in range(repeticoes):
+        saida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True).stdout.strip()
+        if saida.startswith("SEM_DISPLAY"):
+            raise RuntimeError(f"Sem display disponível: {saida}")
+        tempos.append(float(saida.splitlines()[-1]))
+    return tempos
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"Tempo até a primeira pintura de App ({repeticoes} execuções por cenário)")
+    print("-----------------------------------------------------------")
+    for nome, importacoes in CENARIOS.items():
+        try:
+            tempos = medir(importacoes, repeticoes)
+        except RuntimeError as e:
+            print(e)
+            return 1
+        print(f"{nome:30s} mínimo {min(tempos) * 1000:8.1f} ms | mediana {statistics.median(tempos) * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+# ===============================================================
+# Interface de linha de comando (sem Tkinter) para os métodos lineares
+#
+# Uso:
+#   python -m cli_lineares --listar
+#   python -m cli_lineares -A A.txt -b b.txt -m "Fatoração LU"
+#   python -m cli_lineares --ab sistema.txt -m todos -o resultado.json
+#   python -m cli_lineares -A A.npy -b b.npy -m 1 -m 6 -o resultado.npz
+#   python -m cli_lineares --ab sistema.txt --armazenamento logs/resultados.sqlite3
+#
+# Arquivos .txt/.csv seguem o mesmo formato da interface gráfica
+# (números separados por espaço, uma linha da matriz por linha);
+# arquivos .npy são lidos diretamente. A saída é JSON (.json) ou
+# binária (.npz), escolhida pela extensão ou por --formato.
+#
+# Este módulo não importa interface_gui, para rodar em máquinas
+# sem interface gráfica.
+# ===============================================================
+
+import argparse
+import json
+import sys
+
+import numpy as np
+
+from metodos_lineares import METODOS
+
+
+# ---------------------------------------------------------------
+# Leitura dos dados
+# ---------------------------------------------------------------
+
+def carregar_matriz(caminho):
+    """Lê uma matriz de um arquivo .npy ou de texto (separado por espaços ou vírgulas)."""
+    if caminho.endswith(".npy"):
+        return np.load(caminho)
+    linhas = []
+    with open(caminho, "r", encoding="utf-8") as f:
+        for linha in f:
+            linha = linha.replace(",", " ").strip()
+            if linha == "":
+                continue
+            linhas.append([float(x) for x in linha.split()])
+    return np.array(linhas, dtype=float)
+
+
+def carregar_sistema(caminho_A=None, caminho_b=None, caminho_ab=None):
+    """Retorna (A, b) a partir de arquivos separados ou de um arquivo estendido (A|b)."""
+    if caminho_ab is not None:
+        M = carregar_matriz(caminho_ab)
+        if M.ndim != 2 or M.shape[1] < 2:
+            raise ValueError("Formato inválido para arquivo estendido (A|b).")
+        return M[:, :-1], M[:, -1].reshape(-1)
+    if caminho_A is None or caminho_b is None:
+        raise ValueError("Informe -A e -b, ou --ab.")
+    return carregar_matriz(caminho_A), carregar_matriz(caminho_b).reshape(-1)
+
+
+def resolver_nome_metodo(chave):
+    """Aceita o nome exato em METODOS ou o índice mostrado por --listar."""
+    nomes = list(METODOS.keys())
+    if chave in METODOS:
+        return chave
+    if chave.isdigit() and 1 <= int(chave) <= len(nomes):
+        return nomes[int(chave) - 1]
+    raise ValueError(f"Método '{chave}' não encontrado em METODOS (use --listar).")
+
+
+# ---------------------------------------------------------------
+# API de biblioteca
+# ---------------------------------------------------------------
+
+def _eh_sucesso(status):
+    # o método automático prefixa o status com "[Automático → ...] "
+    return status.split("] ", 1)[-1].startswith(("Sucesso", "Convergiu"))
+
+
+def resolver(A, b, metodo, armazem=None, **opcoes):
+    """Executa um método de METODOS e devolve um dicionário com solução e diagnósticos.
+
+    Com armazem (ArmazemResultados), problemas já resolvidos vêm do armazenamento.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float).reshape(-1)
+    do_armazenamento = False
+    if armazem is not None:
+        x, tempo, status, passos, do_armazenamento = armazem.resolver_linear(A, b, metodo, **opcoes)
+    else:
+        x, tempo, status, passos = METODOS[metodo](A, b, retornar_passos=True, **opcoes)
+    resultado = {
+        "metodo": metodo,
+        "status": status,
+        "tempo": tempo,
+        "sucesso": x is not None and _eh_sucesso(status),
+        "x": x,
+        "residuo": None,
+        "acoes": list(passos.get("acoes", [])) if passos else [],
+        "do_armazenamento": do_armazenamento,
+    }
+    if x is not None:
+        resultado["residuo"] = float(np.linalg.norm(A @ x - b, ord=np.inf))
+    return resultado
+
+
+def resolver_varios(A, b, metodos, armazem=None, **opcoes):
+    """Executa os métodos em sequência; métodos que falham não interrompem os demais."""
+    resultados = []
+    for metodo in metodos:
+        try:
+            resultados.append(resolver(A, b, metodo, armazem=armazem, **opcoes))
+        except Exception as e:
+            resultados.append({"metodo": metodo, "status": f"ERRO: {e}", "tempo": 0.0,
+                               "sucesso": False, "x": None, "residuo": None, "acoes": [],
+                               "do_armazenamento": False})
+    return resultados
+
+
+# ---------------------------------------------------------------
+# Gravação dos resultados
+# ---------------------------------------------------------------
+
+def _para_json(resultado):
+    saida = dict(resultado)
+    saida["x"] = None if resultado["x"] is None else np.asarray(resultado["x"]).tolist()
+    return saida
+
+
+def salvar_resultados(resultados, caminho, formato=None):
+    """Grava em JSON ou em .npz (x_0, x_1, ... e os diagnósticos em JSON)."""
+    if formato is None:
+        formato = "npz" if caminho.endswith(".npz") else "json"
+    if formato == "json":
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump({"resultados": [_para_json(r) for r in resultados]}, f, ensure_ascii=False, indent=2)
+    elif formato == "npz":
+        arrays = {f"x_{i}": (r["x"] if r["x"] is not None else np.array([]))
+                  for i, r in enumerate(resultados)}
+        diagnosticos = [{k: v for k, v in r.items() if k != "x"} for r in resultados]
+        np.savez(caminho, diagnosticos=np.array(json.dumps(diagnosticos, ensure_ascii=False)), **arrays)
+    else:
+        raise ValueError(f"Formato de saída desconhecido: {formato}")
+
+
+# ---------------------------------------------------------------
+# Função principal (main)
+# ---------------------------------------------------------------
+
+def _criar_parser():
+    parser = argparse.ArgumentParser(prog="cli_lineares", description="Resolve sistemas lineares Ax = b sem interface gráfica.")
+    parser.add_argument("-A", dest="caminho_A", help="arquivo com a matriz A (.txt, .csv ou .npy)")
+    parser.add_argument("-b", dest="caminho_b", help="arquivo com o vetor b (.txt, .csv ou .npy)")
+    parser.add_argument("--ab", dest="caminho_ab", help="arquivo estendido (A|b)")
+    parser.add_argument("-m", "--metodo", action="append", default=None,
+                        help="nome em METODOS, índice de --listar ou 'todos' (pode repetir)")
+    parser.add_argument("--tol", type=float, default=1e-8, help="tolerância dos métodos iterativos")
+    parser.add_argument("--max-iter", type=int, default=1000, help="máximo de iterações dos métodos iterativos")
+    parser.add_argument("--x0", help="chute inicial separado por vírgula")
+    parser.add_argument("--precisao", choices=["float64", "mista"], default="float64")
+    parser.add_argument("-o", "--saida", help="arquivo de saída (.json ou .npz)")
+    parser.add_argument("--formato", choices=["json", "npz"])
+    parser.add_argument("--armazenamento", metavar="ARQUIVO",
+                        help="banco SQLite de resultados; problemas repetidos não são recalculados")
+    parser.add_argument("--listar", action="store_true", help="lista os métodos disponíveis e sai")
+    return parser
+
+
+def main(argv=None):
+    parser = _criar_parser()
+    args = parser.parse_args(argv)
+
+    if args.listar:
+        for i, nome in enumerate(METODOS, start=1):
+            print(f"{i:2d}. {nome}")
+        return 0
+
+    try:
+        A, b = carregar_sistema(args.caminho_A, args.caminho_b, args.caminho_ab)
+        chaves = args.metodo or ["Automático (análise da matriz)"]
+        if "todos" in chaves:
+            metodos = list(METODOS.keys())
+        else:
+            metodos = [resolver_nome_metodo(c) for c in chaves]
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 2
+
+    opcoes = {"tol": args.tol, "max_iter": args.max_iter, "precisao": args.precisao}
+    if args.x0:
+        opcoes["x0"] = np.array([float(v) for v in args.x0.split(",") if v.strip() != ""])
+
+    armazem = None
+    if args.armazenamento:
+        from armazenamento_resultados import ArmazemResultados
+        armazem = ArmazemResultados(args.armazenamento)
+
+    resultados = resolver_varios(A, b, metodos, armazem=armazem, **opcoes)
+    for r in resultados:
+        residuo = "-" if r["residuo"] is None else f"{r['residuo']:.3e}"
+        origem = ", do armazenamento" if r["do_armazenamento"] else ""
+        print(f"{r['metodo']}: {r['status']} (tempo {r['tempo']:.6f} s, resíduo {residuo}{origem})")
+
+    if args.saida:
+        salvar_resultados(resultados, args.saida, args.formato)
+        print(f"Resultados salvos em {args.saida}")
+    elif len(resultados) == 1 and resultados[0]["x"] is not None:
+        print(json.dumps(np.asarray(resultados[0]["x"]).tolist()))
+
+    return 0 if all(r["sucesso"] for r in resultados) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+# ===============================================================
+# Comparação de todos os métodos em paralelo (pool de processos)
+#
+# A e b são copiados uma única vez para memória compartilhada
+# (multiprocessing.shared_memory); cada processo do pool apenas se
+# anexa ao bloco, sem receber a matriz por pickle. O tempo total
+# tende ao do método mais lento.
+# ===============================================================
+
+import io
+import os
+import re
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import metodos_lineares as ML
+import metodos_raizes as MR
+
+# "spawn": a comparação é disparada de uma thread da interface (Tk + pré-carga);
+# fork de um processo com várias threads pode travar os filhos
+CONTEXTO_PROCESSOS = multiprocessing.get_context("spawn")
+
+# Estado de cada processo do pool (preenchido pelo inicializador)
+_memoria = None
+_A = None
+_b = None
+
+
+# ---------------------------------------------------------------
+# Funções executadas nos processos do pool
+# ---------------------------------------------------------------
+
+def _anexar_memoria(nome, n):
+    """Inicializador do pool: anexa o bloco compartilhado e monta as vistas de A e b."""
+    global _memoria, _A, _b
+    try:
+        _memoria = shared_memory.SharedMemory(name=nome, track=False)
+    except TypeError:
+        # Python < 3.13 registra o bloco também ao anexar; como os processos do
+        # pool compartilham o resource_tracker do processo principal, o registro
+        # duplicado é inofensivo e quem remove o bloco continua sendo o principal
+        _memoria = shared_memory.SharedMemory(name=nome)
+    dados = np.ndarray((n * n + n,), dtype=float, buffer=_memoria.buf)
+    _A = dados[:n * n].reshape(n, n)
+    _b = dados[n * n:]
+
+
+def _extrair_iteracoes(status):
+    correspondencia = re.search(r"(\d+) iterações", status)
+    return int(correspondencia.group(1)) if correspondencia else None
+
+
+def _executar_linear(nome, opcoes):
+    """Roda um método de METODOS sobre as vistas compartilhadas de A e b."""
+    inicio = time.perf_counter()
+    try:
+        x, tempo, status = ML.METODOS[nome](_A, _b, **opcoes)[:3]
+    except Exception as e:
+        x, tempo, status = None, time.perf_counter() - inicio, f"ERRO: {e}"
+    residuo = None if x is None else float(np.linalg.norm(_A @ x - _b, ord=np.inf))
+    return {
+        "metodo": nome,
+        "tempo": tempo,
+        "residuo": residuo,
+        "iteracoes": _extrair_iteracoes(status),
+        "status": status,
+        "x": x,
+    }
+
+
+def _executar_raiz(nome, dados):
+    """Roda um método de metodos_raizes e extrai a última linha da tabela de iterações."""
+    saida = io.StringIO()
+    inicio = time.perf_counter()
+    try:
+        MR.METODOS[nome](dados, saida)
+        status = "Concluído"
+    except Exception as e:
+        status = f"ERRO: {e}"
+    tempo = time.perf_counter() - inicio
+
+    texto = saida.getvalue()
+    linhas = re.findall(r"^\s*(\d+) \|\s*(\S+) \|\s*(\S+) \|\s*(\S+)$", texto, flags=re.MULTILINE)
+    resultado = {"metodo": nome, "tempo": tempo, "iteracoes": None, "raiz": None,
+                 "residuo": None, "status": status}
+    if linhas:
+        iteracao, xk, fxk, _ = linhas[-1]
+        resultado.update(iteracoes=int(iteracao), raiz=float(xk), residuo=abs(float(fxk)))
+    for aviso in ("ATENÇÃO", "Aviso", "Intervalo inválido", "Encerrando"):
+        if aviso in texto:
+            resultado["status"] = next(l.strip() for l in texto.splitlines() if aviso in l)
+            break
+    return resultado
+
+
+# ---------------------------------------------------------------
+# API
+# ---------------------------------------------------------------
+
+def comparar_metodos_lineares(A, b, metodos=None, processos=None, **opcoes):
+    """Executa os métodos lineares em paralelo e retorna (resultados, tempo_total).
+
+    opcoes (tol, max_iter, x0, ...) são repassadas a todos os métodos;
+    os diretos ignoram as que não usam.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float).reshape(-1)
+    n = b.shape[0]
+    if A.shape != (n, n):
+        raise ValueError("A deve ser quadrada e compatível com b.")
+    metodos = list(ML.METODOS.keys()) if metodos is None else list(metodos)
+    processos = processos or min(len(metodos), os.cpu_count() or 1)
+
+    inicio = time.perf_counter()
+    memoria = shared_memory.SharedMemory(create=True, size=max((n * n + n) * 8, 1))
+    try:
+        dados = np.ndarray((n * n + n,), dtype=float, buffer=memoria.buf)
+        dados[:n * n] = A.ravel()
+        dados[n * n:] = b
+        with ProcessPoolExecutor(max_workers=processos, mp_context=CONTEXTO_PROCESSOS, initializer=_anexar_memoria,
+                                 initargs=(memoria.name, n)) as pool:
+            futuros = [pool.submit(_executar_linear, nome, opcoes) for nome in metodos]
+            resultados = [futuro.result() for futuro in futuros]
+        del dados
+    finally:
+        memoria.close()
+        memoria.unlink()
+    return resultados, time.perf_counter() - inicio
+
+
+def comparar_metodos_raizes(dados, metodos=None, processos=None):
+    """Executa os métodos de raízes em paralelo com os mesmos DadosEntrada."""
+    metodos = list(MR.METODOS.keys()) if metodos is None else list(metodos)
+    processos = processos or min(len(metodos), os.cpu_count() or 1)
+    inicio = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=processos, mp_context=CONTEXTO_PROCESSOS) as pool:
+        futuros = [pool.submit(_executar_raiz, nome, dados) for nome in metodos]
+        resultados = [futuro.result() for futuro in futuros]
+    return resultados, time.perf_counter() - inicio
+
+
+def formatar_tabela(resultados, tempo_total=None):
+    """Monta a tabela de comparação em texto (tempo, resíduo, iterações e status)."""
+    largura = max([len(r["metodo"]) for r in resultados] + [6])
+    linhas = [f"{'Método':<{largura}} | {'Tempo (s)':>10} | {'Resíduo':>10} | {'Iter.':>6} | Status",
+              "-" * (largura + 50)]
+    for r in resultados:
+        residuo = "-" if r["residuo"] is None else f"{r['residuo']:.3e}"
+        iteracoes = "-" if r["iteracoes"] is None else str(r["iteracoes"])
+        linhas.append(f"{r['metodo']:<{largura}} | {r['tempo']:10.6f} | {residuo:>10} | {iteracoes:>6} | {r['status']}")
+    if tempo_total is not None:
+        soma = sum(r["tempo"] for r in resultados)
+        linhas.append("")
+        linhas.append(f"Tempo total (paralelo): {tempo_total:.6f} s | soma dos tempos individuais: {soma:.6f} s")
+    return "\n".join(linhas)
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    n = 200
+    A_exemplo = rng.standard_normal((n, n)) + n * np.eye(n)
+    b_exemplo = rng.standard_normal(n)
+    print(formatar_tabela(*comparar_metodos_lineares(A_exemplo, b_exemplo, tol=1e-10, max_iter=1000)))
@@ -0,0 +1,219 @@
+# ===============================================================
+# LU e Cholesky fora da memória (matriz em disco, .npy mapeado)
+#
+# Para sistemas que não cabem na RAM: A fica num arquivo .npy aberto
+# com np.memmap e os fatores são gravados num segundo arquivo .npy
+# (a cópia de trabalho). A fatoração é "left-looking" por blocos de
+# colunas: só o bloco-coluna atual (n x b) e alguns blocos b x b lidos
+# à frente ficam na memória, e cada bloco-coluna é gravado uma única
+# vez. Uma thread de E/S lê os próximos blocos (e grava o bloco-coluna
+# anterior) enquanto o processo principal calcula com o atual.
+#
+# LU: pivoteamento parcial lógico — as trocas de linhas só alteram o
+# vetor perm (linha lógica r está na linha física perm[r]); nada é
+# movido no disco. Ao final, A[perm] = L U, com L e U no arquivo de
+# fatores nas linhas físicas. perm é salvo em <fatores>.perm.npy.
+# Cholesky: L no triângulo inferior do arquivo de fatores.
+#
+# Memória usada: cerca de (n/b + antecipacao + 2) blocos b x b.
+# ===============================================================
+
+import os
+import shutil
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import metodos_lineares as ML
+
+TAMANHO_BLOCO_DISCO = 1024
+ANTECIPACAO = 2  # blocos lidos à frente pela thread de E/S
+
+
+# ---------------------------------------------------------------
+# Arquivos e E/S
+# ---------------------------------------------------------------
+
+def abrir_matriz(caminho, modo="r"):
+    """Abre um .npy como memmap (sem carregar na memória)."""
+    return np.load(caminho, mmap_mode=modo)
+
+
+def criar_matriz(caminho, n):
+    """Cria um .npy n x n (float64) em disco, para ser preenchido por partes."""
+    return np.lib.format.open_memmap(caminho, mode="w+", dtype=float, shape=(n, n))
+
+
+def _caminho_perm(caminho_fatores):
+    return os.path.splitext(caminho_fatores)[0] + ".perm.npy"
+
+
+def _preparar_copia(caminho_A, caminho_fatores):
+    """Copia A para o arquivo de fatores (a fatoração é feita no lugar, na cópia)."""
+    A = abrir_matriz(caminho_A)
+    if A.ndim != 2 or A.shape[0] != A.shape[1] or A.dtype != np.float64:
+        raise ValueError("A deve ser uma matriz quadrada float64 salva em .npy.")
+    del A
+    shutil.copyfile(caminho_A, caminho_fatores)
+    return abrir_matriz(caminho_fatores, "r+")
+
+
+def _antecipar(es, leituras, profundidade):
+    """Executa as leituras (funções sem argumento) na thread de E/S, até `profundidade` à frente, e as devolve em ordem."""
+    pendentes = deque()
+    leituras = iter(leituras)
+    for leitura in leituras:
+        pendentes.append(es.submit(leitura))
+        if len(pendentes) >= profundidade:
+            break
+    while pendentes:
+        futuro = pendentes.popleft()
+        proxima = next(leituras, None)
+        if proxima is not None:
+            pendentes.append(es.submit(proxima))
+        yield futuro.result()
+
+
+def _fatias(n, tamanho_bloco):
+    return [slice(i, min(i + tamanho_bloco, n)) for i in range(0, n, tamanho_bloco)]
+
+
+def _triangular_inferior_unitaria(T):
+    return np.tril(T, -1) + np.eye(T.shape[0])
+
+
+# ---------------------------------------------------------------
+# Fatorações
+# ---------------------------------------------------------------
+
+def lu_fora_memoria(caminho_A, caminho_fatores, tamanho_bloco=TAMANHO_BLOCO_DISCO, antecipacao=ANTECIPACAO):
+    """LU com pivoteamento parcial, bloco-coluna a bloco-coluna. Retorna perm (A[perm] = L U)."""
+    W = _preparar_copia(caminho_A, caminho_fatores)
+    n = W.shape[0]
+    fatias = _fatias(n, tamanho_bloco)
+    perm = np.arange(n)
+
+    with ThreadPoolExecutor(max_workers=1) as es:
+        for j, J in enumerate(fatias):
+            linhas = perm.copy()
+            C = es.submit(lambda J=J, linhas=linhas: np.array(W[linhas, J])).result()
+
+            # atualizações com os blocos-coluna já fatorados (k < j): lidos à frente pela thread de E/S
+            leituras = []
+            for k in range(j):
+                K = fatias[k]
+                leituras += [lambda I=I, K=K: np.array(W[linhas[I], K]) for I in fatias[k:]]
+            blocos = _antecipar(es, leituras, antecipacao)
+            for k in range(j):
+                K = fatias[k]
+                Lkk = next(blocos)
+                C[K] = np.linalg.solve(_triangular_inferior_unitaria(Lkk), C[K])
+                for I in fatias[k + 1:]:
+                    C[I] -= next(blocos) @ C[K]
+
+            trocas = ML._fatorar_painel(C[J.start:], J.start)
+            for a, b in trocas:
+                perm[[a, b]] = perm[[b, a]]
+            # gravação assíncrona; a fila única de E/S garante que as próximas leituras a vejam
+            es.submit(lambda J=J, C=C, linhas=perm.copy(): W.__setitem__((linhas, J), C))
+    W.flush()
+    np.save(_caminho_perm(caminho_fatores), perm)
+    return perm
+
+
+def cholesky_fora_memoria(caminho_A, caminho_fatores, tamanho_bloco=TAMANHO_BLOCO_DISCO, antecipacao=ANTECIPACAO):
+    """Cholesky (L no triângulo inferior do arquivo de fatores), bloco-coluna a bloco-coluna."""
+    W = _preparar_copia(caminho_A, caminho_fatores)
+    n = W.shape[0]
+    fatias = _fatias(n, tamanho_bloco)
+
+    with ThreadPoolExecutor(max_workers=1) as es:
+        for j, J in enumerate(fatias):
+            C = es.submit(lambda J=J: np.array(W[J.start:, J])).result()
+
+            leituras = []
+            for k in range(j):
+                K = fatias[k]
+                leituras += [lambda I=I, K=K: np.array(W[I, K]) for I in fatias[j:]]
+            blocos = _antecipar(es, leituras, antecipacao)
+            for k in range(j):
+                LJK = next(blocos)
+                C[:J.stop - J.start] -= LJK @ LJK.T
+                for I in fatias[j + 1:]:
+                    C[I.start - J.start:I.stop - J.start] -= next(blocos) @ LJK.T
+
+            b = J.stop - J.start
+            Ljj = np.linalg.cholesky(C[:b])  # LinAlgError se A não for definida positiva
+            C[:b] = Ljj
+            C[b:] = np.linalg.solve(Ljj, C[b:].T).T
+            es.submit(lambda J=J, C=C: W.__setitem__((slice(J.start, None), J), C))
+    W.flush()
+
+
+# ---------------------------------------------------------------
+# Solução com os fatores em disco
+# ---------------------------------------------------------------
+
+def resolver_fora_memoria(caminho_fatores, b, tipo="lu", tamanho_bloco=TAMANHO_BLOCO_DISCO, antecipacao=ANTECIPACAO):
+    """Substituições progressiva e regressiva lendo os fatores por blocos de linhas/colunas."""
+    W = abrir_matriz(caminho_fatores)
+    n = W.shape[0]
+    fatias = _fatias(n, tamanho_bloco)
+    b = np.asarray(b, dtype=float).reshape(-1)
+    perm = np.load(_caminho_perm(caminho_fatores)) if tipo == "lu" else np.arange(n)
+
+    with ThreadPoolExecutor(max_workers=1) as es:
+        # L y = P b, por blocos de linhas
+        y = b[perm].copy()
+        paineis = _antecipar(es, [lambda I=I: np.array(W[perm[I], :I.stop]) for I in fatias], antecipacao)
+        for I in fatias:
+            R = next(paineis)
+            diagonal = R[:, I.start:]
+            diagonal = _triangular_inferior_unitaria(diagonal) if tipo == "lu" else np.tril(diagonal)
+            y[I] = np.linalg.solve(diagonal, y[I] - R[:, :I.start] @ y[:I.start])
+
+        x = y
+        if tipo == "lu":
+            # U x = y, por blocos de linhas de baixo para cima
+            paineis = _antecipar(es, [lambda I=I: np.array(W[perm[I], I.start:]) for I in reversed(fatias)], antecipacao)
+            for I in reversed(fatias):
+                R = next(paineis)
+                w = I.stop - I.start
+                x[I] = np.linalg.solve(np.triu(R[:, :w]), x[I] - R[:, w:] @ x[I.stop:])
+        else:
+            # L^T x = y, lendo os blocos-coluna de L
+            paineis = _antecipar(es, [lambda I=I: np.array(W[I.start:, I]) for I in reversed(fatias)], antecipacao)
+            for I in reversed(fatias):
+                P = next(paineis)
+                w = I.stop - I.start
+                x[I] = np.linalg.solve(np.tril(P[:w]).T, x[I] - P[w:].T @ x[I.stop:])
+    return x
+
+
+def resolver_sistema_fora_memoria(caminho_A, b, tipo="lu", caminho_fatores=None, tamanho_bloco=TAMANHO_BLOCO_DISCO,
+                                  antecipacao=ANTECIPACAO, retornar_passos=False):
+    """Fatora A (em disco) e resolve A x = b. Retorno no padrão de metodos_lineares."""
+    inicio = time.time()
+    passos = {"acoes": []}
+    caminho_fatores = caminho_fatores or os.path.splitext(caminho_A)[0] + f".{tipo}.npy"
+    nome = "LU com pivoteamento parcial" if tipo == "lu" else "Cholesky"
+
+    try:
+        if tipo == "lu":
+            lu_fora_memoria(caminho_A, caminho_fatores, tamanho_bloco, antecipacao)
+        elif tipo == "cholesky":
+            cholesky_fora_memoria(caminho_A, caminho_fatores, tamanho_bloco, antecipacao)
+        else:
+            raise ValueError(f"Tipo de fatoração desconhecido: {tipo}")
+    except np.linalg.LinAlgError as e:
+        status = (f"ERRO: {e} Matriz singular." if tipo == "lu"
+                  else "ERRO: Cholesky não aplicável — matriz não é definida positiva.")
+        return ML._empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+    passos["acoes"].append(f"Fatores gravados em {caminho_fatores} ({time.time() - inicio:.3f} s)")
+
+    x = resolver_fora_memoria(caminho_fatores, b, tipo, tamanho_bloco, antecipacao)
+    tempo = time.time() - inicio
+    status = f"Sucesso ({nome} fora da memória, blocos de {tamanho_bloco})."
+    return ML._empacotar_retorno(x, tempo, status, passos, retornar_passos)
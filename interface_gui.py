@@ -1,12 +1,61 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import numpy as np
 import os
-import io
 import datetime
+import importlib
+import threading
 
-from metodos_lineares import METODOS as METODOS_LIN
-import metodos_raizes as MR  # funções: bissecao, newton, secante, etc.
+
+# ---------------- importação preguiçosa ----------------
+# numpy e os módulos de métodos só são importados no primeiro uso (ou em
+# segundo plano depois que a janela aparece), para a janela abrir rápido.
+class _ModuloPreguicoso:
+    """Importa o módulo apenas no primeiro acesso a um atributo."""
+
+    def __init__(self, nome):
+        self._nome = nome
+        self._modulo = None
+
+    def carregar(self):
+        if self._modulo is None:
+            self._modulo = importlib.import_module(self._nome)
+        return self._modulo
+
+    def __getattr__(self, atributo):
+        return getattr(self.carregar(), atributo)
+
+
+np = _ModuloPreguicoso("numpy")
+ML = _ModuloPreguicoso("metodos_lineares")
+MR = _ModuloPreguicoso("metodos_raizes")  # METODOS: nome -> metodo_bissecao, metodo_newton_raphson, etc.
+CM = _ModuloPreguicoso("comparacao_metodos")
+AR = _ModuloPreguicoso("armazenamento_resultados")
+RL = _ModuloPreguicoso("registro_logs")
+AP = _ModuloPreguicoso("atualizacao_posto_baixo")
+
+# Mesma ordem de metodos_raizes.METODOS (o índice + 1 é o código do arquivo de entrada)
+NOMES_METODOS_RAIZES = ["Bisseção", "Ponto Fixo", "Newton-Raphson", "Secante", "Regula Falsi",
+                        "Ponto Fixo (Aitken)", "Ponto Fixo (Steffensen)", "Ponto Fixo (Anderson)"]
+
+# Métodos cuja fatoração é guardada e atualizada (posto baixo) quando A é editada.
+# FatoracaoAtualizavel("lu") pivoteia, então só serve ao pivoteamento parcial
+# ("Fatoração LU" não pivoteia e deve falhar onde ele falha).
+FATORACOES_ATUALIZAVEIS = {
+    "Gauss com pivoteamento parcial": "lu",
+    "Fatoração de Cholesky": "cholesky",
+}
+
+# Único método de METODOS que aceita A retangular (m x n, m > n)
+METODO_RETANGULAR = "Mínimos quadrados (QR de Householder)"
+
+# Quantos logs resultado_*.txt manter em logs/ (os mais antigos são apagados)
+MAX_LOGS = 200
+
+
+def precarregar_modulos():
+    """Importa numpy e os módulos de métodos (chamada em uma thread de fundo)."""
+    for modulo in (np, ML, MR):
+        modulo.carregar()
 
 
 # ---------------- utilitários ----------------
@@ -26,6 +75,9 @@ class App:
         self.root.minsize(880, 650)
         self.A = None
         self.b = None
+        self._armazem = None
+        self._gravador = None
+        self._fatoracoes = {}  # tipo ("lu"/"cholesky") -> FatoracaoAtualizavel da última A
 
         ensure_logs_dir()
         self._setup_style()
@@ -111,6 +163,34 @@ class App:
         # Monta UI dentro do frame rolável (chamada única e correta)
         self._build_ui()
 
+        # importa numpy e os métodos em segundo plano depois que a janela é desenhada
+        self._modulos_prontos = threading.Event()
+        self.root.after_idle(self._iniciar_precarga)
+
+    # ---------------- pré-carga dos módulos ----------------
+    def _iniciar_precarga(self):
+        def _tarefa():
+            try:
+                precarregar_modulos()
+            finally:
+                self._modulos_prontos.set()
+        threading.Thread(target=_tarefa, daemon=True).start()
+        self.root.after(50, self._verificar_precarga)
+
+    def _verificar_precarga(self):
+        # Tk não é thread-safe: a thread só importa; a atualização da UI acontece aqui
+        if not self._modulos_prontos.is_set():
+            self.root.after(50, self._verificar_precarga)
+            return
+        self._atualizar_lista_metodos()
+
+    def _atualizar_lista_metodos(self):
+        nomes = list(ML.METODOS.keys())
+        self.metodo_combo.configure(values=nomes)
+        if self.metodo_selecionado.get() == "" and nomes:
+            self.metodo_selecionado.set(nomes[0])
+            self._on_metodo_change()
+
     # ---------------- estilo ----------------
     def _setup_style(self):
         style = ttk.Style()
@@ -166,7 +246,7 @@ class App:
         # ======== Barra de ações ========
         btn_frame = ttk.Frame(main)
         btn_frame.pack(fill="x", pady=8)
-        for i in range(5):
+        for i in range(6):
             btn_frame.columnconfigure(i, weight=1)
 
         ttk.Button(btn_frame, text="Resolver Método Linear", command=self.resolver_linear).grid(row=0, column=0, padx=6, sticky="ew")
@@ -174,6 +254,8 @@ class App:
         ttk.Button(btn_frame, text="Limpar Campos", command=self.limpar).grid(row=0, column=2, padx=6, sticky="ew")
         ttk.Button(btn_frame, text="Limpar Saída", command=self.limpar_saida).grid(row=0, column=3, padx=6, sticky="ew")
         ttk.Button(btn_frame, text="Salvar Resultado (.txt)", command=self.salvar_resultado).grid(row=0, column=4, padx=6, sticky="ew")
+        self.btn_comparar = ttk.Button(btn_frame, text="Comparar Todos (Lineares)", command=self.comparar_lineares)
+        self.btn_comparar.grid(row=0, column=5, padx=6, sticky="ew")
 
         # ======== Área de resultados ========
         self.result_nb = ttk.Notebook(main)
@@ -243,12 +325,14 @@ class App:
 
     def _build_linear_section(self, frame):
         ttk.Label(frame, text="Escolha o método:").pack(anchor="w")
-        # evita erro caso METODOS_LIN esteja vazio
-        default_method = list(METODOS_LIN.keys())[0] if len(METODOS_LIN) > 0 else ""
-        self.metodo_selecionado = tk.StringVar(value=default_method)
-        metodo_combo = ttk.Combobox(frame, textvariable=self.metodo_selecionado, values=list(METODOS_LIN.keys()), state="readonly")
+        # a lista de métodos é preenchida quando metodos_lineares termina de carregar
+        # (ou ao abrir a lista, se o usuário for mais rápido que a pré-carga)
+        self.metodo_selecionado = tk.StringVar(value="")
+        metodo_combo = ttk.Combobox(frame, textvariable=self.metodo_selecionado, values=[], state="readonly",
+                                    postcommand=self._atualizar_lista_metodos)
         metodo_combo.pack(fill="x", pady=6)
         metodo_combo.bind("<<ComboboxSelected>>", lambda e: self._on_metodo_change())
+        self.metodo_combo = metodo_combo
 
         self.options_frame = ttk.Frame(frame)
         self.options_frame.pack(fill="x", pady=4)
@@ -274,8 +358,7 @@ class App:
         row.pack(fill="x")
         ttk.Label(row, text="Método:").pack(side="left")
         self.root_method_var = tk.StringVar(value="Bisseção")
-        root_methods = ["Bisseção", "Ponto Fixo", "Newton-Raphson", "Secante", "Regula Falsi"]
-        root_combo = ttk.Combobox(row, textvariable=self.root_method_var, values=root_methods, state="readonly")
+        root_combo = ttk.Combobox(row, textvariable=self.root_method_var, values=NOMES_METODOS_RAIZES, state="readonly")
         root_combo.pack(side="left", padx=8)
         root_combo.bind("<<ComboboxSelected>>", lambda e: self._on_metodo_change())
 
@@ -317,6 +400,10 @@ class App:
         self.cb_LU = ttk.Checkbutton(self.options_frame, text="Exibir L e U (quando aplicável)", variable=self.var_show_LU)
         self.var_show_permutation = tk.BooleanVar(value=False)
         self.cb_perm = ttk.Checkbutton(self.options_frame, text="Exibir permutações (pivoteamento)", variable=self.var_show_permutation)
+        self.var_diagnostics = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.options_frame, text="Calcular resíduo e número de condição κ₁(A) (métodos diretos)", variable=self.var_diagnostics).pack(anchor="w", padx=6, pady=2)
+        self.var_mixed_precision = tk.BooleanVar(value=False)
+        self.cb_mixed = ttk.Checkbutton(self.options_frame, text="Precisão mista (float32 + refinamento)", variable=self.var_mixed_precision)
         self._on_metodo_change()
 
     def _on_metodo_change(self):
@@ -324,6 +411,7 @@ class App:
         try:
             self.cb_LU.pack_forget()
             self.cb_perm.pack_forget()
+            self.cb_mixed.pack_forget()
         except Exception:
             pass
         if "lu" in metodo or "fatoração lu" in metodo or "fatoracao lu" in metodo:
@@ -336,6 +424,11 @@ class App:
                 self.cb_perm.pack(anchor="w", padx=6, pady=2)
             except Exception:
                 pass
+        if "lu" in metodo or "parcial" in metodo:
+            try:
+                self.cb_mixed.pack(anchor="w", padx=6, pady=2)
+            except Exception:
+                pass
 
     # ---------------- parsing / loading ----------------
     def parse_text_matrix(self, txt):
@@ -346,6 +439,26 @@ class App:
             mat.append([float(x) for x in parts])
         return np.array(mat, dtype=float)
 
+    def _detectar_banda(self):
+        """Informa a largura de banda de A e sugere o solver em banda quando compensa.
+
+        Com A retangular (mais equações que incógnitas), pré-seleciona mínimos quadrados.
+        """
+        if self.A is not None and self.A.ndim == 2 and self.A.shape[0] > self.A.shape[1]:
+            self.metodo_selecionado.set(METODO_RETANGULAR)
+            self._on_metodo_change()
+            self.texto_resultado.insert(tk.END, f"A retangular {self.A.shape} → método '{METODO_RETANGULAR}' selecionado.\n")
+            return
+        if self.A is None or self.A.ndim != 2 or self.A.shape[0] != self.A.shape[1]:
+            return
+        p, q = ML.largura_banda(self.A)
+        texto = self.lbl_status.cget("text")
+        self.lbl_status.config(text=f"{texto} — banda: inferior {p}, superior {q}")
+        sugerido = ML.metodo_para_banda(self.A)
+        if sugerido is not None and sugerido in ML.METODOS and sugerido != self.metodo_selecionado.get():
+            # só sugere: a escolha do usuário na lista é mantida
+            self.texto_resultado.insert(tk.END, f"Matriz em banda detectada → sugestão: método '{sugerido}'.\n")
+
     def load_ab_file(self):
         path = filedialog.askopenfilename(title="Selecionar arquivo A|b", filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
         if not path:
@@ -367,6 +480,7 @@ class App:
             self.b = mat[:, -1].reshape(-1)
             self.lbl_status.config(text=f"Carregado A|b de: {os.path.basename(path)} (A: {self.A.shape}, b: {self.b.shape})")
             self.texto_resultado.insert(tk.END, f"Arquivo '{os.path.basename(path)}' carregado como A|b.\n")
+            self._detectar_banda()
         except Exception as e:
             messagebox.showerror("Erro", f"Falha ao carregar arquivo: {e}")
 
@@ -384,12 +498,13 @@ class App:
                     parts = line.split()
                     mat.append([float(x) for x in parts])
             mat = np.array(mat, dtype=float)
-            if mat.ndim != 2 or mat.shape[0] != mat.shape[1]:
-                messagebox.showerror("Erro", "Formato inválido para matriz A. Deve ser quadrada.")
+            if mat.ndim != 2 or mat.shape[0] < mat.shape[1]:
+                messagebox.showerror("Erro", "Formato inválido para matriz A. Deve ser quadrada ou ter mais linhas que colunas.")
                 return
             self.A = mat
             self.lbl_status.config(text=f"Carregado A de: {os.path.basename(path)} (A: {self.A.shape})")
             self.texto_resultado.insert(tk.END, f"Arquivo '{os.path.basename(path)}' carregado como A.\n")
+            self._detectar_banda()
         except Exception as e:
             messagebox.showerror("Erro", f"Falha ao carregar arquivo A: {e}")
 
@@ -431,8 +546,9 @@ class App:
                     self.A = A[:, :-1]
                     self.b = A[:, -1].reshape(-1)
                 else:
-                    if A.shape[0] != A.shape[1]:
-                        messagebox.showerror("Erro", "Se estiver carregando apenas A pelo texto, A deve ser quadrada (n x n).")
+                    if A.shape[0] < A.shape[1]:
+                        messagebox.showerror("Erro", "Se estiver carregando apenas A pelo texto, A deve ser quadrada (n x n) "
+                                                     "ou ter mais linhas que colunas (m x n, m > n).")
                         return
                     self.A = A
 
@@ -445,6 +561,7 @@ class App:
 
             self.lbl_status.config(text=f"Carregado A e/ou b do texto (A: {self.A.shape if self.A is not None else None}, b: {self.b.shape if self.b is not None else None})")
             self.texto_resultado.insert(tk.END, "Dados carregados do texto.\n")
+            self._detectar_banda()
         except Exception as e:
             messagebox.showerror("Erro", f"Falha ao carregar do texto: {e}")
 
@@ -466,7 +583,7 @@ class App:
                 tol = tokens[5]
                 maxit = tokens[6]
 
-                self.root_method_var.set(["Bisseção", "Ponto Fixo", "Newton-Raphson", "Secante", "Regula Falsi"][metodo-1])
+                self.root_method_var.set(NOMES_METODOS_RAIZES[metodo-1])
                 self.root_a.delete(0, tk.END)
                 self.root_a.insert(0, a)
                 self.root_b.delete(0, tk.END)
@@ -493,18 +610,35 @@ class App:
             return
 
         metodo_nome = self.metodo_selecionado.get()
-        if metodo_nome not in METODOS_LIN:
+        if self.A.shape[0] != self.A.shape[1] and metodo_nome not in (METODO_RETANGULAR, "Automático (análise da matriz)"):
+            self.texto_resultado.insert(tk.END, f"A retangular {self.A.shape}: '{metodo_nome}' exige A quadrada; "
+                                                f"usando '{METODO_RETANGULAR}'.\n\n")
+            metodo_nome = METODO_RETANGULAR
+        if metodo_nome not in ML.METODOS:
             messagebox.showerror("Erro", f"Método '{metodo_nome}' não encontrado em METODOS.")
             return
-        metodo_func = METODOS_LIN[metodo_nome]
+        metodo_func = ML.METODOS[metodo_nome]
+        do_armazenamento = False
 
         show_steps = self.var_show_steps.get() if hasattr(self, "var_show_steps") else False
         show_matrices = self.var_show_matrices.get() if hasattr(self, "var_show_matrices") else False
         show_LU = self.var_show_LU.get() if hasattr(self, "var_show_LU") else False
         show_perm = self.var_show_permutation.get() if hasattr(self, "var_show_permutation") else False
+        mixed = self.var_mixed_precision.get() if hasattr(self, "var_mixed_precision") else False
+        diagnostics = self.var_diagnostics.get() if hasattr(self, "var_diagnostics") else False
+
+        # A editada pouco desde a última execução: atualiza a fatoração guardada em vez de refazê-la.
+        # Só com uma fatoração já guardada para o mesmo n; a primeira execução segue o caminho normal.
+        atualizavel = metodo_nome in FATORACOES_ATUALIZAVEIS and not (show_steps or show_matrices or show_LU
+                                                                       or show_perm or mixed or diagnostics)
+        if atualizavel and self._fatoracao_guardada(metodo_nome) is not None:
+            sol = self._resolver_por_atualizacao(metodo_nome)
+            if sol is not None:
+                self._exibir_resultado_linear(metodo_nome, sol, show_steps)
+                return
 
         try:
-            if "iterativo" in metodo_nome.lower():
+            if "iterativo" in metodo_nome.lower() or "automático" in metodo_nome.lower():
                 try:
                     tol = float(self.tol.get())
                     max_iter = int(self.max_iter.get())
@@ -527,16 +661,19 @@ class App:
                     except Exception:
                         x0 = np.zeros(self.b.shape[0])
 
-                sol = metodo_func(self.A, self.b, x0=x0, tol=tol, max_iter=max_iter,
-                                  return_steps=show_steps, record_iterations=show_steps)
+                *sol, do_armazenamento = self._obter_armazem().resolver_linear(
+                    self.A, self.b, metodo_nome, x0=x0, tol=tol, max_iter=max_iter,
+                    registrar_iteracoes=show_steps)
             else:
                 # call with options if supported by method
                 try:
-                    sol = metodo_func(self.A, self.b,
-                                      return_steps=show_steps,
-                                      show_steps_matrix=show_matrices,
-                                      show_LU=show_LU,
-                                      show_permutation=show_perm)
+                    *sol, do_armazenamento = self._obter_armazem().resolver_linear(
+                        self.A, self.b, metodo_nome,
+                        mostrar_matrizes=show_matrices,
+                        mostrar_LU=show_LU,
+                        mostrar_permutacao=show_perm,
+                        precisao="mista" if mixed else "float64",
+                        diagnosticos=diagnostics)
                 except TypeError:
                     # fallback to simpler signature
                     sol = metodo_func(self.A, self.b)
@@ -544,10 +681,124 @@ class App:
             messagebox.showerror("Erro", f"Erro ao executar método linear: {e}")
             return
 
-    # (restante do arquivo continua igual — corte aqui para economia de espaço)
-    # Obs: para não quebrar nada, o restante das funções (interpretação do resultado,
-    # exibição de passos, métodos de raízes, salvar, limpar) permanecem idênticos ao que você já tinha.
-    # Se quiser que eu cole o arquivo completo novamente sem truncar, eu colo na íntegra.
+        if atualizavel and sol[0] is not None and str(sol[2]).startswith("Sucesso"):
+            self._guardar_fatoracao(metodo_nome)
+        self._exibir_resultado_linear(metodo_nome, sol, show_steps, do_armazenamento)
+
+    def _fatoracao_guardada(self, metodo_nome):
+        """FatoracaoAtualizavel guardada para o método e o n atual de A, ou None."""
+        fatoracao = self._fatoracoes.get(FATORACOES_ATUALIZAVEIS[metodo_nome])
+        if fatoracao is None or fatoracao.n != self.A.shape[0]:
+            return None
+        return fatoracao
+
+    def _guardar_fatoracao(self, metodo_nome):
+        """Depois de uma execução normal bem-sucedida, guarda a fatoração para as próximas edições de A."""
+        if self._fatoracao_guardada(metodo_nome) is not None:
+            return
+        tipo = FATORACOES_ATUALIZAVEIS[metodo_nome]
+        try:
+            self._fatoracoes[tipo] = AP.FatoracaoAtualizavel(self.A, tipo)
+        except (np.linalg.LinAlgError, ValueError):
+            self._fatoracoes.pop(tipo, None)
+
+    def _resolver_por_atualizacao(self, metodo_nome):
+        """Resolve com a fatoração guardada; None se não for possível (o caminho normal trata o erro)."""
+        tipo = FATORACOES_ATUALIZAVEIS[metodo_nome]
+        try:
+            sol = AP.resolver_com_atualizacao(self._fatoracao_guardada(metodo_nome), self.A, self.b,
+                                              retornar_passos=True)
+        except (np.linalg.LinAlgError, ValueError):
+            sol = (None,)
+        if sol[0] is None:
+            self._fatoracoes.pop(tipo, None)
+            return None
+        return sol
+
+    def _obter_armazem(self):
+        """Abre o armazenamento de resultados (logs/resultados.sqlite3) no primeiro uso."""
+        if self._armazem is None:
+            self._armazem = AR.ArmazemResultados()
+        return self._armazem
+
+    def _obter_gravador(self):
+        """Cria o gravador de logs em segundo plano no primeiro uso."""
+        if self._gravador is None:
+            self._gravador = RL.GravadorLogs("logs", max_arquivos=MAX_LOGS)
+        return self._gravador
+
+    def _exibir_resultado_linear(self, metodo_nome, sol, show_steps, do_armazenamento=False):
+        x, tempo, status = sol[0], sol[1], sol[2]
+        passos = sol[3] if len(sol) > 3 else {}
+
+        self.texto_resultado.insert(tk.END, f"Método: {metodo_nome}\n")
+        self.texto_resultado.insert(tk.END, f"Status: {status}\n")
+        self.texto_resultado.insert(tk.END, f"Tempo de execução: {tempo:.6f} s\n")
+        if do_armazenamento:
+            self.texto_resultado.insert(tk.END, "[Resultado recuperado do armazenamento; tempo da execução original]\n")
+        if x is not None:
+            residuo = passos.get("residuo")
+            if residuo is None:
+                residuo = np.linalg.norm(self.A @ x - self.b, ord=np.inf)
+            self.texto_resultado.insert(tk.END, "\nSolução x:\n")
+            for i, xi in enumerate(x):
+                self.texto_resultado.insert(tk.END, f"  x[{i}] = {xi:.10g}\n")
+            self.texto_resultado.insert(tk.END, f"\nResíduo ||Ax - b||∞ = {residuo:.3e}\n")
+            if passos.get("condicionamento") is not None:
+                self.texto_resultado.insert(tk.END, f"Número de condição estimado κ₁(A) ≈ {passos['condicionamento']:.3e}\n")
+
+        if show_steps:
+            for acao in passos.get("acoes", []):
+                self.texto_passos.insert(tk.END, f"{acao}\n")
+            for titulo, M in passos.get("matrizes", []):
+                self.texto_passos.insert(tk.END, f"\n{titulo}:\n{np.array2string(M, precision=6)}\n")
+            for k, xk in enumerate(passos.get("iteracoes", []), start=1):
+                self.texto_passos.insert(tk.END, f"Iteração {k}: {np.array2string(xk, precision=8)}\n")
+        if passos.get("L") is not None:
+            self.texto_passos.insert(tk.END, f"\nL:\n{np.array2string(passos['L'], precision=6)}\n")
+        if passos.get("U") is not None:
+            self.texto_passos.insert(tk.END, f"\nU:\n{np.array2string(passos['U'], precision=6)}\n")
+        if passos.get("col_permutacao") is not None:
+            self.texto_passos.insert(tk.END, f"\nPermutação de colunas: {passos['col_permutacao']}\n")
+
+        self.texto_resultado.see(tk.END)
+
+    # ----------------- comparação de todos os métodos -----------------
+    def comparar_lineares(self):
+        if self.A is None or self.b is None:
+            messagebox.showerror("Erro", "Por favor, carregue a matriz A e o vetor b.")
+            return
+        try:
+            opcoes = {"tol": float(self.tol.get()), "max_iter": int(self.max_iter.get())}
+        except Exception:
+            messagebox.showerror("Erro de Entrada", "Tolerância ou número máximo inválido.")
+            return
+
+        self.texto_resultado.delete('1.0', tk.END)
+        self.texto_resultado.insert(tk.END, "Executando todos os métodos em paralelo...\n")
+        self.btn_comparar.state(["disabled"])
+        estado = {}
+
+        # o pool roda numa thread para não travar a interface; a UI só é tocada em _verificar
+        def _tarefa():
+            try:
+                estado["resultado"] = CM.comparar_metodos_lineares(self.A, self.b, **opcoes)
+            except Exception as e:
+                estado["erro"] = e
+
+        def _verificar():
+            if "resultado" not in estado and "erro" not in estado:
+                self.root.after(100, _verificar)
+                return
+            self.btn_comparar.state(["!disabled"])
+            if "erro" in estado:
+                messagebox.showerror("Erro", f"Falha na comparação: {estado['erro']}")
+                return
+            self.texto_resultado.insert(tk.END, CM.formatar_tabela(*estado["resultado"]) + "\n")
+            self.texto_resultado.see(tk.END)
+
+        threading.Thread(target=_tarefa, daemon=True).start()
+        self.root.after(100, _verificar)
 
     # ----------------- métodos de raízes -----------------
     def run_roots(self):
@@ -572,6 +823,9 @@ class App:
             "Secante": ("x0", "x1"),
             "Newton-Raphson": ("x0",),
             "Ponto Fixo": ("x0",),
+            "Ponto Fixo (Aitken)": ("x0",),
+            "Ponto Fixo (Steffensen)": ("x0",),
+            "Ponto Fixo (Anderson)": ("x0",),
         }
         required = needs.get(method_name, ())
         provided = {"a": a is not None, "b": b is not None, "x0": x0 is not None, "x1": x1 is not None}
@@ -584,20 +838,14 @@ class App:
                              x0 if x0 is not None else 0.0, x1 if x1 is not None else 0.0,
                              tol, maxit)
 
-        mapping = {
-            "Bisseção": (1, MR.bissecao),
-            "Ponto Fixo": (2, MR.ponto_fixo),
-            "Newton-Raphson": (3, MR.newton),
-            "Secante": (4, MR.secante),
-            "Regula Falsi": (5, MR.regula_falsi)
-        }
-        if method_name not in mapping:
+        nomes = list(MR.METODOS.keys())
+        if method_name not in nomes:
             messagebox.showerror("Erro", f"Método de raízes '{method_name}' não mapeado.")
             return
-        metodo_id, func = mapping[method_name]
-        D.metodo = metodo_id
+        D.metodo = nomes.index(method_name) + 1
 
-        if method_name == "Ponto Fixo":
+        # Steffensen e Anderson não dependem de |phi'| < 1; para os demais, avisa
+        if method_name in ("Ponto Fixo", "Ponto Fixo (Aitken)"):
             try:
                 if hasattr(MR, 'phi'):
                     x_eval = D.x0
@@ -605,30 +853,29 @@ class App:
                     phi = MR.phi
                     deriv = (phi(x_eval + h) - phi(x_eval - h)) / (2 * h)
                     if abs(deriv) >= 1.0:
-                        self.texto_resultado.insert(tk.END, f"⚠️ Aviso: |phi'(x0)| ≈ {deriv:.6f} >= 1 → ponto fixo pode não convergir.\n\n")
+                        self.texto_resultado.insert(tk.END, f"⚠️ Aviso: |phi'(x0)| ≈ {deriv:.6f} >= 1 → ponto fixo pode não convergir; tente Steffensen ou Anderson.\n\n")
+                    elif abs(deriv) >= 0.9:
+                        self.texto_resultado.insert(tk.END, f"⚠️ Aviso: |phi'(x0)| ≈ {deriv:.6f} próximo de 1 → convergência lenta; Steffensen ou Anderson aceleram.\n\n")
             except Exception:
                 pass
 
-        saida_io = io.StringIO()
         try:
-            func(D, saida_io)
+            texto, do_armazenamento = self._obter_armazem().resolver_raiz(method_name, D)
         except Exception as e:
             messagebox.showerror("Erro", f"Erro ao executar o método de raízes: {e}")
             return
 
-        texto = saida_io.getvalue()
         self.texto_resultado.insert(tk.END, texto)
         if self.var_show_roots_steps.get():
             self.texto_passos.insert(tk.END, texto)
 
-        # tenta salvar log automático
-        try:
-            fn = f"logs/resultado_{timestamp_str()}.txt"
-            with open(fn, 'w', encoding='utf-8') as f:
-                f.write(texto)
-            self.texto_resultado.insert(tk.END, f"\n[Salvo log automático em: {fn}]\n")
-        except Exception:
-            pass
+        if do_armazenamento:
+            self.texto_resultado.insert(tk.END, "\n[Resultado recuperado do armazenamento]\n")
+        else:
+            # log automático (só para execuções novas): a gravação fica com a
+            # thread do GravadorLogs, que também mantém no máximo MAX_LOGS arquivos
+            fn = self._obter_gravador().salvar_arquivo(f"resultado_{timestamp_str()}.txt", texto)
+            self.texto_resultado.insert(tk.END, f"\n[Log automático enviado para: {fn}]\n")
 
         self.texto_resultado.see(tk.END)
         self.texto_passos.see(tk.END)
@@ -0,0 +1,211 @@
+# ===============================================================
+# Gauss-Jacobi distribuído em processos (decomposição de domínio)
+#
+# As linhas de A são divididas em faixas contíguas, uma por processo.
+# Cada processo guarda só as suas linhas, em formato esparso
+# (triplas linha/coluna/valor), e a cada varredura:
+#   - lê de x apenas as colunas de que precisa: as próprias e as de
+#     fronteira (halo) vindas das faixas vizinhas;
+#   - grava a sua parte do novo x num buffer compartilhado (dois
+#     buffers alternados, sem cópias);
+#   - publica o seu max|Δx| local; depois de uma barreira, todos
+#     fazem a mesma redução (máximo) e decidem juntos se param.
+# Modo "bloco" (Jacobi em blocos): o bloco diagonal de cada faixa é
+# fatorado uma vez (LU em banda quando estreito, LU densa senão) e
+# resolvido exatamente a cada varredura; só o acoplamento entre
+# faixas é iterado.
+#
+# A memória compartilhada usa multiprocessing.RawArray, então vale para
+# processos numa mesma máquina.
+#
+# Retorno no padrão de metodos_lineares:
+#   x, tempo, status  ou  x, tempo, status, passos
+# ===============================================================
+
+import multiprocessing as mp
+import os
+import threading
+import time
+
+import numpy as np
+
+import metodos_lineares as ML
+
+TEMPO_LIMITE_BARREIRA = 60.0  # s; protege contra um processo que morreu sem avisar
+ERRO_BLOCO_SINGULAR = 1       # código em controle[2]; controle[3] guarda a faixa
+
+
+# ---------------------------------------------------------------
+# Partição e dados locais
+# ---------------------------------------------------------------
+
+def particionar(n, processos):
+    """Faixas contíguas de linhas, de tamanhos quase iguais: lista de (inicio, fim)."""
+    limites = np.linspace(0, n, processos + 1).round().astype(int)
+    return [(int(a), int(b)) for a, b in zip(limites[:-1], limites[1:]) if b > a]
+
+
+def _dados_locais(A, inicio, fim, modo):
+    """Extrai as linhas inicio..fim-1 de A no formato usado pelo processo."""
+    faixa = A[inicio:fim]
+    if modo == "bloco":
+        # o bloco diagonal é resolvido diretamente; só o resto entra nas triplas
+        bloco = faixa[:, inicio:fim].copy()
+        faixa = faixa.copy()
+        faixa[:, inicio:fim] = 0.0
+    else:
+        bloco = None
+        faixa = faixa.copy()
+        np.fill_diagonal(faixa[:, inicio:fim], 0.0)
+    linhas, colunas = np.nonzero(faixa)
+    dados = {
+        "inicio": inicio,
+        "fim": fim,
+        "linhas": linhas,
+        "colunas": colunas,
+        "valores": faixa[linhas, colunas],
+        "diagonal": np.diag(A[inicio:fim, inicio:fim]).copy(),
+        "bloco": bloco,
+    }
+    externas = np.unique(colunas)
+    dados["halo"] = int(np.count_nonzero((externas < inicio) | (externas >= fim)))
+    return dados
+
+
+def _preparar_bloco(bloco):
+    """Fatora o bloco diagonal uma vez; retorna a função que resolve bloco·y = r."""
+    p, q = ML.largura_banda(bloco)
+    m = bloco.shape[0]
+    if p + q + 1 <= max(3, m // 4):
+        B = ML._armazenar_banda(bloco, p, q)
+        if ML._fatorar_lu_banda(B, p, q) is None:
+            return lambda r: ML._resolver_lu_banda(B, p, q, r)
+    LU, piv = ML._fatorar_lu(bloco, pivotear=True)
+    if LU is None:
+        raise np.linalg.LinAlgError(f"Bloco diagonal singular (etapa {piv}).")
+    return lambda r: ML._resolver_lu(LU, piv, r)
+
+
+# ---------------------------------------------------------------
+# Processo trabalhador
+# ---------------------------------------------------------------
+
+def _trabalhador(indice, dados, b_local, compartilhado, barreira, tol, max_iter, modo):
+    """Laço de varreduras de uma faixa. compartilhado = (X, diferencas, controle).
+
+    controle = [iterações, max|Δx| final, código de erro, faixa do erro]: um
+    bloco diagonal singular é informado por ele (sem exceção no processo filho).
+    """
+    X_bruto, dif_bruto, controle = compartilhado
+    processos = barreira.parties
+    n = len(X_bruto) // 2
+    X = np.frombuffer(X_bruto, dtype=float).reshape(2, n)
+    diferencas = np.frombuffer(dif_bruto, dtype=float).reshape(2, processos)
+    inicio, fim = dados["inicio"], dados["fim"]
+    m = fim - inicio
+    linhas, colunas, valores = dados["linhas"], dados["colunas"], dados["valores"]
+
+    try:
+        resolver_bloco = _preparar_bloco(dados["bloco"]) if modo == "bloco" else None
+        acoplamento = np.empty(m)
+        novo = np.empty(m)
+        for k in range(1, max_iter + 1):
+            atual, proximo = X[(k - 1) % 2], X[k % 2]
+            # só as colunas desta faixa e do halo são lidas do x compartilhado
+            acoplamento[:] = np.bincount(linhas, weights=valores * atual[colunas], minlength=m)
+            np.subtract(b_local, acoplamento, out=novo)
+            if resolver_bloco is None:
+                np.divide(novo, dados["diagonal"], out=novo)
+            else:
+                novo[:] = resolver_bloco(novo)
+            proximo[inicio:fim] = novo
+            np.subtract(novo, atual[inicio:fim], out=acoplamento)
+            diferencas[k % 2, indice] = np.max(np.abs(acoplamento)) if m else 0.0
+
+            barreira.wait(TEMPO_LIMITE_BARREIRA)
+            # redução: todos veem os mesmos valores e tomam a mesma decisão
+            global_ = diferencas[k % 2].max()
+            if global_ < tol or not np.isfinite(global_) or k == max_iter:
+                if indice == 0:
+                    controle[0] = k
+                    controle[1] = global_
+                return
+    except threading.BrokenBarrierError:
+        return
+    except np.linalg.LinAlgError:
+        # bloco diagonal singular: só _preparar_bloco lança; os demais saem pela barreira quebrada
+        controle[2] = ERRO_BLOCO_SINGULAR
+        controle[3] = indice
+        barreira.abort()
+    except Exception:
+        barreira.abort()
+        raise
+
+
+# ---------------------------------------------------------------
+# Interface no padrão de metodos_lineares
+# ---------------------------------------------------------------
+
+def jacobi_distribuido(A, b, x0=None, tol=1e-8, max_iter=100, processos=None, modo="pontual",
+                       retornar_passos=False, **kwargs):
+    """Gauss-Jacobi (modo="pontual") ou Jacobi em blocos (modo="bloco") com as linhas divididas entre processos."""
+    inicio_tempo = time.time()
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float).reshape(-1)
+    passos = {"acoes": []}
+
+    if not ML.eh_quadrada(A):
+        status = "ERRO: A não é quadrada."
+        return ML._empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+    if modo not in ("pontual", "bloco"):
+        raise ValueError(f"Modo desconhecido: {modo}")
+    if modo == "pontual":
+        linha_nula = ML._linha_diagonal_nula(A)
+        if linha_nula is not None:
+            status = f"ERRO: Zero na diagonal (linha {linha_nula})."
+            return ML._empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+
+    n = b.shape[0]
+    faixas = particionar(n, processos or os.cpu_count() or 1)
+    p = len(faixas)
+    contexto = mp.get_context()
+    X_bruto = contexto.RawArray("d", 2 * n)
+    dif_bruto = contexto.RawArray("d", 2 * p)
+    controle = contexto.RawArray("d", 4)
+    X = np.frombuffer(X_bruto, dtype=float).reshape(2, n)
+    X[0] = 0.0 if x0 is None else np.asarray(x0, dtype=float).reshape(-1)
+    barreira = contexto.Barrier(p)
+
+    dados = [_dados_locais(A, a, f, modo) for a, f in faixas]
+    passos["acoes"].append(f"{p} processo{'s' if p > 1 else ''}; halo por faixa: {[d['halo'] for d in dados]} valores")
+    trabalhadores = [
+        contexto.Process(target=_trabalhador, daemon=True,
+                         args=(i, dados[i], b[a:f], (X_bruto, dif_bruto, controle), barreira, tol, max_iter, modo))
+        for i, (a, f) in enumerate(faixas)
+    ]
+    for t in trabalhadores:
+        t.start()
+    for t in trabalhadores:
+        t.join()
+
+    tempo = time.time() - inicio_tempo
+    nome = "Jacobi em blocos" if modo == "bloco" else "Gauss-Jacobi"
+    if controle[2] == ERRO_BLOCO_SINGULAR:
+        a, f = faixas[int(controle[3])]
+        status = (f"ERRO: bloco diagonal singular na faixa {int(controle[3])} "
+                  f"(linhas {a} a {f - 1}; {nome} distribuído).")
+        return ML._empacotar_retorno(None, tempo, status, passos, retornar_passos)
+    if any(t.exitcode != 0 for t in trabalhadores) or controle[0] == 0:
+        status = f"ERRO: um processo falhou ({nome} distribuído)."
+        return ML._empacotar_retorno(None, tempo, status, passos, retornar_passos)
+
+    k = int(controle[0])
+    x = X[k % 2].copy()
+    diferenca = controle[1]
+    if not np.isfinite(diferenca):
+        status = f"Atenção: iteração divergiu para valores não finitos após {k} iterações ({nome} distribuído)."
+    elif diferenca < tol:
+        status = f"Convergiu em {k} iterações ({nome} distribuído, {p} processo{'s' if p > 1 else ''})."
+    else:
+        status = f"Atenção: não convergiu dentro do número máximo de iterações ({nome} distribuído)."
+    return ML._empacotar_retorno(x, tempo, status, passos, retornar_passos)
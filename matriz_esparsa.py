@@ -0,0 +1,115 @@
+# ===============================================================
+# Matriz esparsa mínima (formato CSR) só com NumPy
+#
+# Guarda, por linhas, as colunas e os valores dos não nulos:
+#   linha i → colunas[inicio[i]:inicio[i+1]], valores[idem]
+# Tem apenas o que os métodos de multigrade e de autovalores usam:
+# produto por vetor, produto entre matrizes esparsas, transposta,
+# diagonal e conversão de/para densa.
+# ===============================================================
+
+import numpy as np
+
+
+class MatrizEsparsa:
+    def __init__(self, linhas, colunas, valores, forma):
+        """Monta a partir de triplas (linha, coluna, valor); entradas repetidas são somadas."""
+        m, n = forma
+        linhas = np.asarray(linhas, dtype=np.int64)
+        colunas = np.asarray(colunas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+        chaves, posicoes = np.unique(linhas * n + colunas, return_inverse=True)
+        valores = np.bincount(posicoes, weights=valores, minlength=chaves.size)
+        mantidos = valores != 0.0
+        chaves, valores = chaves[mantidos], valores[mantidos]
+
+        self.forma = (int(m), int(n))
+        self.linhas = chaves // n if n else chaves
+        self.colunas = chaves % n if n else chaves
+        self.valores = valores
+        self.inicio = np.concatenate([[0], np.cumsum(np.bincount(self.linhas, minlength=m))])
+
+    @classmethod
+    def de_densa(cls, A):
+        A = np.asarray(A, dtype=float)
+        linhas, colunas = np.nonzero(A)
+        return cls(linhas, colunas, A[linhas, colunas], A.shape)
+
+    @classmethod
+    def identidade(cls, n):
+        indices = np.arange(n)
+        return cls(indices, indices, np.ones(n), (n, n))
+
+    @property
+    def nnz(self):
+        return self.valores.size
+
+    @property
+    def shape(self):
+        return self.forma
+
+    def densa(self):
+        A = np.zeros(self.forma)
+        A[self.linhas, self.colunas] = self.valores
+        return A
+
+    def diagonal(self):
+        d = np.zeros(min(self.forma))
+        na_diagonal = self.linhas == self.colunas
+        d[self.linhas[na_diagonal]] = self.valores[na_diagonal]
+        return d
+
+    def transposta(self):
+        return MatrizEsparsa(self.colunas, self.linhas, self.valores, self.forma[::-1])
+
+    @property
+    def T(self):
+        return self.transposta()
+
+    def escalar_linhas(self, d):
+        """diag(d) · A."""
+        return MatrizEsparsa(self.linhas, self.colunas, self.valores * np.asarray(d)[self.linhas], self.forma)
+
+    def linha(self, i):
+        """(colunas, valores) da linha i."""
+        a, f = self.inicio[i], self.inicio[i + 1]
+        return self.colunas[a:f], self.valores[a:f]
+
+    def produto(self, x):
+        """A x (x vetor ou matriz n x k)."""
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 1:
+            return np.bincount(self.linhas, weights=self.valores * x[self.colunas], minlength=self.forma[0])
+        termos = self.valores[:, None] * x[self.colunas]
+        y = np.zeros((self.forma[0], x.shape[1]))
+        np.add.at(y, self.linhas, termos)
+        return y
+
+    def produto_esparso(self, B):
+        """A B, com B esparsa: cada não nulo a_ik é expandido pela linha k de B."""
+        if self.forma[1] != B.forma[0]:
+            raise ValueError(f"Dimensões incompatíveis: {self.forma} x {B.forma}")
+        por_linha = np.diff(B.inicio)[self.colunas]
+        total = int(por_linha.sum())
+        if total == 0:
+            return MatrizEsparsa([], [], [], (self.forma[0], B.forma[1]))
+        origem = np.repeat(np.arange(self.nnz), por_linha)
+        # posição de cada termo dentro da linha de B correspondente
+        deslocamento = np.arange(total) - np.repeat(np.cumsum(por_linha) - por_linha, por_linha)
+        em_B = B.inicio[self.colunas[origem]] + deslocamento
+        return MatrizEsparsa(self.linhas[origem], B.colunas[em_B],
+                             self.valores[origem] * B.valores[em_B], (self.forma[0], B.forma[1]))
+
+    def __matmul__(self, outro):
+        if isinstance(outro, MatrizEsparsa):
+            return self.produto_esparso(outro)
+        return self.produto(outro)
+
+    def __sub__(self, outra):
+        return MatrizEsparsa(np.concatenate([self.linhas, outra.linhas]), np.concatenate([self.colunas, outra.colunas]),
+                             np.concatenate([self.valores, -outra.valores]), self.forma)
+
+
+def como_esparsa(A):
+    """Aceita MatrizEsparsa ou matriz densa (array/lista)."""
+    return A if isinstance(A, MatrizEsparsa) else MatrizEsparsa.de_densa(A)
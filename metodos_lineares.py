@@ -8,6 +8,9 @@
 
 import numpy as np
 import time
+import hashlib
+
+from matriz_esparsa import como_esparsa
 
 EPS = 1e-18  # tolerância numérica
 
@@ -33,6 +36,25 @@ def eh_definida_positiva(matriz):
         return False
 
 
+def largura_banda(matriz, tol=0.0):
+    """Retorna (inferior, superior): as larguras de banda abaixo e acima da diagonal."""
+    matriz = np.asarray(matriz)
+    linhas, colunas = np.nonzero(np.abs(matriz) > tol)
+    if linhas.size == 0:
+        return 0, 0
+    deslocamento = colunas - linhas
+    return int(max(0, -deslocamento.min())), int(max(0, deslocamento.max()))
+
+
+def eh_banda_estreita(matriz, fracao=0.1):
+    """Verifica se a banda é estreita o bastante para compensar os solvers em banda."""
+    matriz = np.asarray(matriz)
+    if not eh_quadrada(matriz):
+        return False
+    p, q = largura_banda(matriz)
+    return p + q + 1 <= max(3, int(fracao * matriz.shape[0]))
+
+
 def _empacotar_retorno(x, tempo, status, passos=None, retornar_passos=False):
     """Padroniza o formato de retorno."""
     if retornar_passos:
@@ -40,11 +62,183 @@ def _empacotar_retorno(x, tempo, status, passos=None, retornar_passos=False):
     else:
         return x, tempo, status
 
+# ---------------------------------------------------------------
+# Fatoração compacta e refinamento iterativo (precisão mista)
+# ---------------------------------------------------------------
+
+def _fatorar_lu(A, pivotear=True):
+    """Fatoração LU compacta (L e U na mesma matriz) no dtype de A.
+
+    Retorna (LU, piv), com piv a permutação de linhas (PA = LU), ou
+    (None, k) quando o pivô da etapa k é nulo.
+    """
+    LU = A.copy()
+    n = LU.shape[0]
+    piv = np.arange(n)
+    for k in range(n):
+        if pivotear:
+            p = int(np.argmax(np.abs(LU[k:, k]))) + k
+            if p != k:
+                LU[[k, p], :] = LU[[p, k], :]
+                piv[[k, p]] = piv[[p, k]]
+        if abs(LU[k, k]) < EPS:
+            return None, k
+        LU[k + 1:, k] /= LU[k, k]
+        LU[k + 1:, k + 1:] -= np.outer(LU[k + 1:, k], LU[k, k + 1:])
+    return LU, piv
+
+
+def _resolver_lu(LU, piv, b):
+    """Resolve LUx = Pb por substituições progressiva e regressiva."""
+    n = LU.shape[0]
+    x = b[piv].astype(LU.dtype)
+    for i in range(1, n):
+        x[i] -= np.dot(LU[i, :i], x[:i])
+    for i in range(n - 1, -1, -1):
+        x[i] = (x[i] - np.dot(LU[i, i + 1:], x[i + 1:])) / LU[i, i]
+    return x
+
+
+def _refinamento_precisao_mista(A, b, pivotear=True, max_refinamentos=10):
+    """Fatora A em float32 e refina x com resíduos calculados em float64.
+
+    A mesma fatoração float32 é reaproveitada em todos os passos de
+    refinamento. Retorna (x, refinamentos, (LU, piv)) em caso de sucesso,
+    com os fatores float32 para os diagnósticos, ou (None, motivo, None)
+    quando o refinamento não converge.
+    """
+    n = A.shape[0]
+    LU, piv = _fatorar_lu(A.astype(np.float32), pivotear=pivotear)
+    if LU is None:
+        return None, f"pivô nulo em float32 na etapa {piv}", None
+
+    eps = np.finfo(float).eps
+    norma_A = np.linalg.norm(A, ord=np.inf)
+    norma_b = np.linalg.norm(b, ord=np.inf)
+    x = _resolver_lu(LU, piv, b).astype(float)
+    correcao_ant = np.inf
+
+    for k in range(max_refinamentos + 1):
+        if not np.all(np.isfinite(x)):
+            return None, "solução não finita", None
+        r = b - A @ x
+        if np.linalg.norm(r, ord=np.inf) <= n * eps * (norma_A * np.linalg.norm(x, ord=np.inf) + norma_b):
+            return x, k, (LU, piv)
+        if k == max_refinamentos:
+            break
+        d = _resolver_lu(LU, piv, r).astype(float)
+        x += d
+        correcao = np.linalg.norm(d, ord=np.inf) / max(np.linalg.norm(x, ord=np.inf), EPS)
+        if correcao <= n * eps:
+            return x, k + 1, (LU, piv)
+        # o refinamento só compensa enquanto as correções caem rapidamente
+        if correcao > 0.5 * correcao_ant:
+            return None, f"refinamento estagnou após {k + 1} passos", None
+        correcao_ant = correcao
+
+    return None, f"refinamento não convergiu em {max_refinamentos} passos", None
+
+# ---------------------------------------------------------------
+# Diagnósticos: resíduo e estimativa do número de condição
+#
+# A estimativa de ||A^-1||_1 (Hager/Higham) usa só resoluções com os
+# fatores que o método já calculou: O(n²) extra, em vez do O(n³) de
+# np.linalg.cond.
+# ---------------------------------------------------------------
+
+def _substituicao_progressiva(L, y):
+    """Resolve L z = y com L triangular inferior."""
+    z = np.array(y, dtype=float)
+    for i in range(L.shape[0]):
+        z[i] = (z[i] - np.dot(L[i, :i], z[:i])) / L[i, i]
+    return z
+
+
+def _substituicao_regressiva(U, y):
+    """Resolve U z = y com U triangular superior."""
+    z = np.array(y, dtype=float)
+    for i in range(U.shape[0] - 1, -1, -1):
+        z[i] = (z[i] - np.dot(U[i, i + 1:], z[i + 1:])) / U[i, i]
+    return z
+
+
+def _resolvedores_lu(L, U, linhas=None, colunas=None):
+    """Funções que resolvem A z = y e A^T z = y a partir de PAQ = LU.
+
+    linhas é a permutação de linhas (PA = A[linhas]) e colunas a de
+    colunas (PAQ = (PA)[:, colunas]); None indica a identidade.
+    """
+    n = L.shape[0]
+    linhas = np.arange(n) if linhas is None else np.asarray(linhas)
+    colunas = np.arange(n) if colunas is None else np.asarray(colunas)
+
+    def resolver(y):
+        x = np.empty(n)
+        x[colunas] = _substituicao_regressiva(U, _substituicao_progressiva(L, y[linhas]))
+        return x
+
+    def resolver_transposta(y):
+        x = np.empty(n)
+        x[linhas] = _substituicao_regressiva(L.T, _substituicao_progressiva(U.T, y[colunas]))
+        return x
+
+    return resolver, resolver_transposta
+
+
+def _resolvedores_lu_compacta(LU, piv):
+    """_resolvedores_lu a partir da LU compacta de _fatorar_lu (PA = LU, no dtype dos fatores)."""
+    return _resolvedores_lu(np.tril(LU, -1) + np.eye(LU.shape[0], dtype=LU.dtype), np.triu(LU), piv)
+
+
+def estimar_norma1_inversa(resolver, resolver_transposta, n, max_iter=5):
+    """Estimador de Hager/Higham para ||A^-1||_1 a partir de resoluções com A e A^T."""
+    x = np.full(n, 1.0 / n)
+    estimativa = 0.0
+    for k in range(max_iter):
+        y = resolver(x)
+        estimativa = max(estimativa, np.abs(y).sum())
+        z = resolver_transposta(np.where(y >= 0, 1.0, -1.0))
+        j = int(np.argmax(np.abs(z)))
+        if k > 0 and abs(z[j]) <= np.dot(z, x):
+            break
+        x = np.zeros(n)
+        x[j] = 1.0
+    # vetor alternado de Higham: protege contra os casos em que Hager subestima
+    alternado = (-1.0) ** np.arange(n) * (1.0 + np.arange(n) / max(n - 1, 1))
+    return max(estimativa, 2.0 * np.abs(resolver(alternado)).sum() / (3.0 * n))
+
+
+def diagnosticar(A, b, x, resolver=None, resolver_transposta=None):
+    """Resíduo ||b - Ax||∞ e, se houver resolvedores com os fatores, κ₁(A) estimado.
+
+    A pode ser densa ou esparsa em triplas (MatrizEsparsa), sem formar a densa.
+    """
+    esparsa = _tem_triplas(A)
+    produto = A.produto(x) if esparsa else A @ x
+    diagnostico = {"residuo": float(np.linalg.norm(b - produto, ord=np.inf)), "condicionamento": None}
+    if resolver is not None:
+        if esparsa:
+            norma_A = np.bincount(A.colunas, weights=np.abs(A.valores), minlength=A.shape[1]).max(initial=0.0)
+        else:
+            norma_A = np.abs(A).sum(axis=0).max()
+        inversa = estimar_norma1_inversa(resolver, resolver_transposta, A.shape[0])
+        diagnostico["condicionamento"] = float(norma_A * inversa)
+    return diagnostico
+
+
+def _anexar_diagnosticos(status, passos, diagnostico):
+    """Guarda o diagnóstico em passos e o resume no status."""
+    passos.update(diagnostico)
+    status += f" Resíduo ||b - Ax||∞ = {diagnostico['residuo']:.3e}"
+    if diagnostico["condicionamento"] is not None:
+        status += f"; κ₁(A) ≈ {diagnostico['condicionamento']:.3e}"
+    return status + "."
+
 # ---------------------------------------------------------------
 # Eliminação de Gauss (sem pivoteamento)
 # ---------------------------------------------------------------
 
-def eliminacao_gauss(A, b, retornar_passos=False, mostrar_matrizes=False, **kwargs):
+def eliminacao_gauss(A, b, retornar_passos=False, mostrar_matrizes=False, diagnosticos=False, **kwargs):
     inicio = time.time()
     A = np.array(A, dtype=float)
     b = np.array(b, dtype=float).reshape(-1)
@@ -56,6 +250,7 @@ def eliminacao_gauss(A, b, retornar_passos=False, mostrar_matrizes=False, **kwar
 
     n = A.shape[0]
     M = np.hstack([A.copy(), b.reshape(-1, 1)])
+    multiplicadores = np.eye(n) if diagnosticos else None
     if mostrar_matrizes:
         passos["matrizes"].append(("Inicial (A|b)", M.copy()))
 
@@ -66,6 +261,8 @@ def eliminacao_gauss(A, b, retornar_passos=False, mostrar_matrizes=False, **kwar
         for j in range(i + 1, n):
             multiplicador = M[j, i] / M[i, i]
             M[j, i:] -= multiplicador * M[i, i:]
+            if diagnosticos:
+                multiplicadores[j, i] = multiplicador
             if mostrar_matrizes:
                 passos["acoes"].append(f"Eliminou linha {j} usando linha {i} (m={multiplicador:.6g})")
                 passos["matrizes"].append((f"Após eliminação i={i}, j={j}", M.copy()))
@@ -75,17 +272,20 @@ def eliminacao_gauss(A, b, retornar_passos=False, mostrar_matrizes=False, **kwar
         if abs(M[i, i]) < EPS:
             status = f"ERRO: Pivô zero durante retrosubstituição (linha {i})."
             return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
-        x[i] = (M[i, n] - np.dot(M[i, i + 1:], x[i + 1:])) / M[i, i]
+        x[i] = (M[i, n] - np.dot(M[i, i + 1:n], x[i + 1:])) / M[i, i]
 
     tempo = time.time() - inicio
     status = "Sucesso (Eliminação de Gauss sem pivoteamento)."
+    if diagnosticos:
+        resolvedores = _resolvedores_lu(multiplicadores, np.triu(M[:, :n]))
+        status = _anexar_diagnosticos(status, passos, diagnosticar(A, b, x, *resolvedores))
     return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
 
 # ---------------------------------------------------------------
 # Pivoteamento parcial (troca de linhas)
 # ---------------------------------------------------------------
 
-def pivoteamento_parcial(A, b, retornar_passos=False, mostrar_matrizes=False, **kwargs):
+def pivoteamento_parcial(A, b, retornar_passos=False, mostrar_matrizes=False, precisao="float64", diagnosticos=False, **kwargs):
     inicio = time.time()
     A = np.array(A, dtype=float)
     b = np.array(b, dtype=float).reshape(-1)
@@ -95,8 +295,21 @@ def pivoteamento_parcial(A, b, retornar_passos=False, mostrar_matrizes=False, **
         status = "ERRO: A não é quadrada ou dimensões incompatíveis com b."
         return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
 
+    if precisao == "mista":
+        x, info, fatores = _refinamento_precisao_mista(A, b, pivotear=True)
+        if x is not None:
+            tempo = time.time() - inicio
+            status = f"Sucesso (Gauss com pivoteamento parcial em precisão mista, {info} refinamentos)."
+            if diagnosticos:
+                resolvedores = _resolvedores_lu_compacta(*fatores)
+                status = _anexar_diagnosticos(status, passos, diagnosticar(A, b, x, *resolvedores))
+            return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
+        passos["acoes"].append(f"Precisão mista abandonada ({info}); refatorando em float64.")
+
     n = len(b)
     M = np.hstack([A.copy(), b.reshape(-1, 1)])
+    linhas = np.arange(n)
+    multiplicadores = np.eye(n) if diagnosticos else None
     if mostrar_matrizes:
         passos["matrizes"].append(("Inicial (A|b)", M.copy()))
 
@@ -108,12 +321,17 @@ def pivoteamento_parcial(A, b, retornar_passos=False, mostrar_matrizes=False, **
             return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
         if linha_pivo != i:
             M[[i, linha_pivo], :] = M[[linha_pivo, i], :]
+            linhas[[i, linha_pivo]] = linhas[[linha_pivo, i]]
+            if diagnosticos:
+                multiplicadores[[i, linha_pivo], :i] = multiplicadores[[linha_pivo, i], :i]
             passos["acoes"].append(f"Trocou linha {i} com {linha_pivo}")
             if mostrar_matrizes:
                 passos["matrizes"].append((f"Após troca {i}<->{linha_pivo}", M.copy()))
         for j in range(i + 1, n):
             multiplicador = M[j, i] / M[i, i]
             M[j, i:] -= multiplicador * M[i, i:]
+            if diagnosticos:
+                multiplicadores[j, i] = multiplicador
             passos["acoes"].append(f"Eliminou linha {j} usando linha {i} (m={multiplicador:.6g})")
             if mostrar_matrizes:
                 passos["matrizes"].append((f"Após eliminação i={i}, j={j}", M.copy()))
@@ -124,17 +342,30 @@ def pivoteamento_parcial(A, b, retornar_passos=False, mostrar_matrizes=False, **
         if abs(M[i, i]) < EPS:
             status = f"ERRO: Pivô zero na retrosubstituição (linha {i})."
             return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
-        x[i] = (M[i, n] - np.dot(M[i, i + 1:], x[i + 1:])) / M[i, i]
+        x[i] = (M[i, n] - np.dot(M[i, i + 1:n], x[i + 1:])) / M[i, i]
 
     tempo = time.time() - inicio
     status = "Sucesso (Gauss com pivoteamento parcial)."
+    if diagnosticos:
+        resolvedores = _resolvedores_lu(multiplicadores, np.triu(M[:, :n]), linhas)
+        status = _anexar_diagnosticos(status, passos, diagnosticar(A, b, x, *resolvedores))
     return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
 
 # ---------------------------------------------------------------
 # Pivoteamento completo (linhas e colunas)
 # ---------------------------------------------------------------
 
-def pivoteamento_completo(A, b, retornar_passos=False, mostrar_matrizes=False, mostrar_permutacao=False, **kwargs):
+def pivoteamento_completo(A, b, retornar_passos=False, mostrar_matrizes=False, mostrar_permutacao=False, diagnosticos=False, **kwargs):
+    """Gauss com pivoteamento completo sobre vetores de permutação.
+
+    Linhas e colunas nunca são trocadas fisicamente: a etapa i usa a linha
+    linhas[i] e a coluna colunas[i] de M. As linhas ativas têm zeros em
+    todas as colunas já pivotadas, então cada eliminação é uma operação
+    sobre a linha inteira, feita no lugar com buffers pré-alocados. O
+    máximo de |M| por coluna é acumulado durante essas eliminações, de
+    modo que a busca do próximo pivô custa O(n) e não aloca a submatriz
+    |M[i:, i:]| a cada etapa.
+    """
     inicio = time.time()
     A = np.array(A, dtype=float)
     b = np.array(b, dtype=float).reshape(-1)
@@ -146,59 +377,77 @@ def pivoteamento_completo(A, b, retornar_passos=False, mostrar_matrizes=False, m
 
     n = len(b)
     M = np.hstack([A.copy(), b.reshape(-1, 1)])
-    col_permutacao = list(range(n))
     if mostrar_matrizes:
         passos["matrizes"].append(("Inicial (A|b)", M.copy()))
 
-    for i in range(n):
-        sub = np.abs(M[i:, i:n])
-        if sub.size == 0:
-            status = "ERRO: Submatriz vazia durante pivoteamento completo."
-            return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+    linhas = np.arange(n)
+    colunas = np.arange(n)
+    linha_ativa = np.ones(n, dtype=bool)
+    coluna_ativa = np.ones(n, dtype=bool)
+    multiplicadores = np.zeros((n, n)) if diagnosticos else None
+
+    # buffers reutilizados em todas as etapas
+    produto = np.empty(n + 1)
+    absoluto = np.empty(n)
+    maximo_coluna = np.abs(M[:, :n]).max(axis=0)
 
-        max_local = np.unravel_index(np.argmax(sub, axis=None), sub.shape)
-        linha_pivo = i + max_local[0]
-        coluna_pivo = i + max_local[1]
+    for i in range(n):
+        maximo_coluna[~coluna_ativa] = -1.0
+        coluna_pivo = int(np.argmax(maximo_coluna))
+        ativas = np.flatnonzero(linha_ativa)
+        linha_pivo = int(ativas[np.argmax(np.abs(M[ativas, coluna_pivo]))])
         passos["acoes"].append(f"Pivô absoluto em ({linha_pivo},{coluna_pivo}) na etapa {i}")
 
-        if abs(M[linha_pivo, coluna_pivo]) < EPS:
+        pivo = M[linha_pivo, coluna_pivo]
+        if abs(pivo) < EPS:
             status = f"ERRO: Pivô zero (ou quase) na etapa {i+1}. Matriz singular."
             return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
 
-        if linha_pivo != i:
-            M[[i, linha_pivo], :] = M[[linha_pivo, i], :]
-            passos["acoes"].append(f"Trocou linhas {i} <-> {linha_pivo}")
-        if coluna_pivo != i:
-            M[:, [i, coluna_pivo]] = M[:, [coluna_pivo, i]]
-            col_permutacao[i], col_permutacao[coluna_pivo] = col_permutacao[coluna_pivo], col_permutacao[i]
-            passos["acoes"].append(f"Trocou colunas {i} <-> {coluna_pivo}")
-
-        for j in range(i + 1, n):
-            multiplicador = M[j, i] / M[i, i]
-            M[j, i:] -= multiplicador * M[i, i:]
-            passos["acoes"].append(f"Eliminou linha {j} usando linha {i} (m={multiplicador:.6g})")
-
-    # Retrosubstituição
-    x_perm = np.zeros(n)
-    for i in range(n - 1, -1, -1):
-        x_perm[i] = (M[i, n] - np.dot(M[i, i + 1:], x_perm[i + 1:])) / M[i, i]
-
+        linhas[i], colunas[i] = linha_pivo, coluna_pivo
+        linha_ativa[linha_pivo] = False
+        coluna_ativa[coluna_pivo] = False
+        if diagnosticos:
+            multiplicadores[linha_pivo, i] = 1.0
+
+        maximo_coluna.fill(0.0)
+        linha_do_pivo = M[linha_pivo]
+        for j in np.flatnonzero(linha_ativa):
+            multiplicador = M[j, coluna_pivo] / pivo
+            if multiplicador != 0.0:
+                np.multiply(linha_do_pivo, multiplicador, out=produto)
+                M[j] -= produto
+                passos["acoes"].append(f"Eliminou linha {j} usando linha {linha_pivo} (m={multiplicador:.6g})")
+            M[j, coluna_pivo] = 0.0
+            if diagnosticos:
+                multiplicadores[j, i] = multiplicador
+            np.abs(M[j, :n], out=absoluto)
+            np.maximum(maximo_coluna, absoluto, out=maximo_coluna)
+
+    # Retrosubstituição nas coordenadas originais: na linha linhas[k], as colunas
+    # já pivotadas antes da etapa k são nulas e as ainda não resolvidas têm x = 0
     x = np.zeros(n)
-    for i_col in range(n):
-        indice_original = col_permutacao[i_col]
-        x[indice_original] = x_perm[i_col]
+    for k in range(n - 1, -1, -1):
+        r, c = linhas[k], colunas[k]
+        x[c] = (M[r, n] - np.dot(M[r, :n], x)) / M[r, c]
 
     tempo = time.time() - inicio
     status = "Sucesso (Gauss com pivoteamento completo)."
+    if mostrar_matrizes:
+        passos["matrizes"].append(("Final (linhas e colunas na ordem dos pivôs)", M[np.ix_(linhas, np.append(colunas, n))]))
     if mostrar_permutacao:
-        passos["col_permutacao"] = col_permutacao.copy()
+        passos["col_permutacao"] = colunas.tolist()
+        passos["lin_permutacao"] = linhas.tolist()
+    if diagnosticos:
+        U = np.triu(M[np.ix_(linhas, colunas)])
+        resolvedores = _resolvedores_lu(multiplicadores[linhas], U, linhas, colunas)
+        status = _anexar_diagnosticos(status, passos, diagnosticar(A, b, x, *resolvedores))
     return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
 
 # ---------------------------------------------------------------
 # Fatoração LU (sem pivoteamento)
 # ---------------------------------------------------------------
 
-def fatoracao_lu(A, b, retornar_passos=False, mostrar_matrizes=False, mostrar_LU=False, **kwargs):
+def fatoracao_lu(A, b, retornar_passos=False, mostrar_matrizes=False, mostrar_LU=False, precisao="float64", diagnosticos=False, **kwargs):
     inicio = time.time()
     A = np.array(A, dtype=float)
     b = np.array(b, dtype=float).reshape(-1)
@@ -208,6 +457,17 @@ def fatoracao_lu(A, b, retornar_passos=False, mostrar_matrizes=False, mostrar_LU
         status = "ERRO: A não é quadrada ou dimensões incompatíveis com b."
         return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
 
+    if precisao == "mista":
+        x, info, fatores = _refinamento_precisao_mista(A, b, pivotear=False)
+        if x is not None:
+            tempo = time.time() - inicio
+            status = f"Sucesso (Fatoração LU em precisão mista, {info} refinamentos)."
+            if diagnosticos:
+                resolvedores = _resolvedores_lu_compacta(*fatores)
+                status = _anexar_diagnosticos(status, passos, diagnosticar(A, b, x, *resolvedores))
+            return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
+        passos["acoes"].append(f"Precisão mista abandonada ({info}); refatorando em float64.")
+
     n = A.shape[0]
     L = np.eye(n)
     U = A.copy()
@@ -230,6 +490,8 @@ def fatoracao_lu(A, b, retornar_passos=False, mostrar_matrizes=False, mostrar_LU
 
     tempo = time.time() - inicio
     status = "Sucesso (Fatoração LU sem pivoteamento)."
+    if diagnosticos:
+        status = _anexar_diagnosticos(status, passos, diagnosticar(A, b, x, *_resolvedores_lu(L, U)))
     if mostrar_LU:
         passos["L"], passos["U"] = L.copy(), U.copy()
     return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
@@ -238,7 +500,7 @@ def fatoracao_lu(A, b, retornar_passos=False, mostrar_matrizes=False, mostrar_LU
 # Fatoração de Cholesky
 # ---------------------------------------------------------------
 
-def cholesky(A, b, retornar_passos=False, mostrar_matrizes=False, mostrar_L=False, **kwargs):
+def cholesky(A, b, retornar_passos=False, mostrar_matrizes=False, mostrar_L=False, diagnosticos=False, **kwargs):
     inicio = time.time()
     A = np.array(A, dtype=float)
     b = np.array(b, dtype=float).reshape(-1)
@@ -265,15 +527,981 @@ def cholesky(A, b, retornar_passos=False, mostrar_matrizes=False, mostrar_L=Fals
 
     tempo = time.time() - inicio
     status = "Sucesso (Fatoração de Cholesky)."
+    if diagnosticos:
+        status = _anexar_diagnosticos(status, passos, diagnosticar(A, b, x, *_resolvedores_lu(L, L.T)))
     if mostrar_L:
         passos["L"] = L.copy()
     return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
 
+# ---------------------------------------------------------------
+# Sistemas em banda — Thomas, LU e Cholesky em banda
+#
+# Apenas a banda é armazenada, por linhas: B[i, j - i + p] = A[i, j],
+# com p a largura inferior. O custo cai de O(n³) para O(n·p·q).
+# ---------------------------------------------------------------
+
+def _armazenar_banda(A, p, q):
+    """Copia as diagonais -p..q de A para o armazenamento em banda (n x (p+q+1))."""
+    n = A.shape[0]
+    B = np.zeros((n, p + q + 1))
+    for deslocamento in range(-p, q + 1):
+        diagonal = np.diagonal(A, deslocamento)
+        inicio_linha = max(0, -deslocamento)
+        B[inicio_linha:inicio_linha + diagonal.size, deslocamento + p] = diagonal
+    return B
+
+
+def _thomas(inferior, principal, superior, b):
+    """Algoritmo de Thomas clássico (eliminação sem pivoteamento em O(n))."""
+    n = len(b)
+    a, d, c, r = inferior.tolist(), principal.tolist(), superior.tolist(), b.tolist()
+    c_linha = [0.0] * n
+    r_linha = [0.0] * n
+    if abs(d[0]) < EPS:
+        return None
+    c_linha[0] = c[0] / d[0]
+    r_linha[0] = r[0] / d[0]
+    for i in range(1, n):
+        denominador = d[i] - a[i] * c_linha[i - 1]
+        if abs(denominador) < EPS:
+            return None
+        c_linha[i] = c[i] / denominador
+        r_linha[i] = (r[i] - a[i] * r_linha[i - 1]) / denominador
+    x = [0.0] * n
+    x[-1] = r_linha[-1]
+    for i in range(n - 2, -1, -1):
+        x[i] = r_linha[i] - c_linha[i] * x[i + 1]
+    return np.array(x)
+
+
+def _reducao_ciclica(inferior, principal, superior, b):
+    """Redução cíclica: variante vetorizada de Thomas, O(n) em log2(n) etapas.
+
+    O sistema é completado com equações identidade até N = 2^m - 1 e recebe
+    posições fictícias 0 e N+1, de modo que cada etapa é uma única operação
+    vetorial sobre os índices múltiplos de 2s.
+    """
+    n = len(b)
+    m = int(np.ceil(np.log2(n + 1)))
+    N = 2 ** m - 1
+    a = np.zeros(N + 2)
+    d = np.ones(N + 2)
+    c = np.zeros(N + 2)
+    r = np.zeros(N + 2)
+    a[1:n + 1], d[1:n + 1], c[1:n + 1], r[1:n + 1] = inferior, principal, superior, b
+    a[1] = 0.0
+    c[n] = 0.0
+
+    s = 1
+    while 2 * s <= N:
+        i = np.arange(2 * s, N + 1, 2 * s)
+        if np.any(np.abs(d[i - s]) < EPS) or np.any(np.abs(d[i + s]) < EPS):
+            return None
+        alfa = -a[i] / d[i - s]
+        gama = -c[i] / d[i + s]
+        d[i] += alfa * c[i - s] + gama * a[i + s]
+        r[i] += alfa * r[i - s] + gama * r[i + s]
+        a[i] = alfa * a[i - s]
+        c[i] = gama * c[i + s]
+        s *= 2
+
+    x = np.zeros(N + 2)
+    while s >= 1:
+        i = np.arange(s, N + 1, 2 * s)
+        if np.any(np.abs(d[i]) < EPS):
+            return None
+        x[i] = (r[i] - a[i] * x[i - s] - c[i] * x[i + s]) / d[i]
+        s //= 2
+    return x[1:n + 1]
+
+
+def resolver_tridiagonal(inferior, principal, superior, b):
+    """Resolve um sistema tridiagonal dado pelas três diagonais (comprimento n cada).
+
+    inferior[0] e superior[-1] são ignorados. Sistemas pequenos usam o laço
+    de Thomas; os grandes, a redução cíclica vetorizada. Retorna None se
+    algum pivô se anular.
+    """
+    inferior = np.asarray(inferior, dtype=float).reshape(-1)
+    principal = np.asarray(principal, dtype=float).reshape(-1)
+    superior = np.asarray(superior, dtype=float).reshape(-1)
+    b = np.asarray(b, dtype=float).reshape(-1)
+    if len(b) < 2048:
+        return _thomas(inferior, principal, superior, b)
+    return _reducao_ciclica(inferior, principal, superior, b)
+
+
+def _fatorar_lu_banda(B, p, q):
+    """LU sem pivoteamento no armazenamento em banda (L e U no lugar de B)."""
+    n = B.shape[0]
+    for k in range(n - 1):
+        if abs(B[k, p]) < EPS:
+            return k
+        m = min(p, n - 1 - k)
+        if m == 0:
+            continue
+        r = np.arange(1, m + 1)
+        linhas = k + r
+        l = B[linhas, p - r] / B[k, p]
+        B[linhas, p - r] = l
+        if q > 0:
+            colunas = (p - r)[:, None] + 1 + np.arange(q)[None, :]
+            B[linhas[:, None], colunas] -= np.outer(l, B[k, p + 1:p + 1 + q])
+    if abs(B[n - 1, p]) < EPS:
+        return n - 1
+    return None
+
+
+def _resolver_lu_banda(B, p, q, b):
+    """Substituições progressiva e regressiva sobre os fatores em banda."""
+    n = B.shape[0]
+    y = b.copy()
+    for i in range(1, n):
+        m = min(p, i)
+        y[i] -= np.dot(B[i, p - m:p], y[i - m:i])
+    x = y
+    for i in range(n - 1, -1, -1):
+        m = min(q, n - 1 - i)
+        x[i] = (x[i] - np.dot(B[i, p + 1:p + 1 + m], x[i + 1:i + 1 + m])) / B[i, p]
+    return x
+
+
+def _resolver_lu_banda_transposta(B, p, q, b):
+    """Resolve A^T x = b (U^T w = b, depois L^T x = w) com os fatores em banda."""
+    n = B.shape[0]
+    w = b.copy()
+    for i in range(n):
+        m = min(q, i)
+        s = np.arange(1, m + 1)
+        w[i] = (w[i] - np.dot(B[i - s, p + s], w[i - s])) / B[i, p]
+    x = w
+    for i in range(n - 1, -1, -1):
+        m = min(p, n - 1 - i)
+        r = np.arange(1, m + 1)
+        x[i] -= np.dot(B[i + r, p - r], x[i + r])
+    return x
+
+
+def _fatorar_cholesky_banda(B, p):
+    """Cholesky no armazenamento em banda inferior (n x (p+1)); retorna a etapa que falhou."""
+    n = B.shape[0]
+    for k in range(n):
+        if B[k, p] <= 0:
+            return k
+        B[k, p] = np.sqrt(B[k, p])
+        m = min(p, n - 1 - k)
+        if m == 0:
+            continue
+        r = np.arange(1, m + 1)
+        B[k + r, p - r] /= B[k, p]
+        l = B[k + r, p - r]
+        # atualização do bloco triangular inferior à direita do pivô
+        ri, si = np.tril_indices(m)
+        B[k + 1 + ri, p - ri + si] -= l[ri] * l[si]
+    return None
+
+
+def _resolver_cholesky_banda(B, p, b):
+    """Resolve L y = b e L^T x = y com L em banda inferior."""
+    n = B.shape[0]
+    y = b.copy()
+    for i in range(n):
+        m = min(p, i)
+        y[i] = (y[i] - np.dot(B[i, p - m:p], y[i - m:i])) / B[i, p]
+    x = y
+    for i in range(n - 1, -1, -1):
+        m = min(p, n - 1 - i)
+        r = np.arange(1, m + 1)
+        x[i] = (x[i] - np.dot(B[i + r, p - r], x[i + r])) / B[i, p]
+    return x
+
+
+def thomas(A, b, retornar_passos=False, diagnosticos=False, **kwargs):
+    inicio = time.time()
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float).reshape(-1)
+    passos = {"matrizes": [], "acoes": []}
+
+    if not eh_quadrada(A) or A.shape[0] != b.shape[0]:
+        status = "ERRO: A não é quadrada ou dimensões incompatíveis com b."
+        return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+
+    p, q = largura_banda(A)
+    if p > 1 or q > 1:
+        status = f"ERRO: A não é tridiagonal (banda inferior {p}, superior {q})."
+        return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+
+    n = A.shape[0]
+    inferior = np.concatenate(([0.0], np.diagonal(A, -1)))
+    superior = np.concatenate((np.diagonal(A, 1), [0.0]))
+    x = resolver_tridiagonal(inferior, np.diagonal(A).copy(), superior, b)
+    if x is None:
+        status = "ERRO: Pivô zero no algoritmo de Thomas — pivoteamento necessário."
+        return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+    passos["acoes"].append(f"Sistema tridiagonal de ordem {n} resolvido")
+
+    tempo = time.time() - inicio
+    status = "Sucesso (Algoritmo de Thomas — tridiagonal)."
+    if diagnosticos:
+        status = _anexar_diagnosticos(status, passos, diagnosticar(A, b, x))
+    return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
+
+
+def lu_banda(A, b, retornar_passos=False, diagnosticos=False, **kwargs):
+    inicio = time.time()
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float).reshape(-1)
+    passos = {"matrizes": [], "acoes": []}
+
+    if not eh_quadrada(A) or A.shape[0] != b.shape[0]:
+        status = "ERRO: A não é quadrada ou dimensões incompatíveis com b."
+        return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+
+    p, q = largura_banda(A)
+    passos["acoes"].append(f"Banda detectada: inferior {p}, superior {q}")
+    B = _armazenar_banda(A, p, q)
+    etapa = _fatorar_lu_banda(B, p, q)
+    if etapa is not None:
+        status = f"ERRO: Pivô zero em U[{etapa},{etapa}] — LU em banda não pivoteia."
+        return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+    x = _resolver_lu_banda(B, p, q, b)
+
+    tempo = time.time() - inicio
+    status = f"Sucesso (Fatoração LU em banda, p={p}, q={q})."
+    if diagnosticos:
+        resolvedores = (lambda y: _resolver_lu_banda(B, p, q, y),
+                        lambda y: _resolver_lu_banda_transposta(B, p, q, y))
+        status = _anexar_diagnosticos(status, passos, diagnosticar(A, b, x, *resolvedores))
+    return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
+
+
+def cholesky_banda(A, b, retornar_passos=False, diagnosticos=False, **kwargs):
+    inicio = time.time()
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float).reshape(-1)
+    passos = {"matrizes": [], "acoes": []}
+
+    if not eh_quadrada(A) or A.shape[0] != b.shape[0]:
+        status = "ERRO: A não é quadrada ou dimensões incompatíveis com b."
+        return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+    if not np.allclose(A, A.T):
+        status = "ERRO: Cholesky em banda exige matriz simétrica."
+        return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+
+    p, _ = largura_banda(A)
+    passos["acoes"].append(f"Banda detectada: {p} diagonais abaixo da principal")
+    B = _armazenar_banda(A, p, 0)
+    etapa = _fatorar_cholesky_banda(B, p)
+    if etapa is not None:
+        status = f"ERRO: Cholesky não aplicável — matriz não é definida positiva (etapa {etapa})."
+        return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+    x = _resolver_cholesky_banda(B, p, b)
+
+    tempo = time.time() - inicio
+    status = f"Sucesso (Fatoração de Cholesky em banda, p={p})."
+    if diagnosticos:
+        resolver = lambda y: _resolver_cholesky_banda(B, p, y)
+        status = _anexar_diagnosticos(status, passos, diagnosticar(A, b, x, resolver, resolver))
+    return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
+
+
+def metodo_para_banda(A, info=None):
+    """Escolhe o solver em banda adequado para A, ou None se A não tem banda estreita.
+
+    Os solvers em banda não pivoteiam: só são indicados com diagonal
+    estritamente dominante (por linhas ou por colunas) ou com A simétrica
+    definida positiva (Cholesky). Nos demais casos retorna None e fica o
+    pivoteamento parcial. `info` (de analisar_matriz) evita refazer as
+    verificações; sem ele, a definida positiva é testada pela própria
+    fatoração de Cholesky em banda, O(n p²).
+    """
+    A = np.asarray(A, dtype=float)
+    if not eh_banda_estreita(A):
+        return None
+    p, q = largura_banda(A)
+    diagonal = np.abs(np.diag(A))
+    absoluta = np.abs(A)
+    dominante = (bool(np.all(diagonal > absoluta.sum(axis=1) - diagonal))
+                 or bool(np.all(diagonal > absoluta.sum(axis=0) - diagonal)))
+    if info is not None:
+        definida_positiva = info["definida_positiva"]
+    else:
+        definida_positiva = (p == q and np.allclose(A, A.T) and bool(np.all(np.diag(A) > 0))
+                             and _fatorar_cholesky_banda(_armazenar_banda(A, p, 0), p) is None)
+    if not (dominante or definida_positiva):
+        return None
+    if p <= 1 and q <= 1:
+        return "Tridiagonal - Thomas"
+    if definida_positiva:
+        return "Cholesky em banda"
+    return "LU em banda"
+
+# ---------------------------------------------------------------
+# Sistemas esparsos — LU e Cholesky com reordenação RCM
+#
+# Fase simbólica: ordenação Cuthill-McKee reversa sobre o padrão de
+# A + A^T, larguras de banda resultantes e os índices que levam cada
+# não nulo de A para o armazenamento em banda. Fase numérica: espalha
+# os valores e fatora com as rotinas em banda acima.
+#
+# A análise simbólica fica em cache, indexada pelo padrão de não nulos:
+# quando só os valores de A mudam (passos de tempo, por exemplo), ela é
+# reaproveitada e só a fase numérica é refeita.
+# ---------------------------------------------------------------
+
+LIMITE_CACHE_ANALISES = 8  # análises simbólicas mantidas em memória
+_analises = {}
+
+
+def _tem_triplas(A):
+    """A é uma matriz esparsa em triplas (linhas, colunas, valores), como matriz_esparsa.MatrizEsparsa?"""
+    return all(hasattr(A, nome) for nome in ("linhas", "colunas", "valores", "shape"))
+
+
+def _triplas(A):
+    """(linhas, colunas, valores planos, n) de A densa ou esparsa em triplas.
+
+    Os índices de "origem" da análise simbólica apontam para os valores
+    planos: A.ravel() na densa, A.valores na esparsa.
+    """
+    if _tem_triplas(A):
+        return np.asarray(A.linhas), np.asarray(A.colunas), np.asarray(A.valores, dtype=float), A.shape[0]
+    A = np.asarray(A)
+    linhas, colunas = np.nonzero(A)
+    return linhas, colunas, A.ravel(), A.shape[0]
+
+
+def _chave_padrao(A):
+    """Hash do padrão de não nulos (e da ordem) de A."""
+    if _tem_triplas(A):
+        resumo = hashlib.sha1(b"triplas" + str(A.shape).encode())
+        resumo.update(np.ascontiguousarray(A.linhas).tobytes())
+        resumo.update(np.ascontiguousarray(A.colunas).tobytes())
+        return resumo.hexdigest()
+    return hashlib.sha1(np.packbits(A != 0).tobytes() + str(A.shape).encode()).hexdigest()
+
+
+def _niveis_bfs(vizinhos, inicio, disponivel):
+    """Estrutura de níveis da busca em largura a partir de inicio (só nós disponíveis)."""
+    visto = {inicio}
+    niveis = [[inicio]]
+    while True:
+        proximo = []
+        for no in niveis[-1]:
+            for v in vizinhos[no]:
+                if disponivel[v] and v not in visto:
+                    visto.add(v)
+                    proximo.append(v)
+        if not proximo:
+            return niveis
+        niveis.append(proximo)
+
+
+def ordenacao_rcm(A):
+    """Permutação Cuthill-McKee reversa de A (vetor perm: nova posição k ← índice perm[k])."""
+    linhas, colunas, _, n = _triplas(A)
+    # padrão de A + A^T, sem a diagonal, como listas de vizinhos em ordem crescente
+    fora = linhas != colunas
+    pares = np.unique(np.concatenate([linhas[fora] * n + colunas[fora], colunas[fora] * n + linhas[fora]]))
+    grau = np.bincount(pares // n, minlength=n)
+    vizinhos = np.split(pares % n, np.cumsum(grau)[:-1])
+    vizinhos = [v[np.argsort(grau[v], kind="stable")].tolist() for v in vizinhos]
+
+    disponivel = np.ones(n, dtype=bool)
+    ordem = []
+    while len(ordem) < n:
+        # nó pseudo-periférico da componente (heurística de George e Liu)
+        candidatos = np.flatnonzero(disponivel)
+        inicio = int(candidatos[np.argmin(grau[candidatos])])
+        niveis = _niveis_bfs(vizinhos, inicio, disponivel)
+        while True:
+            ultimo = min(niveis[-1], key=lambda v: grau[v])
+            novos_niveis = _niveis_bfs(vizinhos, ultimo, disponivel)
+            if len(novos_niveis) <= len(niveis):
+                break
+            inicio, niveis = ultimo, novos_niveis
+
+        # Cuthill-McKee: vizinhos ainda não numerados, em ordem crescente de grau
+        disponivel[inicio] = False
+        fila = [inicio]
+        cabeca = 0
+        while cabeca < len(fila):
+            no = fila[cabeca]
+            cabeca += 1
+            for v in vizinhos[no]:
+                if disponivel[v]:
+                    disponivel[v] = False
+                    fila.append(v)
+        ordem.extend(fila)
+    return np.array(ordem[::-1], dtype=int)
+
+
+def analise_simbolica(A):
+    """Fase simbólica: ordenação RCM, larguras de banda e índices de espalhamento.
+
+    A pode ser densa ou esparsa em triplas (MatrizEsparsa), sem formar a densa.
+    """
+    if not _tem_triplas(A):
+        A = np.asarray(A)
+    linhas, colunas, _, n = _triplas(A)
+    perm = ordenacao_rcm(A)
+    inversa = np.empty(n, dtype=int)
+    inversa[perm] = np.arange(n)
+
+    origem = np.arange(linhas.size) if _tem_triplas(A) else linhas * n + colunas
+    li, ci = inversa[linhas], inversa[colunas]
+    p = int(max(0, (li - ci).max(initial=0)))
+    q = int(max(0, (ci - li).max(initial=0)))
+    inferior = li >= ci
+    return {
+        "n": n,
+        "perm": perm,
+        "p": p,
+        "q": q,
+        "banda_original": (int(max(0, (linhas - colunas).max(initial=0))),
+                           int(max(0, (colunas - linhas).max(initial=0)))),
+        "nnz": int(linhas.size),
+        "chave": _chave_padrao(A),
+        # posições nos valores planos de A e no armazenamento em banda (LU: n x (p+q+1); Cholesky: n x (p+1))
+        "origem": origem,
+        "destino": li * (p + q + 1) + (ci - li + p),
+        "origem_inferior": origem[inferior],
+        "destino_inferior": li[inferior] * (p + 1) + (ci[inferior] - li[inferior] + p),
+    }
+
+
+def obter_analise(A):
+    """Retorna (análise, reaproveitada): busca no cache pelo padrão de não nulos de A."""
+    chave = _chave_padrao(A)
+    if chave in _analises:
+        return _analises[chave], True
+    analise = analise_simbolica(A)
+    if len(_analises) >= LIMITE_CACHE_ANALISES:
+        del _analises[next(iter(_analises))]
+    _analises[chave] = analise
+    return analise, False
+
+
+def _analise_compativel(A, analise):
+    """A (esparsa em triplas) tem exatamente o padrão de não nulos da análise?"""
+    return analise["n"] == A.shape[0] and analise["nnz"] == A.nnz and analise["chave"] == _chave_padrao(A)
+
+
+def _fatorar_esparsa(A, analise, cholesky=False):
+    """Fase numérica: espalha os valores de A na banda permutada e fatora. Retorna (B, etapa)."""
+    n, p, q = analise["n"], analise["p"], analise["q"]
+    valores = _triplas(A)[2]
+    if cholesky:
+        B = np.zeros((n, p + 1))
+        B.ravel()[analise["destino_inferior"]] = valores[analise["origem_inferior"]]
+        return B, _fatorar_cholesky_banda(B, p)
+    B = np.zeros((n, p + q + 1))
+    B.ravel()[analise["destino"]] = valores[analise["origem"]]
+    return B, _fatorar_lu_banda(B, p, q)
+
+
+def _permutado(resolver, perm):
+    """Resolve no sistema original a partir de um resolvedor de P A P^T."""
+    def resolver_original(y):
+        x = np.empty_like(y, dtype=float)
+        x[perm] = resolver(np.array(y, dtype=float)[perm])
+        return x
+    return resolver_original
+
+
+def _simetrica_triplas(A):
+    """A (esparsa em triplas) é simétrica? Compara A - A^T nas triplas."""
+    diferenca = A - A.T
+    return diferenca.nnz == 0 or np.abs(diferenca.valores).max() <= 1e-8 * max(1.0, np.abs(A.valores).max())
+
+
+def _resolver_esparsa(A, b, analise, cholesky, retornar_passos, diagnosticos):
+    inicio = time.time()
+    # tudo nas triplas: a densa nunca é formada (densa na entrada só é convertida)
+    A = como_esparsa(A)
+    b = np.array(b, dtype=float).reshape(-1)
+    passos = {"matrizes": [], "acoes": []}
+    nome = "Cholesky esparsa" if cholesky else "LU esparsa"
+
+    if A.shape[0] != A.shape[1] or A.shape[0] != b.shape[0]:
+        status = "ERRO: A não é quadrada ou dimensões incompatíveis com b."
+        return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+    if cholesky and not _simetrica_triplas(A):
+        status = "ERRO: Cholesky esparsa exige matriz simétrica."
+        return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+
+    if analise is not None and not _analise_compativel(A, analise):
+        passos["acoes"].append("Análise fornecida não cobre o padrão de A; refazendo a fase simbólica")
+        analise = None
+    if analise is None:
+        analise, reaproveitada = obter_analise(A)
+    else:
+        reaproveitada = True
+    p, q = analise["p"], analise["q"]
+    p0, q0 = analise["banda_original"]
+    passos["analise"] = analise
+    passos["acoes"].append(("Análise simbólica reaproveitada (mesmo padrão de não nulos)" if reaproveitada
+                            else "Análise simbólica calculada") + f": {analise['nnz']} não nulos")
+    passos["acoes"].append(f"Ordenação RCM: banda inferior/superior {p0}/{q0} → {p}/{q}")
+
+    B, etapa = _fatorar_esparsa(A, analise, cholesky)
+    if etapa is not None:
+        if cholesky:
+            status = f"ERRO: Cholesky não aplicável — matriz não é definida positiva (etapa {etapa} da ordem RCM)."
+        else:
+            status = f"ERRO: Pivô zero em U[{etapa},{etapa}] (ordem RCM) — LU esparsa não pivoteia."
+        return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+
+    if cholesky:
+        resolver = _permutado(lambda y: _resolver_cholesky_banda(B, p, y), analise["perm"])
+        resolver_transposta = resolver
+    else:
+        resolver = _permutado(lambda y: _resolver_lu_banda(B, p, q, y), analise["perm"])
+        resolver_transposta = _permutado(lambda y: _resolver_lu_banda_transposta(B, p, q, y), analise["perm"])
+    x = resolver(b)
+
+    tempo = time.time() - inicio
+    status = f"Sucesso ({nome} com ordenação RCM, p={p}, q={q})."
+    if diagnosticos:
+        status = _anexar_diagnosticos(status, passos, diagnosticar(A, b, x, resolver, resolver_transposta))
+    return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
+
+
+def lu_esparsa(A, b, retornar_passos=False, analise=None, diagnosticos=False, **kwargs):
+    return _resolver_esparsa(A, b, analise, False, retornar_passos, diagnosticos)
+
+
+def cholesky_esparsa(A, b, retornar_passos=False, analise=None, diagnosticos=False, **kwargs):
+    return _resolver_esparsa(A, b, analise, True, retornar_passos, diagnosticos)
+
+
+def metodo_esparso(A, info=None):
+    """Solver esparso adequado para A, ou None se A não é esparsa ou o RCM não deixa a banda estreita."""
+    A = np.asarray(A)
+    info = analisar_matriz(A) if info is None else info
+    if info["densidade"] > LIMITE_ESPARSIDADE or not (info["definida_positiva"] or info["diagonal_dominante"]):
+        return None
+    # mesma forma (triplas) que lu_esparsa/cholesky_esparsa usam: a análise fica no cache para a solução
+    analise, _ = obter_analise(como_esparsa(A))
+    if analise["p"] + analise["q"] + 1 > max(3, int(0.1 * info["n"])):
+        return None
+    return "Cholesky esparsa (RCM)" if info["definida_positiva"] else "LU esparsa (RCM)"
+
+# ---------------------------------------------------------------
+# Fatoração em blocos (tiles) com escalonador de tarefas
+#
+# A é dividida em blocos b x b. Fatoração do painel, soluções
+# triangulares e atualizações do restante da matriz viram tarefas de
+# um GrafoTarefas (escalonador_tarefas), executadas num pool de
+# threads conforme as dependências entre blocos. Os produtos de
+# matrizes do NumPy liberam o GIL, então as tarefas rodam em paralelo.
+# (Se o BLAS também usar várias threads, convém limitá-lo, por exemplo
+# com OMP_NUM_THREADS=1, para não disputar os núcleos.)
+# ---------------------------------------------------------------
+
+TAMANHO_BLOCO = 256
+BLOCO_PAINEL = 32  # sub-blocos da fatoração de cada painel
+
+
+def _fatias_blocos(n, tamanho_bloco):
+    return [slice(i, min(i + tamanho_bloco, n)) for i in range(0, n, tamanho_bloco)]
+
+
+def _fatorar_painel(P, inicio=0):
+    """LU com pivoteamento parcial de um painel alto P (m x w, m >= w), no lugar.
+
+    Retorna as trocas de linhas em ordem, como pares (inicio + c, inicio + p).
+    O painel também é blocado: as atualizações de posto 1 ficam dentro de
+    sub-blocos de BLOCO_PAINEL colunas e o resto é atualizado com GEMM.
+    """
+    trocas = []
+    w = P.shape[1]
+    for c0 in range(0, w, BLOCO_PAINEL):
+        c1 = min(c0 + BLOCO_PAINEL, w)
+        for c in range(c0, c1):
+            p = int(np.argmax(np.abs(P[c:, c]))) + c
+            if abs(P[p, c]) < EPS:
+                raise np.linalg.LinAlgError(f"Pivô zero (ou quase) na coluna {inicio + c}.")
+            if p != c:
+                P[[c, p], :] = P[[p, c], :]
+            trocas.append((inicio + c, inicio + p))
+            P[c + 1:, c] /= P[c, c]
+            P[c + 1:, c + 1:c1] -= np.outer(P[c + 1:, c], P[c, c + 1:c1])
+        if c1 < w:
+            L11 = np.tril(P[c0:c1, c0:c1], -1) + np.eye(c1 - c0)
+            P[c0:c1, c1:] = np.linalg.solve(L11, P[c0:c1, c1:])
+            P[c1:, c1:] -= P[c1:, c0:c1] @ P[c0:c1, c1:]
+    return trocas
+
+
+def _fatorar_lu_blocos(A, tamanho_bloco=TAMANHO_BLOCO, threads=None):
+    """LU com pivoteamento parcial por painéis, no lugar de A. Retorna (perm, estatísticas): A[perm] = LU."""
+    from escalonador_tarefas import GrafoTarefas
+
+    n = A.shape[0]
+    fatias = _fatias_blocos(n, tamanho_bloco)
+    nb = len(fatias)
+    trocas = {}     # painel k -> lista de trocas de linhas (globais), em ordem
+    inversas = {}   # painel k -> inversa do bloco L_kk (unitário inferior)
+    grafo = GrafoTarefas()
+
+    def painel(k):
+        P = A[fatias[k].start:, fatias[k]]
+        trocas[k] = _fatorar_painel(P, fatias[k].start)
+        w = P.shape[1]
+        inversas[k] = np.linalg.inv(np.tril(P[:w, :w], -1) + np.eye(w))
+
+    def trocar_e_resolver(k, j):
+        # aplica as trocas do painel k ao bloco-coluna j e, à direita do painel, U_kj = L_kk^{-1} A_kj
+        colunas = fatias[j]
+        for a, b in trocas[k]:
+            if a != b:
+                A[[a, b], colunas] = A[[b, a], colunas]
+        if j > k:
+            A[fatias[k], colunas] = inversas[k] @ A[fatias[k], colunas]
+
+    def atualizar(k, i, j):
+        A[fatias[i], fatias[j]] -= A[fatias[i], fatias[k]] @ A[fatias[k], fatias[j]]
+
+    for k in range(nb):
+        grafo.adicionar(lambda k=k: painel(k), [(i, k) for i in range(k, nb)], [(i, k) for i in range(k, nb)],
+                        nome=f"painel {k}")
+        for j in range(nb):
+            if j != k:
+                grafo.adicionar(lambda k=k, j=j: trocar_e_resolver(k, j),
+                                [(k, k)] + [(i, j) for i in range(k, nb)], [(i, j) for i in range(k, nb)],
+                                nome=f"trocas/trsm {k},{j}")
+        for i in range(k + 1, nb):
+            for j in range(k + 1, nb):
+                grafo.adicionar(lambda k=k, i=i, j=j: atualizar(k, i, j), [(i, k), (k, j), (i, j)], [(i, j)],
+                                nome=f"gemm {k}: {i},{j}")
+
+    estatisticas = grafo.executar(threads)
+    perm = np.arange(n)
+    for k in range(nb):
+        for a, b in trocas[k]:
+            perm[[a, b]] = perm[[b, a]]
+    return perm, estatisticas
+
+
+def _fatorar_cholesky_blocos(A, tamanho_bloco=TAMANHO_BLOCO, threads=None):
+    """Cholesky por blocos no triângulo inferior de A (no lugar). Retorna as estatísticas do grafo."""
+    from escalonador_tarefas import GrafoTarefas
+
+    fatias = _fatias_blocos(A.shape[0], tamanho_bloco)
+    nb = len(fatias)
+    inversas = {}
+    grafo = GrafoTarefas()
+
+    def potrf(k):
+        L = np.linalg.cholesky(A[fatias[k], fatias[k]])
+        A[fatias[k], fatias[k]] = L
+        # L_kk é bem condicionado (cond(L_kk)² = cond(A_kk)); usar a inversa troca o TRSM por um GEMM
+        inversas[k] = np.linalg.inv(L)
+
+    def trsm(k, i):
+        A[fatias[i], fatias[k]] = A[fatias[i], fatias[k]] @ inversas[k].T
+
+    def atualizar(k, i, j):
+        A[fatias[i], fatias[j]] -= A[fatias[i], fatias[k]] @ A[fatias[j], fatias[k]].T
+
+    for k in range(nb):
+        grafo.adicionar(lambda k=k: potrf(k), [(k, k)], [(k, k)], nome=f"potrf {k}")
+        for i in range(k + 1, nb):
+            grafo.adicionar(lambda k=k, i=i: trsm(k, i), [(k, k), (i, k)], [(i, k)], nome=f"trsm {i},{k}")
+        for i in range(k + 1, nb):
+            for j in range(k + 1, i + 1):
+                grafo.adicionar(lambda k=k, i=i, j=j: atualizar(k, i, j), [(i, k), (j, k), (i, j)], [(i, j)],
+                                nome=f"syrk/gemm {k}: {i},{j}")
+
+    return grafo.executar(threads)
+
+
+def lu_blocos(A, b, retornar_passos=False, tamanho_bloco=TAMANHO_BLOCO, threads=None, diagnosticos=False, **kwargs):
+    inicio = time.time()
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float).reshape(-1)
+    passos = {"matrizes": [], "acoes": []}
+
+    if not eh_quadrada(A) or A.shape[0] != b.shape[0]:
+        status = "ERRO: A não é quadrada ou dimensões incompatíveis com b."
+        return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+
+    LU = A.copy()
+    try:
+        perm, estatisticas = _fatorar_lu_blocos(LU, tamanho_bloco, threads)
+    except np.linalg.LinAlgError as e:
+        status = f"ERRO: {e} Matriz singular."
+        return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+    passos["acoes"].append(f"{estatisticas['tarefas']} tarefas em {estatisticas['threads']} threads "
+                           f"(blocos de {tamanho_bloco}); fatoração em {estatisticas['tempo']:.4f} s")
+
+    resolver, resolver_transposta = _resolvedores_lu(np.tril(LU, -1) + np.eye(LU.shape[0]), np.triu(LU), linhas=perm)
+    x = resolver(b)
+
+    tempo = time.time() - inicio
+    status = f"Sucesso (LU em blocos com pivoteamento parcial, {estatisticas['threads']} threads)."
+    if diagnosticos:
+        status = _anexar_diagnosticos(status, passos, diagnosticar(A, b, x, resolver, resolver_transposta))
+    return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
+
+
+def cholesky_blocos(A, b, retornar_passos=False, tamanho_bloco=TAMANHO_BLOCO, threads=None, diagnosticos=False, **kwargs):
+    inicio = time.time()
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float).reshape(-1)
+    passos = {"matrizes": [], "acoes": []}
+
+    if not eh_quadrada(A) or A.shape[0] != b.shape[0]:
+        status = "ERRO: A não é quadrada ou dimensões incompatíveis com b."
+        return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+    if not np.allclose(A, A.T):
+        status = "ERRO: Cholesky em blocos exige matriz simétrica."
+        return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+
+    L = A.copy()
+    try:
+        estatisticas = _fatorar_cholesky_blocos(L, tamanho_bloco, threads)
+    except np.linalg.LinAlgError:
+        status = "ERRO: Cholesky não aplicável — matriz não é definida positiva."
+        return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+    L = np.tril(L)
+    passos["acoes"].append(f"{estatisticas['tarefas']} tarefas em {estatisticas['threads']} threads "
+                           f"(blocos de {tamanho_bloco}); fatoração em {estatisticas['tempo']:.4f} s")
+
+    resolver, _ = _resolvedores_lu(L, L.T)
+    x = resolver(b)
+
+    tempo = time.time() - inicio
+    status = f"Sucesso (Cholesky em blocos, {estatisticas['threads']} threads)."
+    if diagnosticos:
+        status = _anexar_diagnosticos(status, passos, diagnosticar(A, b, x, resolver, resolver))
+    return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
+
+# ---------------------------------------------------------------
+# Mínimos quadrados — QR de Householder (A retangular m x n, m ≥ n)
+#
+# min ||A x - b||₂: A = Q R com reflexões de Householder aplicadas
+# também a b (Q não é formada); x sai de R x = (Qᵀb)[:n] e a norma do
+# resíduo é ||(Qᵀb)[n:]||₂. Para dados que chegam aos poucos, ver
+# minimos_quadrados_incremental.py (rotações de Givens sobre R).
+# ---------------------------------------------------------------
+
+def _qr_householder(A, b):
+    """Triangulariza [A | b] por Householder. Retorna (R n x n, Qᵀb) ou (None, coluna) se A não tiver posto completo."""
+    m, n = A.shape
+    R = np.array(A, dtype=float)
+    c = np.array(b, dtype=float)
+    escala = max(np.abs(R).max(), EPS)
+    for k in range(n):
+        x = R[k:, k]
+        norma = np.linalg.norm(x)
+        if norma <= 1e-14 * escala * np.sqrt(m):
+            return None, k
+        v = x.copy()
+        v[0] += np.copysign(norma, x[0])
+        beta = 2.0 / np.dot(v, v)
+        R[k:, k:] -= beta * np.outer(v, v @ R[k:, k:])
+        c[k:] -= beta * v * np.dot(v, c[k:])
+    return np.triu(R[:n]), c
+
+
+def minimos_quadrados(A, b, retornar_passos=False, diagnosticos=False, **kwargs):
+    inicio = time.time()
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float).reshape(-1)
+    passos = {"matrizes": [], "acoes": []}
+
+    if A.ndim != 2 or A.shape[0] != b.shape[0]:
+        status = "ERRO: dimensões de A e b incompatíveis."
+        return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+    m, n = A.shape
+    if m < n:
+        status = f"ERRO: sistema subdeterminado (m={m} < n={n}); mínimos quadrados exige m ≥ n."
+        return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+
+    R, c = _qr_householder(A, b)
+    if R is None:
+        status = f"ERRO: A não tem posto completo de colunas (coluna {c} dependente das anteriores)."
+        return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+    x = _substituicao_regressiva(R, c[:n])
+    norma_residuo = float(np.linalg.norm(c[n:]))
+    passos["R"] = R
+    passos["norma_residuo"] = norma_residuo
+    passos["acoes"].append(f"QR de Householder: {n} reflexões sobre [A | b] ({m} x {n + 1})")
+
+    tempo = time.time() - inicio
+    status = f"Sucesso (mínimos quadrados por QR de Householder, {m} x {n}; ||Ax - b||₂ = {norma_residuo:.3e})."
+    if diagnosticos:
+        passos["condicionamento_2"] = float(np.linalg.cond(R))
+        status += f" κ₂(A) = {passos['condicionamento_2']:.3e}."
+    return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
+
 # ---------------------------------------------------------------
 # Métodos iterativos — Gauss-Jacobi e Gauss-Seidel
 # ---------------------------------------------------------------
 
-def gauss_jacobi(A, b, x0=None, tol=1e-8, max_iter=100, retornar_passos=False, registrar_iteracoes=False, **kwargs):
+JANELA_MONITOR = 10  # iterações usadas para medir a taxa de redução durante a execução
+LIMIAR_DIVERGENCIA = 1.05  # taxa (ou raio estimado) a partir da qual a iteração é tratada como divergente
+CRESCIMENTO_DIVERGENCIA = 1e6  # crescimento de max|Δx| exigido para confirmar a divergência durante a execução
+PASSOS_CONFIRMACAO_MAX = 400  # teto de passos de potência para confirmar a divergência antes de iterar
+
+
+def _linha_diagonal_nula(A):
+    """Primeira linha com zero na diagonal, ou None."""
+    nulas = np.flatnonzero(np.abs(np.diag(A)) < EPS)
+    return int(nulas[0]) if nulas.size else None
+
+
+def _varredura_seidel(A, b, x, omega=1.0, reversa=False):
+    """Uma varredura de Gauss-Seidel (SOR quando omega != 1), feita no lugar.
+
+    Retorna max|Δx| da varredura, dispensando a cópia x_ant.
+    """
+    n = b.shape[0]
+    diagonal = A.diagonal()
+    diferenca = 0.0
+    for i in (range(n - 1, -1, -1) if reversa else range(n)):
+        # x_gs - x[i] = (b[i] - A[i]·x) / A[i, i]: um único produto, sem fatias
+        delta = omega * (b[i] - np.dot(A[i], x)) / diagonal[i]
+        x[i] += delta
+        if abs(delta) > diferenca:
+            diferenca = abs(delta)
+    return diferenca
+
+
+def _max_abs_diferenca(x, y, auxiliar):
+    """max|x - y| usando `auxiliar` como área de trabalho (sem alocar)."""
+    np.subtract(x, y, out=auxiliar)
+    np.abs(auxiliar, out=auxiliar)
+    return float(auxiliar.max())
+
+
+def estimar_raio_espectral(A, metodo="jacobi", passos=20, semente=0):
+    """Estima o raio espectral da matriz de iteração de Jacobi ou Gauss-Seidel.
+
+    Usa iteração de potência sem formar a matriz de iteração; o raio é a
+    média geométrica do crescimento de ||T^k v|| na segunda metade dos
+    passos, o que também funciona quando o autovalor dominante é complexo.
+    Retorna inf se a diagonal tiver zeros.
+    """
+    A = np.asarray(A, dtype=float)
+    D = np.diag(A)
+    if np.any(np.abs(D) < EPS):
+        return np.inf
+
+    if metodo == "jacobi":
+        R = A - np.diagflat(D)
+        aplicar = lambda v: -np.dot(R, v) / D
+    else:
+        DL = np.tril(A)
+        U = np.triu(A, 1)
+        aplicar = lambda v: -_substituicao_progressiva(DL, np.dot(U, v))
+    return _estimar_raio(aplicar, A.shape[0], passos, semente)
+
+
+def _estimar_raio(aplicar, n, passos=20, semente=0):
+    """Iteração de potência de estimar_raio_espectral para um operador v ↦ T v qualquer."""
+    v = np.random.default_rng(semente).standard_normal(n)
+    v /= np.linalg.norm(v)
+    soma_logs = 0.0
+    contados = 0
+    for k in range(passos):
+        w = aplicar(v)
+        norma = np.linalg.norm(w)
+        if norma == 0.0 or not np.isfinite(norma):
+            return 0.0 if norma == 0.0 else np.inf
+        if k >= passos // 2:
+            soma_logs += np.log(norma)
+            contados += 1
+        v = w / norma
+    return float(np.exp(soma_logs / contados))
+
+
+def _prever_convergencia(A, metodo, nome, passos):
+    """Pré-verificação: retorna um status de aborto só quando a divergência é certa.
+
+    A estimativa curta do raio espectral pode passar de 1 em matrizes não
+    normais que convergem (crescimento transitório, p. ex. I + 1,5·superdiagonal,
+    nilpotente). Por isso ela só aborta se passar de LIMIAR_DIVERGENCIA e for
+    confirmada com até PASSOS_CONFIRMACAO_MAX passos de potência. Com A
+    simétrica não há transitório e a confirmação sempre vale; nas demais,
+    se esses passos não chegam a passar do transitório (2n), o aviso fica
+    só como informação e a divergência é decidida pelo monitoramento
+    durante a execução, que ignora as primeiras n iterações.
+    """
+    n = A.shape[0]
+    diagonal = np.abs(np.diag(A))
+    if np.all(diagonal > np.abs(A).sum(axis=1) - diagonal):
+        # ||T||∞ < 1: as diferenças caem desde a primeira iteração, sem transitório
+        passos["transiente"] = 0
+        passos["acoes"].append("Diagonal estritamente dominante — convergência garantida.")
+        return None
+    simetrica = bool(np.allclose(A, A.T))
+    # matriz de iteração semelhante a uma normal (A simétrica): a taxa observada vale desde o início
+    passos["transiente"] = 0 if simetrica else n
+    raio = estimar_raio_espectral(A, metodo=metodo)
+    passos["acoes"].append(f"Raio espectral estimado da matriz de iteração: {raio:.4f}")
+    if np.isfinite(raio) and raio > LIMIAR_DIVERGENCIA:
+        passos_confirmacao = min(2 * n + 20, PASSOS_CONFIRMACAO_MAX)
+        if not simetrica and passos_confirmacao < 2 * n + 20:
+            passos["acoes"].append("Possível divergência (estimativa ≥ 1 ainda no transitório); "
+                                   "confirmada ou não durante a execução.")
+            return None
+        raio = estimar_raio_espectral(A, metodo=metodo, passos=passos_confirmacao)
+        passos["acoes"].append(f"Raio espectral após {passos_confirmacao} passos: {raio:.4f}")
+        if raio > LIMIAR_DIVERGENCIA:
+            passos["raio_espectral"] = raio
+            return (f"Atenção: não converge — raio espectral estimado {raio:.4f} ≥ 1; "
+                    f"execução abortada antes de iterar ({nome}).")
+    passos["raio_espectral"] = raio
+    if 0.0 < raio < 1.0:
+        passos["acoes"].append(f"Redução esperada de ~{-np.log10(raio):.3g} dígitos por iteração.")
+    return None
+
+
+def _monitorar_convergencia(diferencas, tol, max_iter, nome, raio=None, transiente=0):
+    """Acompanha a taxa de redução de ||x_k - x_(k-1)|| e projeta as iterações restantes.
+
+    Retorna um status de aborto quando a iteração diverge ou quando a
+    projeção excede max_iter; caso contrário, None. Nas primeiras
+    `transiente` iterações (n, sem dominância diagonal nem simetria) a
+    taxa observada não vale: matrizes não normais podem estacionar perto de 1 ou até
+    crescer antes de convergir, então só valores não finitos abortam.
+    Depois, diverge quem cresce a uma taxa acima de LIMIAR_DIVERGENCIA e
+    já cresceu CRESCIMENTO_DIVERGENCIA vezes a menor diferença vista
+    (estacionar em ≈ 1, ou crescer um pouco e voltar a cair, não é
+    divergência). A projeção, feita só com as diferenças caindo, usa a
+    menor entre a taxa observada e o raio espectral estimado.
+    """
+    k = len(diferencas)
+    atual = diferencas[-1] if k else 0.0
+    if not np.isfinite(atual):
+        return f"Atenção: iteração divergiu para valores não finitos após {k} iterações ({nome})."
+    if k <= max(JANELA_MONITOR, transiente):
+        return None
+    anterior = diferencas[-1 - JANELA_MONITOR]
+    if anterior == 0.0:
+        return None
+    taxa = (atual / anterior) ** (1.0 / JANELA_MONITOR)
+    if taxa > LIMIAR_DIVERGENCIA and atual > CRESCIMENTO_DIVERGENCIA * min(diferencas):
+        return (f"Atenção: divergindo (taxa de crescimento {taxa:.4f} > 1); "
+                f"abortado após {k} iterações ({nome}).")
+    # projeção só com as diferenças de fato caindo (ainda crescendo, a taxa não diz nada)
+    if taxa >= 1.0 or raio is None or not 0.0 < raio < 1.0:
+        return None
+    taxa = min(taxa, raio)
+    projecao = k + int(np.ceil(np.log(tol / atual) / np.log(taxa)))
+    if projecao > max_iter:
+        return (f"Atenção: convergência lenta (taxa {taxa:.4f}); seriam necessárias ~{projecao} "
+                f"iterações (máximo {max_iter}); abortado após {k} iterações ({nome}).")
+    return None
+
+
+def gauss_jacobi(A, b, x0=None, tol=1e-8, max_iter=100, retornar_passos=False, registrar_iteracoes=False,
+                 prever_convergencia=True, verificar_a_cada=1, **kwargs):
+    """Gauss-Jacobi. O critério de parada (max|Δx|) é avaliado a cada `verificar_a_cada` iterações;
+    o monitoramento da taxa de convergência só roda quando ele é avaliado em toda iteração."""
     inicio = time.time()
     A = np.array(A, dtype=float)
     b = np.array(b, dtype=float).reshape(-1)
@@ -281,6 +1509,10 @@ def gauss_jacobi(A, b, x0=None, tol=1e-8, max_iter=100, retornar_passos=False, r
     n = b.shape[0]
     x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
 
+    if not isinstance(verificar_a_cada, (int, np.integer)) or verificar_a_cada < 1:
+        status = f"ERRO: verificar_a_cada deve ser um inteiro ≥ 1 (recebido {verificar_a_cada!r})."
+        return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+
     if not eh_quadrada(A):
         status = "ERRO: A não é quadrada."
         return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
@@ -290,25 +1522,47 @@ def gauss_jacobi(A, b, x0=None, tol=1e-8, max_iter=100, retornar_passos=False, r
         status = "ERRO: Zero na diagonal — método Jacobi inválido."
         return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
 
+    if prever_convergencia:
+        status = _prever_convergencia(A, "jacobi", "Jacobi", passos)
+        if status is not None:
+            return _empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+
     R = A - np.diagflat(D)
+    diferencas = []
+    # buffers alternados: nenhuma alocação dentro do laço
+    x_novo = np.empty(n)
+    auxiliar = np.empty(n)
 
     for k in range(1, max_iter + 1):
-        x_novo = (b - np.dot(R, x)) / D
+        np.dot(R, x, out=auxiliar)
+        np.subtract(b, auxiliar, out=x_novo)
+        np.divide(x_novo, D, out=x_novo)
         if registrar_iteracoes:
             passos["iteracoes"].append(x_novo.copy())
             passos["acoes"].append(f"Iteração {k}")
-        if np.linalg.norm(x_novo - x, ord=np.inf) < tol:
+        x, x_novo = x_novo, x
+        if k % verificar_a_cada and k < max_iter:
+            continue
+        diferenca = _max_abs_diferenca(x, x_novo, auxiliar)
+        if diferenca < tol:
             tempo = time.time() - inicio
             status = f"Convergiu em {k} iterações (Gauss-Jacobi)."
-            return _empacotar_retorno(x_novo, tempo, status, passos, retornar_passos)
-        x = x_novo.copy()
+            return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
+        if prever_convergencia and verificar_a_cada == 1:
+            diferencas.append(diferenca)
+            status = _monitorar_convergencia(diferencas, tol, max_iter, "Jacobi",
+                                             passos.get("raio_espectral"), passos.get("transiente", n))
+            if status is not None:
+                return _empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
 
     tempo = time.time() - inicio
     status = "Atenção: não convergiu dentro do número máximo de iterações (Jacobi)."
     return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
 
 
-def gauss_seidel(A, b, x0=None, tol=1e-8, max_iter=100, retornar_passos=False, registrar_iteracoes=False, **kwargs):
+def gauss_seidel(A, b, x0=None, tol=1e-8, max_iter=100, retornar_passos=False, registrar_iteracoes=False,
+                 prever_convergencia=True, verificar_a_cada=1, **kwargs):
+    """Gauss-Seidel no lugar; critério de parada a cada `verificar_a_cada` iterações, como em gauss_jacobi."""
     inicio = time.time()
     A = np.array(A, dtype=float)
     b = np.array(b, dtype=float).reshape(-1)
@@ -316,42 +1570,444 @@ def gauss_seidel(A, b, x0=None, tol=1e-8, max_iter=100, retornar_passos=False, r
     n = b.shape[0]
     x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
 
+    if not isinstance(verificar_a_cada, (int, np.integer)) or verificar_a_cada < 1:
+        status = f"ERRO: verificar_a_cada deve ser um inteiro ≥ 1 (recebido {verificar_a_cada!r})."
+        return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+
     if not eh_quadrada(A):
         status = "ERRO: A não é quadrada."
         return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
 
+    linha_nula = _linha_diagonal_nula(A)
+    if linha_nula is not None:
+        status = f"ERRO: Zero na diagonal (linha {linha_nula})."
+        return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+
+    if prever_convergencia:
+        status = _prever_convergencia(A, "seidel", "Gauss-Seidel", passos)
+        if status is not None:
+            return _empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+
+    diferencas = []
+
     for k in range(1, max_iter + 1):
-        x_ant = x.copy()
-        for i in range(n):
-            soma1 = np.dot(A[i, :i], x[:i])
-            soma2 = np.dot(A[i, i + 1:], x_ant[i + 1:])
-            if abs(A[i, i]) < EPS:
-                status = f"ERRO: Zero na diagonal (linha {i})."
-                return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
-            x[i] = (b[i] - soma1 - soma2) / A[i, i]
+        diferenca = _varredura_seidel(A, b, x)
 
         if registrar_iteracoes:
             passos["iteracoes"].append(x.copy())
             passos["acoes"].append(f"Iteração {k}")
-        if np.linalg.norm(x - x_ant, ord=np.inf) < tol:
+        if k % verificar_a_cada and k < max_iter:
+            continue
+        if diferenca < tol:
             tempo = time.time() - inicio
             status = f"Convergiu em {k} iterações (Gauss-Seidel)."
             return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
+        if prever_convergencia and verificar_a_cada == 1:
+            diferencas.append(diferenca)
+            status = _monitorar_convergencia(diferencas, tol, max_iter, "Gauss-Seidel",
+                                             passos.get("raio_espectral"), passos.get("transiente", n))
+            if status is not None:
+                return _empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
 
     tempo = time.time() - inicio
     status = "Atenção: não convergiu dentro do número máximo de iterações (Gauss-Seidel)."
     return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
 
+# ---------------------------------------------------------------
+# SOR e SSOR com fator de relaxação automático
+# ---------------------------------------------------------------
+
+VARREDURAS_ESTIMATIVA = 8  # varreduras de Gauss-Seidel usadas para estimar omega
+
+
+def _estimar_omega(diferencas, simetrico=False):
+    """Deriva omega da taxa de convergência observada nas varreduras de Gauss-Seidel.
+
+    Para matrizes consistentemente ordenadas, rho_GS = rho_J², e
+    omega_SOR = 2 / (1 + sqrt(1 - rho_GS)). Para o SSOR usa-se a
+    aproximação omega = 2 / (1 + sqrt(2 (1 - rho_J))).
+    Retorna (omega, rho_GS); omega = 1 quando a taxa não é confiável.
+    """
+    metade = len(diferencas) // 2
+    if metade < 1 or diferencas[metade - 1] == 0.0:
+        return 1.0, None
+    rho_gs = (diferencas[-1] / diferencas[metade - 1]) ** (1.0 / (len(diferencas) - metade))
+    if not 0.0 < rho_gs < 1.0:
+        return 1.0, None
+    if simetrico:
+        omega = 2.0 / (1.0 + np.sqrt(2.0 * (1.0 - np.sqrt(rho_gs))))
+    else:
+        omega = 2.0 / (1.0 + np.sqrt(1.0 - rho_gs))
+    return float(min(omega, 1.95)), rho_gs
+
+
+def _relaxacao_sucessiva(A, b, x0, tol, max_iter, omega, simetrico, retornar_passos, registrar_iteracoes):
+    """Laço comum de SOR (simetrico=False) e SSOR (simetrico=True)."""
+    inicio = time.time()
+    nome = "SSOR" if simetrico else "SOR"
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float).reshape(-1)
+    passos = {"iteracoes": [], "acoes": []}
+    n = b.shape[0]
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+
+    if not eh_quadrada(A):
+        status = "ERRO: A não é quadrada."
+        return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+
+    linha_nula = _linha_diagonal_nula(A)
+    if linha_nula is not None:
+        status = f"ERRO: Zero na diagonal (linha {linha_nula})."
+        return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+
+    automatico = omega is None
+    if not automatico and not 0.0 < omega < 2.0:
+        status = f"ERRO: omega deve estar em (0, 2); recebido {omega}."
+        return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+
+    diferencas = []
+    rho_gs = None
+    omega_atual = 1.0 if automatico else omega
+
+    for k in range(1, max_iter + 1):
+        diferenca = _varredura_seidel(A, b, x, omega_atual)
+        if simetrico:
+            diferenca = max(diferenca, _varredura_seidel(A, b, x, omega_atual, reversa=True))
+        diferencas.append(diferenca)
+
+        if registrar_iteracoes:
+            passos["iteracoes"].append(x.copy())
+            passos["acoes"].append(f"Iteração {k} (omega={omega_atual:.4f})")
+        if diferenca < tol:
+            status = f"Convergiu em {k} iterações ({nome}, omega={omega_atual:.4f})."
+            if rho_gs is not None:
+                d0 = diferencas[VARREDURAS_ESTIMATIVA - 1]
+                projecao_gs = VARREDURAS_ESTIMATIVA + int(np.ceil(np.log(tol / d0) / np.log(rho_gs)))
+                passos["iteracoes_gauss_seidel_projetadas"] = projecao_gs
+                status += f" Gauss-Seidel precisaria de ~{projecao_gs}; economia de ~{max(projecao_gs - k, 0)} iterações."
+            return _empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+        if not np.isfinite(diferenca):
+            break
+
+        if automatico and k == VARREDURAS_ESTIMATIVA:
+            omega_atual, rho_gs = _estimar_omega(diferencas, simetrico)
+            if rho_gs is None:
+                passos["acoes"].append("Taxa de Gauss-Seidel não confiável; mantendo omega = 1.")
+            else:
+                passos["acoes"].append(f"rho(Gauss-Seidel) ≈ {rho_gs:.6f} → omega = {omega_atual:.4f}")
+            passos["omega"] = omega_atual
+
+    tempo = time.time() - inicio
+    status = f"Atenção: não convergiu dentro do número máximo de iterações ({nome}, omega={omega_atual:.4f})."
+    return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
+
+
+def sor(A, b, x0=None, tol=1e-8, max_iter=100, omega=None, retornar_passos=False, registrar_iteracoes=False, **kwargs):
+    return _relaxacao_sucessiva(A, b, x0, tol, max_iter, omega, False, retornar_passos, registrar_iteracoes)
+
+
+def ssor(A, b, x0=None, tol=1e-8, max_iter=100, omega=None, retornar_passos=False, registrar_iteracoes=False, **kwargs):
+    return _relaxacao_sucessiva(A, b, x0, tol, max_iter, omega, True, retornar_passos, registrar_iteracoes)
+
+# ---------------------------------------------------------------
+# Métodos iterativos em blocos — Jacobi e Gauss-Seidel por blocos
+#
+# As incógnitas são agrupadas em blocos (ex.: as variáveis de um mesmo
+# nó da malha, ou uma linha inteira da malha). Cada bloco diagonal é
+# fatorado uma vez por LU com pivoteamento parcial e resolvido
+# exatamente a cada passo; só o acoplamento entre blocos é iterado.
+# Blocos de mesmo tamanho são fatorados e resolvidos em lote (todas as
+# substituições vetorizadas sobre os blocos). As fatorações ficam em
+# cache, indexadas pelos blocos diagonais e pela partição.
+# ---------------------------------------------------------------
+
+LIMITE_CACHE_BLOCOS = 8  # conjuntos de blocos fatorados mantidos em memória
+_blocos_fatorados = {}
+
+
+def particao_blocos(n, blocos=None):
+    """Lista de (inicio, fim). blocos: tamanho único, lista de tamanhos ou None (≈ √n)."""
+    if blocos is None:
+        blocos = max(1, int(round(np.sqrt(n))))
+    if np.isscalar(blocos):
+        tamanhos = [int(blocos)] * (n // int(blocos)) + ([n % int(blocos)] if n % int(blocos) else [])
+    else:
+        tamanhos = [int(t) for t in blocos]
+    if sum(tamanhos) != n or min(tamanhos) < 1:
+        raise ValueError(f"Partição em blocos inválida para n={n}: {tamanhos}")
+    limites = np.concatenate([[0], np.cumsum(tamanhos)])
+    return [(int(a), int(f)) for a, f in zip(limites[:-1], limites[1:])]
+
+
+def _fatorar_lu_lote(D):
+    """LU com pivoteamento parcial de vários blocos s x s de uma vez (D: nb x s x s).
+
+    Retorna (LU, piv) ou (None, (bloco, etapa)) quando algum pivô é nulo.
+    """
+    LU = D.copy()
+    nb, s, _ = LU.shape
+    piv = np.tile(np.arange(s), (nb, 1))
+    todos = np.arange(nb)
+    for k in range(s):
+        p = np.argmax(np.abs(LU[:, k:, k]), axis=1) + k
+        LU[todos, k], LU[todos, p] = LU[todos, p], LU[todos, k].copy()
+        piv[todos, k], piv[todos, p] = piv[todos, p], piv[todos, k].copy()
+        nulos = np.flatnonzero(np.abs(LU[:, k, k]) < EPS)
+        if nulos.size:
+            return None, (int(nulos[0]), k)
+        LU[:, k + 1:, k] /= LU[:, k, k, None]
+        LU[:, k + 1:, k + 1:] -= LU[:, k + 1:, k, None] * LU[:, None, k, k + 1:]
+    return LU, piv
+
+
+def _resolver_lu_lote(LU, piv, R):
+    """Resolve LU_i y_i = P_i r_i para todos os blocos (R: nb x s), substituições vetorizadas."""
+    s = LU.shape[1]
+    y = np.take_along_axis(R, piv, axis=1)
+    for i in range(1, s):
+        y[:, i] -= np.einsum("bj,bj->b", LU[:, i, :i], y[:, :i])
+    for i in range(s - 1, -1, -1):
+        y[:, i] = (y[:, i] - np.einsum("bj,bj->b", LU[:, i, i + 1:], y[:, i + 1:])) / LU[:, i, i]
+    return y
+
+
+def fatorar_blocos_diagonais(A, faixas):
+    """Fatora (ou busca no cache) os blocos diagonais. Retorna (grupos, reaproveitada).
+
+    grupos: lista de (blocos, indices, LU, piv), um por tamanho de bloco; indices (nb x s)
+    são as incógnitas de cada bloco. Levanta LinAlgError se um bloco for singular.
+    """
+    resumo = hashlib.sha1(str(faixas).encode())
+    for a, f in faixas:
+        resumo.update(np.ascontiguousarray(A[a:f, a:f]).tobytes())
+    chave = resumo.hexdigest()
+    if chave in _blocos_fatorados:
+        return _blocos_fatorados[chave], True
+
+    por_tamanho = {}
+    for j, (a, f) in enumerate(faixas):
+        por_tamanho.setdefault(f - a, []).append(j)
+    grupos = []
+    for s, blocos in por_tamanho.items():
+        indices = np.array([faixas[j][0] for j in blocos])[:, None] + np.arange(s)
+        LU, piv = _fatorar_lu_lote(A[indices[:, :, None], indices[:, None, :]])
+        if LU is None:
+            bloco, etapa = piv
+            raise np.linalg.LinAlgError(f"Bloco diagonal {blocos[bloco]} singular (etapa {etapa})")
+        grupos.append((blocos, indices, LU, piv))
+
+    if len(_blocos_fatorados) >= LIMITE_CACHE_BLOCOS:
+        del _blocos_fatorados[next(iter(_blocos_fatorados))]
+    _blocos_fatorados[chave] = grupos
+    return grupos, False
+
+
+def _iterar_blocos(A, b, x0, tol, max_iter, blocos, seidel, retornar_passos, registrar_iteracoes):
+    """Laço comum de Jacobi em blocos (seidel=False) e Gauss-Seidel em blocos (seidel=True)."""
+    inicio = time.time()
+    nome = "Gauss-Seidel em blocos" if seidel else "Jacobi em blocos"
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float).reshape(-1)
+    passos = {"iteracoes": [], "acoes": []}
+    n = b.shape[0]
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+
+    if not eh_quadrada(A):
+        status = "ERRO: A não é quadrada."
+        return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+
+    faixas = particao_blocos(n, blocos)
+    try:
+        grupos, reaproveitada = fatorar_blocos_diagonais(A, faixas)
+    except np.linalg.LinAlgError as e:
+        status = f"ERRO: {e} — {nome}."
+        return _empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+    passos["acoes"].append(f"{len(faixas)} blocos diagonais "
+                           + ("reaproveitados do cache" if reaproveitada else "fatorados"))
+
+    # Gauss-Seidel: os blocos são resolvidos um a um, na ordem da partição
+    fatores = [None] * len(faixas)
+    if seidel:
+        for blocos_grupo, _, LU, piv in grupos:
+            for posicao, j in enumerate(blocos_grupo):
+                fatores[j] = (LU[posicao], piv[posicao])
+
+    diferencas = []
+    for k in range(1, max_iter + 1):
+        if seidel:
+            diferenca = 0.0
+            for (a, f), (LU, piv) in zip(faixas, fatores):
+                residuo = b[a:f] - np.dot(A[a:f], x)
+                delta = _resolver_lu(LU, piv, residuo)
+                x[a:f] += delta
+                diferenca = max(diferenca, float(np.max(np.abs(delta))))
+        else:
+            residuo = b - np.dot(A, x)
+            diferenca = 0.0
+            for _, indices, LU, piv in grupos:
+                delta = _resolver_lu_lote(LU, piv, residuo[indices])
+                x[indices] += delta
+                diferenca = max(diferenca, float(np.max(np.abs(delta))))
+
+        if registrar_iteracoes:
+            passos["iteracoes"].append(x.copy())
+            passos["acoes"].append(f"Iteração {k}")
+        if diferenca < tol:
+            status = f"Convergiu em {k} iterações ({nome}, {len(faixas)} blocos)."
+            return _empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+        diferencas.append(diferenca)
+        status = _monitorar_convergencia(diferencas, tol, max_iter, nome, transiente=len(faixas))
+        if status is not None:
+            return _empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+
+    tempo = time.time() - inicio
+    status = f"Atenção: não convergiu dentro do número máximo de iterações ({nome})."
+    return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
+
+
+def jacobi_blocos(A, b, x0=None, tol=1e-8, max_iter=100, blocos=None, retornar_passos=False,
+                  registrar_iteracoes=False, **kwargs):
+    return _iterar_blocos(A, b, x0, tol, max_iter, blocos, False, retornar_passos, registrar_iteracoes)
+
+
+def seidel_blocos(A, b, x0=None, tol=1e-8, max_iter=100, blocos=None, retornar_passos=False,
+                  registrar_iteracoes=False, **kwargs):
+    return _iterar_blocos(A, b, x0, tol, max_iter, blocos, True, retornar_passos, registrar_iteracoes)
+
+# ---------------------------------------------------------------
+# Seleção automática do método (análise estrutural de A)
+# ---------------------------------------------------------------
+
+LIMITE_ITERATIVO = 500      # ordem a partir da qual vale tentar métodos iterativos
+LIMITE_ESPARSIDADE = 0.05   # fração máxima de não nulos para considerar A esparsa
+LIMITE_ESPARSO = 200        # ordem a partir da qual vale tentar os solvers esparsos
+LIMITE_BLOCOS = 1000        # ordem a partir da qual as fatorações densas usam blocos em paralelo
+
+
+def analisar_matriz(A):
+    """Levanta as propriedades de A usadas na escolha automática do método.
+
+    Todas as verificações custam O(n²), exceto a de definida positiva, que
+    só é tentada (via eh_definida_positiva) quando A é simétrica.
+    """
+    A = np.asarray(A, dtype=float)
+    n = A.shape[0]
+    diagonal = np.abs(np.diag(A))
+    fora_diagonal = np.abs(A).sum(axis=1) - diagonal
+    p, q = largura_banda(A)
+    simetrica = bool(np.allclose(A, A.T))
+    return {
+        "n": n,
+        "simetrica": simetrica,
+        "definida_positiva": simetrica and bool(np.all(np.diag(A) > 0)) and eh_definida_positiva(A),
+        "diagonal_dominante": bool(np.all(diagonal > fora_diagonal)),
+        "diagonal_nula": bool(np.any(diagonal < EPS)),
+        "densidade": float(np.count_nonzero(A)) / max(A.size, 1),
+        "banda": (p, q),
+    }
+
+
+def escolher_metodo(A):
+    """Retorna (nome em METODOS, justificativa) para a matriz A."""
+    info = analisar_matriz(A)
+    n, (p, q) = info["n"], info["banda"]
+
+    banda = metodo_para_banda(A, info)
+    if banda is not None:
+        return banda, f"matriz em banda estreita (inferior {p}, superior {q}, n={n})"
+    if n >= LIMITE_ESPARSO:
+        esparso = metodo_esparso(A, info)
+        if esparso is not None:
+            analise, _ = obter_analise(como_esparsa(A))
+            return esparso, (f"esparsa ({info['densidade']:.1%} não nulos) e a ordenação RCM reduz a banda "
+                             f"de {p}/{q} para {analise['p']}/{analise['q']}")
+    if info["definida_positiva"]:
+        if n >= LIMITE_BLOCOS:
+            return "Cholesky em blocos (paralela)", f"matriz simétrica definida positiva, densa e grande (n={n})"
+        return "Fatoração de Cholesky", "matriz simétrica definida positiva"
+    if info["diagonal_dominante"] and n >= LIMITE_ITERATIVO and info["densidade"] <= LIMITE_ESPARSIDADE:
+        return ("Método iterativo - Gauss-Seidel",
+                f"diagonal estritamente dominante, grande (n={n}) e esparsa ({info['densidade']:.1%} não nulos)")
+    if info["diagonal_dominante"]:
+        return "Gauss sem pivoteamento", "diagonal estritamente dominante dispensa pivoteamento"
+    if n >= LIMITE_BLOCOS:
+        return "LU em blocos (paralela)", f"caso geral, denso e grande (n={n})"
+    return "Gauss com pivoteamento parcial", "caso geral (sem estrutura explorável)"
+
+
+SEM_PIVOTEAMENTO = ("Gauss sem pivoteamento", "Tridiagonal - Thomas", "LU em banda", "LU esparsa (RCM)")
+LIMITE_ERRO_REGRESSIVO = 1e-10  # acima disso, a solução sem pivoteamento é refeita com pivoteamento parcial
+
+
+def _erro_regressivo(A, b, x):
+    """Erro regressivo normwise ||b - A x||∞ / (||A||∞ ||x||∞ + ||b||∞)."""
+    escala = np.abs(A).sum(axis=1).max() * np.abs(x).max() + np.abs(b).max()
+    return float(np.abs(b - A @ x).max() / escala) if escala > 0 else 0.0
+
+
+def metodo_automatico(A, b, retornar_passos=False, **kwargs):
+    inicio = time.time()
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float).reshape(-1)
+    passos = {"matrizes": [], "acoes": []}
+
+    if A.ndim == 2 and A.shape[0] > A.shape[1] and A.shape[0] == b.shape[0]:
+        nome, motivo = "Mínimos quadrados (QR de Householder)", f"A retangular ({A.shape[0]} x {A.shape[1]})"
+    elif not eh_quadrada(A) or A.shape[0] != b.shape[0]:
+        status = "ERRO: A não é quadrada ou dimensões incompatíveis com b."
+        return _empacotar_retorno(None, 0.0, status, passos, retornar_passos)
+    else:
+        nome, motivo = escolher_metodo(A)
+    resultado = METODOS[nome](A, b, retornar_passos=True, **kwargs)
+    x, status, passos_metodo = resultado[0], resultado[2], resultado[3]
+
+    # sem pivoteamento, "Sucesso" não basta: pivôs pequenos dão resíduo grande sem falha explícita
+    if x is not None and nome in SEM_PIVOTEAMENTO:
+        erro_regressivo = _erro_regressivo(A, b, x)
+        if erro_regressivo > LIMITE_ERRO_REGRESSIVO:
+            status = f"ERRO: erro regressivo {erro_regressivo:.1e} acima de {LIMITE_ERRO_REGRESSIVO:.0e} (instável)."
+
+    # o método escolhido pode falhar (ex.: iterativo sem convergir); o parcial é o recurso geral
+    if ((x is None or not status.startswith(("Sucesso", "Convergiu"))) and nome != "Gauss com pivoteamento parcial"
+            and eh_quadrada(A)):
+        passos["acoes"].append(f"'{nome}' falhou ({status}); recorrendo ao pivoteamento parcial.")
+        motivo = f"{motivo}; '{nome}' falhou"
+        nome = "Gauss com pivoteamento parcial"
+        x, _, status, passos_metodo = pivoteamento_parcial(A, b, retornar_passos=True, **kwargs)
+
+    passos["acoes"].insert(0, f"Método escolhido: {nome} — {motivo}")
+    passos["acoes"].extend(passos_metodo.get("acoes", []))
+    for chave, valor in passos_metodo.items():
+        passos.setdefault(chave, valor)
+    passos["metodo_escolhido"] = nome
+
+    tempo = time.time() - inicio
+    status = f"[Automático → {nome}: {motivo}] {status}"
+    return _empacotar_retorno(x, tempo, status, passos, retornar_passos)
+
 # ---------------------------------------------------------------
 # Mapeamento usado pela interface gráfica (GUI)
 # ---------------------------------------------------------------
 
 METODOS = {
+    "Automático (análise da matriz)": metodo_automatico,
     "Gauss sem pivoteamento": eliminacao_gauss,
     "Gauss com pivoteamento parcial": pivoteamento_parcial,
     "Gauss com pivoteamento completo": pivoteamento_completo,
     "Fatoração LU": fatoracao_lu,
     "Fatoração de Cholesky": cholesky,
+    "Tridiagonal - Thomas": thomas,
+    "LU em banda": lu_banda,
+    "Cholesky em banda": cholesky_banda,
+    "LU esparsa (RCM)": lu_esparsa,
+    "Cholesky esparsa (RCM)": cholesky_esparsa,
+    "LU em blocos (paralela)": lu_blocos,
+    "Cholesky em blocos (paralela)": cholesky_blocos,
+    "Mínimos quadrados (QR de Householder)": minimos_quadrados,
     "Método iterativo - Gauss-Jacobi": gauss_jacobi,
     "Método iterativo - Gauss-Seidel": gauss_seidel,
+    "Método iterativo - SOR": sor,
+    "Método iterativo - SSOR": ssor,
+    "Método iterativo - Jacobi em blocos": jacobi_blocos,
+    "Método iterativo - Gauss-Seidel em blocos": seidel_blocos,
 }
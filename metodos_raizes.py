@@ -8,7 +8,8 @@
 # metodo a b x0 x1 tol maxIter
 #
 # Onde:
-# - metodo: 1=Bisseção, 2=Ponto Fixo, 3=Newton-Raphson, 4=Secante, 5=Regula Falsi
+# - metodo: 1=Bisseção, 2=Ponto Fixo, 3=Newton-Raphson, 4=Secante, 5=Regula Falsi,
+#           6=Ponto Fixo (Aitken), 7=Ponto Fixo (Steffensen), 8=Ponto Fixo (Anderson)
 # - para métodos que não usam alguns campos, mantenha valores (ex.: x1=0)
 #
 # Exemplo de linha:
@@ -74,8 +75,8 @@ def ler_dados(nome_arquivo="entrada.txt"):
         print("Erro ao ler 'entrada.txt':", e)
         sys.exit(1)
 
-    if metodo < 1 or metodo > 5:
-        print("Método inválido! Escolha entre 1 e 5.")
+    if metodo < 1 or metodo > 8:
+        print("Método inválido! Escolha entre 1 e 8.")
         sys.exit(1)
     if tol <= 0 or max_iter <= 0:
         print("Tolerância e número máximo de iterações devem ser positivos.")
@@ -137,28 +138,120 @@ def metodo_bissecao(dados, saida):
 
 
 # 2. Ponto Fixo
-def metodo_ponto_fixo(dados, saida):
-    salvar_cabecalho(saida, "Método do Ponto Fixo")
+#
+# aceleracao:
+#   None         -> iteração simples x_{k+1} = phi(x_k)
+#   "aitken"     -> Δ² de Aitken sobre a sequência simples (x̂_k = x_k - (Δx_k)² / Δ²x_k)
+#   "steffensen" -> reinicia cada passo de x̂ (convergência quadrática, 2 avaliações de phi por passo)
+#   "anderson"   -> mistura de Anderson com memória 1 (secante sobre r(x) = phi(x) - x)
+TITULOS_PONTO_FIXO = {
+    None: "Método do Ponto Fixo",
+    "aitken": "Método do Ponto Fixo (Aitken Δ²)",
+    "steffensen": "Método do Ponto Fixo (Steffensen)",
+    "anderson": "Método do Ponto Fixo (Anderson)",
+}
+NOMES_ACELERACAO = {"aitken": "de Aitken (Δ²)", "steffensen": "de Steffensen", "anderson": "de Anderson"}
+
+
+def _delta2(x0, x1, x2):
+    """Extrapolação Δ² de Aitken; devolve x2 quando a diferença segunda se anula."""
+    denominador = x2 - 2.0 * x1 + x0
+    if abs(denominador) < 1e-14:
+        return x2
+    return x0 - (x1 - x0) ** 2 / denominador
+
+
+def metodo_ponto_fixo(dados, saida, aceleracao=None):
+    if aceleracao not in TITULOS_PONTO_FIXO:
+        raise ValueError(f"Aceleração desconhecida: {aceleracao}")
+    salvar_cabecalho(saida, TITULOS_PONTO_FIXO[aceleracao])
     inicio = time.perf_counter()
 
     x0 = dados.x0
     iteracao = 0
+    avaliacoes = 0
     erro = float('inf')
 
-    while erro > dados.tol and iteracao < dados.max_iter:
+    if aceleracao is None:
+        while erro > dados.tol and iteracao < dados.max_iter:
+            x1 = phi(x0)
+            avaliacoes += 1
+            erro = abs(x1 - x0)
+            iteracao += 1
+            salvar_iteracao(saida, iteracao, x1, f(x1), erro)
+            x0 = x1
+
+    elif aceleracao == "aitken":
+        # janela deslizante (x_k, x_{k+1}, x_{k+2}) da sequência simples: 1 phi por iteração
         x1 = phi(x0)
-        erro = abs(x1 - x0)
-        iteracao += 1
-        salvar_iteracao(saida, iteracao, x1, f(x1), erro)
+        avaliacoes += 1
+        estimativa = x1
+        while erro > dados.tol and iteracao < dados.max_iter:
+            x2 = phi(x1)
+            avaliacoes += 1
+            nova = _delta2(x0, x1, x2)
+            erro = abs(nova - estimativa)
+            iteracao += 1
+            salvar_iteracao(saida, iteracao, nova, f(nova), erro)
+            x0, x1, estimativa = x1, x2, nova
+        x0 = estimativa
+
+    elif aceleracao == "steffensen":
+        while erro > dados.tol and iteracao < dados.max_iter:
+            x1 = phi(x0)
+            x2 = phi(x1)
+            avaliacoes += 2
+            nova = _delta2(x0, x1, x2)
+            erro = abs(nova - x0)
+            iteracao += 1
+            salvar_iteracao(saida, iteracao, nova, f(nova), erro)
+            x0 = nova
+
+    else:  # anderson
+        g0 = phi(x0)
+        avaliacoes += 1
+        r0 = g0 - x0
+        x1 = g0
+        while erro > dados.tol and iteracao < dados.max_iter:
+            g1 = phi(x1)
+            avaliacoes += 1
+            r1 = g1 - x1
+            if abs(r1 - r0) < 1e-14:
+                nova = g1
+            else:
+                gama = r1 / (r1 - r0)
+                nova = g1 - gama * (g1 - g0)
+            erro = abs(nova - x1)
+            iteracao += 1
+            salvar_iteracao(saida, iteracao, nova, f(nova), erro)
+            g0, r0, x1 = g1, r1, nova
         x0 = x1
 
     if erro > dados.tol:
-        saida.write("\nAviso: Método do Ponto Fixo pode não convergir (|phi'(x)| ≥ 1).\n")
-        print("⚠️  Método do Ponto Fixo pode não convergir (|phi'(x)| ≥ 1).")
+        if aceleracao is None:
+            aviso = "Método do Ponto Fixo pode não convergir (|phi'(x)| ≥ 1)."
+        else:
+            # com aceleração, |phi'| ≥ 1 não é a causa: ela também converge quando a iteração simples diverge
+            aviso = f"Aceleração {NOMES_ACELERACAO[aceleracao]} não convergiu em {dados.max_iter} iterações."
+        saida.write(f"\nAviso: {aviso}\n")
+        print(f"⚠️  {aviso}")
 
+    saida.write(f"\nAvaliações de phi: {avaliacoes}\n")
     finalizar_metodo(saida, inicio, iteracao == dados.max_iter, erro, dados.tol)
 
 
+def metodo_ponto_fixo_aitken(dados, saida):
+    metodo_ponto_fixo(dados, saida, aceleracao="aitken")
+
+
+def metodo_ponto_fixo_steffensen(dados, saida):
+    metodo_ponto_fixo(dados, saida, aceleracao="steffensen")
+
+
+def metodo_ponto_fixo_anderson(dados, saida):
+    metodo_ponto_fixo(dados, saida, aceleracao="anderson")
+
+
 # 3. Newton-Raphson
 def metodo_newton_raphson(dados, saida):
     salvar_cabecalho(saida, "Método de Newton-Raphson")
@@ -235,6 +328,20 @@ def metodo_regula_falsi(dados, saida):
 
     finalizar_metodo(saida, inicio, iteracao == dados.max_iter, erro, dados.tol)
 
+# ===============================================================
+# Mapeamento nome -> método (mesmos nomes usados na interface)
+# ===============================================================
+METODOS = {
+    "Bisseção": metodo_bissecao,
+    "Ponto Fixo": metodo_ponto_fixo,
+    "Newton-Raphson": metodo_newton_raphson,
+    "Secante": metodo_secante,
+    "Regula Falsi": metodo_regula_falsi,
+    "Ponto Fixo (Aitken)": metodo_ponto_fixo_aitken,
+    "Ponto Fixo (Steffensen)": metodo_ponto_fixo_steffensen,
+    "Ponto Fixo (Anderson)": metodo_ponto_fixo_anderson,
+}
+
 # ===============================================================
 # Função principal (main)
 # ===============================================================
@@ -272,6 +379,18 @@ def main():
         print("REGULA FALSI")
         saida.write("Método selecionado: REGULA FALSI\n")
         metodo_regula_falsi(dados, saida)
+    elif dados.metodo == 6:
+        print("PONTO FIXO (AITKEN)")
+        saida.write("Método selecionado: PONTO FIXO (AITKEN)\n")
+        metodo_ponto_fixo_aitken(dados, saida)
+    elif dados.metodo == 7:
+        print("PONTO FIXO (STEFFENSEN)")
+        saida.write("Método selecionado: PONTO FIXO (STEFFENSEN)\n")
+        metodo_ponto_fixo_steffensen(dados, saida)
+    elif dados.metodo == 8:
+        print("PONTO FIXO (ANDERSON)")
+        saida.write("Método selecionado: PONTO FIXO (ANDERSON)\n")
+        metodo_ponto_fixo_anderson(dados, saida)
 
     print("------------------------------------")
     print("Execução concluída!")
@@ -0,0 +1,81 @@
+# ===============================================================
+# Mínimos quadrados incremental — linhas novas absorvidas por Givens
+#
+# Guarda só o fator R (n x n) da QR de [A | b] e z = (Qᵀb)[:n], mais a
+# soma dos quadrados do resíduo. Cada linha nova (a, beta) é zerada
+# contra R por n rotações de Givens, em O(n²), sem refatorar A nem
+# guardar as linhas antigas. Serve para calibrações cujos dados chegam
+# aos poucos.
+#
+# resolver() devolve x no padrão de metodos_lineares:
+#   x, tempo, status  ou  x, tempo, status, passos
+# ===============================================================
+
+import time
+
+import numpy as np
+
+import metodos_lineares as ML
+
+
+def _givens(a, b):
+    """(c, s) da rotação [c s; -s c] que leva (a, b) a (r, 0)."""
+    if b == 0.0:
+        return 1.0, 0.0
+    r = np.hypot(a, b)
+    return a / r, b / r
+
+
+class MinimosQuadradosIncremental:
+    """min ||A x - b||₂ atualizado linha a linha; comece vazio (n) ou a partir de (A, b)."""
+
+    def __init__(self, n=None, A=None, b=None):
+        if A is not None:
+            A = np.asarray(A, dtype=float)
+            n = A.shape[1]
+        if n is None:
+            raise ValueError("Informe n ou a matriz inicial A.")
+        self.n = int(n)
+        self.R = np.zeros((self.n, self.n))
+        self.z = np.zeros(self.n)
+        self.soma_quadrados = 0.0  # ||resíduo||₂² das linhas já absorvidas
+        self.linhas = 0
+        if A is not None:
+            self.adicionar(A, b)
+
+    def adicionar(self, linhas, valores):
+        """Absorve novas equações linhas·x ≈ valores (uma linha ou uma matriz k x n)."""
+        linhas = np.array(linhas, dtype=float).reshape(-1, self.n)
+        valores = np.array(valores, dtype=float).reshape(-1)
+        if valores.shape[0] != linhas.shape[0]:
+            raise ValueError("Número de linhas e de valores diferente.")
+        R, z = self.R, self.z
+        for a, beta in zip(linhas, valores):
+            a = a.copy()
+            for k in range(self.n):
+                if a[k] == 0.0:
+                    continue
+                c, s = _givens(R[k, k], a[k])
+                Rk = R[k, k:].copy()
+                R[k, k:] = c * Rk + s * a[k:]
+                a[k:] = -s * Rk + c * a[k:]
+                z[k], beta = c * z[k] + s * beta, -s * z[k] + c * beta
+            # o que sobra de beta é a componente da nova equação fora do espaço de colunas
+            self.soma_quadrados += beta ** 2
+            self.linhas += 1
+
+    def resolver(self, retornar_passos=False):
+        """Resolve R x = z com as linhas absorvidas até agora."""
+        inicio = time.time()
+        passos = {"acoes": [f"{self.linhas} equações absorvidas por rotações de Givens"]}
+        diagonal = np.abs(np.diag(self.R))
+        if self.linhas < self.n or diagonal.min() <= 1e-14 * max(diagonal.max(), ML.EPS):
+            status = (f"ERRO: dados insuficientes ou colunas dependentes "
+                      f"({self.linhas} equações para {self.n} incógnitas).")
+            return ML._empacotar_retorno(None, time.time() - inicio, status, passos, retornar_passos)
+        x = ML._substituicao_regressiva(self.R, self.z)
+        norma_residuo = float(np.sqrt(self.soma_quadrados))
+        passos["norma_residuo"] = norma_residuo
+        status = (f"Sucesso (mínimos quadrados incremental por Givens, {self.linhas} x {self.n}; "
+                  f"||Ax - b||₂ = {norma_residuo:.3e}).")
+        return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
@@ -0,0 +1,298 @@
+# ===============================================================
+# Multigrade algébrica por agregação suavizada (SA-AMG)
+#
+# Preparação (feita uma vez por matriz e guardada em cache):
+#   1. conexões fortes: |a_ij| ≥ theta·sqrt(|a_ii a_jj|);
+#   2. agregação gulosa dos nós pelas conexões fortes;
+#   3. prolongamento tentativo P0 (constante em cada agregado) e
+#      suavizado por uma etapa de Jacobi: P = (I - ω D⁻¹ A) P0;
+#   4. operador grosso de Galerkin A_c = Pᵀ A P;
+# repetida até a malha grossa ficar pequena, que é fatorada por LU.
+#
+# Ciclo V: suavizações de Jacobi amortecido ou de Gauss-Seidel (as
+# mesmas iterações de metodos_lineares, em formato esparso) antes e
+# depois da correção na malha grossa. Cada ciclo custa O(nnz(A)) e a
+# taxa de convergência não depende do tamanho da malha.
+#
+# amg(): o ciclo V como método iterativo.
+# gradiente_conjugado(): CG com o ciclo V (ou Jacobi) como
+# precondicionador, para A simétrica definida positiva.
+#
+# Retorno no padrão de metodos_lineares:
+#   x, tempo, status  ou  x, tempo, status, passos
+# ===============================================================
+
+import hashlib
+import time
+
+import numpy as np
+
+import metodos_lineares as ML
+from matriz_esparsa import MatrizEsparsa, como_esparsa
+
+THETA = 0.08              # limiar de conexão forte
+TAMANHO_GROSSO = 50       # ordem a partir da qual a malha é resolvida diretamente
+MAX_NIVEIS = 12
+LIMITE_CACHE_HIERARQUIAS = 4
+_hierarquias = {}
+
+
+# ---------------------------------------------------------------
+# Preparação da hierarquia
+# ---------------------------------------------------------------
+
+def _conexoes_fortes(A, theta):
+    """Matriz de conexões fortes (fora da diagonal), simetrizada."""
+    d = np.abs(A.diagonal())
+    fortes = ((A.linhas != A.colunas)
+              & (np.abs(A.valores) >= theta * np.sqrt(d[A.linhas] * d[A.colunas])))
+    S = MatrizEsparsa(A.linhas[fortes], A.colunas[fortes], np.ones(int(fortes.sum())), A.forma)
+    return MatrizEsparsa(np.concatenate([S.linhas, S.colunas]), np.concatenate([S.colunas, S.linhas]),
+                         np.ones(2 * S.nnz), A.forma)
+
+
+def agregar(S):
+    """Agregação gulosa em três passagens. Retorna o agregado de cada nó."""
+    n = S.forma[0]
+    agregado = np.full(n, -1)
+    total = 0
+    # 1. nós cuja vizinhança forte está toda livre formam um agregado com ela
+    for i in range(n):
+        vizinhos = S.linha(i)[0]
+        if agregado[i] == -1 and np.all(agregado[vizinhos] == -1):
+            agregado[i] = total
+            agregado[vizinhos] = total
+            total += 1
+    # 2. nós restantes entram no agregado de um vizinho forte
+    restantes = np.flatnonzero(agregado == -1)
+    anterior = agregado.copy()
+    for i in restantes:
+        vizinhos = S.linha(i)[0]
+        candidatos = anterior[vizinhos][anterior[vizinhos] >= 0]
+        if candidatos.size:
+            agregado[i] = candidatos[0]
+    # 3. os que sobraram (sem conexões fortes) viram agregados próprios
+    sobras = np.flatnonzero(agregado == -1)
+    agregado[sobras] = total + np.arange(sobras.size)
+    return agregado
+
+
+def _estimar_raio(A, d_inv, passos=15):
+    """Raio espectral de D⁻¹A por iteração de potência."""
+    v = np.random.default_rng(0).standard_normal(A.forma[0])
+    raio = 1.0
+    for _ in range(passos):
+        w = d_inv * A.produto(v)
+        raio = np.linalg.norm(w) / np.linalg.norm(v)
+        v = w / np.linalg.norm(w)
+    return raio
+
+
+class HierarquiaAMG:
+    """Níveis da multigrade: operadores, prolongamentos e a LU da malha mais grossa."""
+
+    def __init__(self, A, theta=THETA, tamanho_grosso=TAMANHO_GROSSO, max_niveis=MAX_NIVEIS):
+        inicio = time.time()
+        A = como_esparsa(A)
+        self.niveis = []
+        while A.forma[0] > tamanho_grosso and len(self.niveis) < max_niveis - 1:
+            d = A.diagonal()
+            if np.any(np.abs(d) < ML.EPS):
+                raise ValueError("Zero na diagonal — AMG não aplicável.")
+            agregado = agregar(_conexoes_fortes(A, theta))
+            n_grosso = int(agregado.max()) + 1
+            if n_grosso >= A.forma[0]:
+                break  # a agregação não reduz mais
+
+            # prolongamento tentativo normalizado e suavizado
+            tamanhos = np.bincount(agregado)
+            P0 = MatrizEsparsa(np.arange(A.forma[0]), agregado, 1.0 / np.sqrt(tamanhos[agregado]),
+                               (A.forma[0], n_grosso))
+            d_inv = 1.0 / d
+            raio = _estimar_raio(A, d_inv)
+            omega = (4.0 / 3.0) / raio
+            P = P0 - A.escalar_linhas(omega * d_inv).produto_esparso(P0)
+            R = P.transposta()
+            self.niveis.append({"A": A, "P": P, "R": R, "d_inv": d_inv, "raio": raio})
+            A = R.produto_esparso(A.produto_esparso(P))
+
+        self.niveis.append({"A": A})
+        self.LU, self.piv = ML._fatorar_lu(A.densa(), pivotear=True)
+        if self.LU is None:
+            raise ValueError("Malha mais grossa singular — AMG não aplicável.")
+        self.tempo_preparacao = time.time() - inicio
+
+    def __len__(self):
+        return len(self.niveis)
+
+    def complexidade(self):
+        """Soma dos não nulos de todos os níveis / não nulos de A."""
+        return sum(nivel["A"].nnz for nivel in self.niveis) / self.niveis[0]["A"].nnz
+
+    def descricao(self):
+        ordens = " → ".join(str(nivel["A"].forma[0]) for nivel in self.niveis)
+        return f"{len(self)} níveis ({ordens}), complexidade de operador {self.complexidade():.2f}"
+
+
+def _chave_matriz(A):
+    A = como_esparsa(A)
+    resumo = hashlib.sha1(str(A.forma).encode())
+    for vetor in (A.linhas, A.colunas, A.valores):
+        resumo.update(vetor.tobytes())
+    return resumo.hexdigest()
+
+
+def obter_hierarquia(A, **opcoes):
+    """Retorna (hierarquia, reaproveitada): a preparação fica em cache, indexada pelo conteúdo de A."""
+    chave = _chave_matriz(A) + repr(sorted(opcoes.items()))
+    if chave in _hierarquias:
+        return _hierarquias[chave], True
+    hierarquia = HierarquiaAMG(A, **opcoes)
+    if len(_hierarquias) >= LIMITE_CACHE_HIERARQUIAS:
+        del _hierarquias[next(iter(_hierarquias))]
+    _hierarquias[chave] = hierarquia
+    return hierarquia, False
+
+
+# ---------------------------------------------------------------
+# Suavizadores e ciclo V
+# ---------------------------------------------------------------
+
+def _jacobi_amortecido(nivel, b, x, varreduras):
+    omega = (4.0 / 3.0) / nivel.get("raio", 2.0)
+    for _ in range(varreduras):
+        x += omega * nivel["d_inv"] * (b - nivel["A"].produto(x))
+    return x
+
+
+def _seidel_esparso(nivel, b, x, varreduras, reversa=False):
+    """Gauss-Seidel linha a linha sobre a matriz CSR (forma de resíduo, como em metodos_lineares)."""
+    A, d_inv = nivel["A"], nivel["d_inv"]
+    n = A.forma[0]
+    for _ in range(varreduras):
+        for i in (range(n - 1, -1, -1) if reversa else range(n)):
+            colunas, valores = A.linha(i)
+            x[i] += (b[i] - np.dot(valores, x[colunas])) * d_inv[i]
+    return x
+
+
+def ciclo_v(hierarquia, b, x=None, suavizador="jacobi", varreduras=1, nivel=0):
+    """Um ciclo V a partir do nível dado; retorna a nova aproximação de A x = b."""
+    x = np.zeros_like(b) if x is None else x
+    if nivel == len(hierarquia) - 1:
+        return ML._resolver_lu(hierarquia.LU, hierarquia.piv, b)
+    dados = hierarquia.niveis[nivel]
+    # pré e pós-suavização em sentidos opostos: o ciclo fica simétrico (serve ao CG)
+    if suavizador == "seidel":
+        x = _seidel_esparso(dados, b, x, varreduras)
+    else:
+        x = _jacobi_amortecido(dados, b, x, varreduras)
+    residuo_grosso = dados["R"].produto(b - dados["A"].produto(x))
+    x += dados["P"].produto(ciclo_v(hierarquia, residuo_grosso, None, suavizador, varreduras, nivel + 1))
+    if suavizador == "seidel":
+        return _seidel_esparso(dados, b, x, varreduras, reversa=True)
+    return _jacobi_amortecido(dados, b, x, varreduras)
+
+
+# ---------------------------------------------------------------
+# Solvers no padrão de metodos_lineares
+# ---------------------------------------------------------------
+
+def _preparar(A, b, x0, passos, opcoes_hierarquia):
+    A = como_esparsa(A)
+    b = np.array(b, dtype=float).reshape(-1)
+    x = np.zeros(b.shape[0]) if x0 is None else np.array(x0, dtype=float).reshape(-1)
+    if A.forma[0] != A.forma[1] or A.forma[0] != b.shape[0]:
+        raise ValueError("A não é quadrada ou dimensões incompatíveis com b.")
+    hierarquia, reaproveitada = obter_hierarquia(A, **opcoes_hierarquia)
+    passos["acoes"].append(("Hierarquia reaproveitada do cache: " if reaproveitada
+                            else f"Hierarquia preparada em {hierarquia.tempo_preparacao:.3f} s: ")
+                           + hierarquia.descricao())
+    passos["hierarquia"] = hierarquia
+    return A, b, x, hierarquia
+
+
+def amg(A, b, x0=None, tol=1e-8, max_iter=100, suavizador="jacobi", varreduras=1, opcoes_hierarquia=None,
+        retornar_passos=False, registrar_iteracoes=False, **kwargs):
+    """Ciclos V até ||b - A x||₂ ≤ tol·||b||₂. A pode ser densa ou MatrizEsparsa."""
+    inicio = time.time()
+    passos = {"iteracoes": [], "acoes": []}
+    try:
+        A, b, x, hierarquia = _preparar(A, b, x0, passos, opcoes_hierarquia or {})
+    except ValueError as e:
+        return ML._empacotar_retorno(None, time.time() - inicio, f"ERRO: {e}", passos, retornar_passos)
+
+    norma_b = np.linalg.norm(b) or 1.0
+    residuos = []
+    for k in range(1, max_iter + 1):
+        x = ciclo_v(hierarquia, b, x, suavizador, varreduras)
+        residuo = np.linalg.norm(b - A.produto(x)) / norma_b
+        residuos.append(residuo)
+        if registrar_iteracoes:
+            passos["iteracoes"].append(x.copy())
+            passos["acoes"].append(f"Ciclo V {k}: resíduo relativo {residuo:.3e}")
+        if residuo <= tol:
+            fator = (residuo / residuos[0]) ** (1.0 / (k - 1)) if k > 1 and residuos[0] > 0 else 0.0
+            status = f"Convergiu em {k} ciclos V (AMG, {len(hierarquia)} níveis, fator de redução {fator:.3f})."
+            return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+        if not np.isfinite(residuo):
+            status = f"Atenção: iteração divergiu para valores não finitos após {k} ciclos (AMG)."
+            return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+
+    status = "Atenção: não convergiu dentro do número máximo de iterações (AMG)."
+    return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+
+
+def gradiente_conjugado(A, b, x0=None, tol=1e-8, max_iter=None, precondicionador="amg", suavizador="jacobi",
+                        opcoes_hierarquia=None, retornar_passos=False, registrar_iteracoes=False, **kwargs):
+    """CG precondicionado (precondicionador: "amg", "jacobi" ou None) até ||r||₂ ≤ tol·||b||₂."""
+    inicio = time.time()
+    passos = {"iteracoes": [], "acoes": []}
+    try:
+        if precondicionador == "amg":
+            A, b, x, hierarquia = _preparar(A, b, x0, passos, opcoes_hierarquia or {})
+            aplicar = lambda r: ciclo_v(hierarquia, r, None, suavizador)
+        else:
+            A = como_esparsa(A)
+            b = np.array(b, dtype=float).reshape(-1)
+            x = np.zeros(b.shape[0]) if x0 is None else np.array(x0, dtype=float).reshape(-1)
+            if precondicionador == "jacobi":
+                d_inv = 1.0 / A.diagonal()
+                aplicar = lambda r: d_inv * r
+            elif precondicionador is None:
+                aplicar = lambda r: r
+            else:
+                raise ValueError(f"Precondicionador desconhecido: {precondicionador}")
+    except ValueError as e:
+        return ML._empacotar_retorno(None, time.time() - inicio, f"ERRO: {e}", passos, retornar_passos)
+
+    max_iter = max_iter or 10 * b.shape[0]
+    norma_b = np.linalg.norm(b) or 1.0
+    r = b - A.produto(x)
+    z = aplicar(r)
+    p = z.copy()
+    rz = np.dot(r, z)
+    nome = f"CG precondicionado ({precondicionador})" if precondicionador else "CG"
+    for k in range(1, max_iter + 1):
+        Ap = A.produto(p)
+        pAp = np.dot(p, Ap)
+        if pAp <= 0.0:
+            status = f"ERRO: pᵀAp ≤ 0 na iteração {k} — A não é definida positiva ({nome})."
+            return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+        alfa = rz / pAp
+        x += alfa * p
+        r -= alfa * Ap
+        residuo = np.linalg.norm(r) / norma_b
+        if registrar_iteracoes:
+            passos["iteracoes"].append(x.copy())
+            passos["acoes"].append(f"Iteração {k}: resíduo relativo {residuo:.3e}")
+        if residuo <= tol:
+            status = f"Convergiu em {k} iterações ({nome})."
+            return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+        z = aplicar(r)
+        rz_novo = np.dot(r, z)
+        p = z + (rz_novo / rz) * p
+        rz = rz_novo
+
+    status = f"Atenção: não convergiu dentro do número máximo de iterações ({nome})."
+    return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
@@ -0,0 +1,101 @@
+# ===============================================================
+# Gravação de logs em segundo plano
+#
+# Quem produz o texto (a interface Tk) só coloca os arquivos numa
+# fila limitada; uma thread gravadora faz as escritas em disco. Com a
+# fila cheia o arquivo é descartado (e contado), em vez de bloquear
+# quem escreve.
+#
+# salvar_arquivo(nome, texto) grava um arquivo por execução (ex.: os
+# logs/resultado_<timestamp>.txt), com rotação por quantidade.
+# Com comprimir=True os arquivos são gravados em gzip (.gz).
+# ===============================================================
+
+import atexit
+import glob
+import gzip
+import os
+import queue
+import threading
+
+
+class GravadorLogs:
+    def __init__(self, diretorio="logs", comprimir=False, capacidade_fila=1024, max_arquivos=200):
+        os.makedirs(diretorio, exist_ok=True)
+        self.diretorio = diretorio
+        self.comprimir = comprimir
+        self.max_arquivos = max_arquivos
+        self.descartados = 0  # arquivos perdidos por fila cheia
+        self.erros = []       # exceções de E/S da thread gravadora (as mais recentes)
+
+        self._fila = queue.Queue(maxsize=capacidade_fila)
+        self._thread = threading.Thread(target=self._executar, name="GravadorLogs", daemon=True)
+        self._thread.start()
+        atexit.register(self.fechar)
+
+    # ---------------- lado de quem produz ----------------
+    def _enfileirar(self, item):
+        try:
+            self._fila.put_nowait(item)
+        except queue.Full:
+            self.descartados += 1
+
+    def salvar_arquivo(self, nome, texto):
+        """Agenda a gravação de texto em diretorio/nome; retorna o caminho final (com .gz, se comprimir)."""
+        caminho = os.path.join(self.diretorio, nome + (".gz" if self.comprimir else ""))
+        self._enfileirar(("arquivo", caminho, texto))
+        return caminho
+
+    def esvaziar(self, timeout=None):
+        """Espera a thread gravar tudo que já foi enfileirado (bloqueia; use fora da interface)."""
+        concluido = threading.Event()
+        self._fila.put(("esvaziar", concluido, None), timeout=timeout)
+        return concluido.wait(timeout)
+
+    def fechar(self, timeout=5.0):
+        if self._thread.is_alive():
+            try:
+                self._fila.put(None, timeout=timeout)
+            except queue.Full:
+                return
+            self._thread.join(timeout)
+
+    # ---------------- thread gravadora ----------------
+    def _executar(self):
+        while True:
+            item = self._fila.get()
+            if item is None:
+                return
+            tipo, destino, texto = item
+            if tipo == "arquivo":
+                self._proteger(self._gravar_arquivo, destino, texto)
+            elif tipo == "esvaziar":
+                destino.set()
+
+    def _proteger(self, funcao, *args):
+        try:
+            funcao(*args)
+        except OSError as e:
+            self.erros = (self.erros + [e])[-10:]
+
+    def _abrir(self, caminho, modo):
+        if self.comprimir:
+            return gzip.open(caminho, modo + "t", encoding="utf-8")
+        return open(caminho, modo, encoding="utf-8")
+
+    def _gravar_arquivo(self, caminho, texto):
+        with self._abrir(caminho, "w") as f:
+            f.write(texto)
+        self._limitar_arquivos(caminho)
+
+    def _limitar_arquivos(self, caminho):
+        """Rotação por quantidade: mantém os max_arquivos mais recentes com o mesmo prefixo."""
+        nome = os.path.basename(caminho)
+        prefixo = nome.split("_", 1)[0] if "_" in nome else os.path.splitext(nome)[0]
+        arquivos = sorted(glob.glob(os.path.join(self.diretorio, prefixo + "_*")),
+                          key=os.path.getmtime, reverse=True)
+        for antigo in arquivos[self.max_arquivos:]:
+            try:
+                os.remove(antigo)
+            except OSError:
+                pass
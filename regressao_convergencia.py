@@ -0,0 +1,67 @@
+# ===============================================================
+# Verificação de regressão da previsão/monitoramento de convergência
+# de Gauss-Jacobi e Gauss-Seidel
+#
+# Casos em que a estimativa do raio espectral ou a taxa observada no
+# início passam de 1 mas a iteração converge (matrizes não normais),
+# e casos que de fato divergem e devem ser abortados.
+#
+# Uso:
+#   python regressao_convergencia.py
+# ===============================================================
+
+import sys
+
+import numpy as np
+
+import metodos_lineares as ML
+
+
+def _nilpotente(n=30):
+    """I + 1,5·superdiagonal: matriz de iteração nilpotente (ρ = 0), mas ||T^k|| cresce até k = n."""
+    return np.eye(n) + 1.5 * np.eye(n, k=1)
+
+
+def _nao_normal(n=60):
+    """Tridiagonal com sub-diagonal -1 e super-diagonal -0,08: ρ(T_J) ≈ 0,66, crescimento transitório até k ≈ 70."""
+    return np.eye(n) - np.eye(n, k=-1) - 0.08 * np.eye(n, k=1)
+
+
+def _divergente_grande(n=300):
+    """I - 0,8·(sub + super): simétrica, ρ(T_J) ≈ 1,6; deve ser abortada em poucas iterações, não em n."""
+    return np.eye(n) - 0.8 * (np.eye(n, k=-1) + np.eye(n, k=1))
+
+
+CASOS = [
+    # (descrição, A, deve convergir)
+    ("nilpotente I + 1,5·superdiagonal (n = 30)", _nilpotente(), True),
+    ("não normal, sub = -1, super = -0,08 (n = 60)", _nao_normal(), True),
+    ("divergente [[1, 2], [3, 1]]", np.array([[1.0, 2.0], [3.0, 1.0]]), False),
+    ("divergente I - 0,8·(sub + super) (n = 300)", _divergente_grande(), False),
+]
+
+ITERACOES_ABORTO_MAX = 50  # casos divergentes devem ser abortados antes disso
+
+
+def main():
+    falhas = 0
+    for descricao, A, deve_convergir in CASOS:
+        b = A @ np.ones(A.shape[0])
+        for nome, metodo in (("Jacobi", ML.gauss_jacobi), ("Gauss-Seidel", ML.gauss_seidel)):
+            x, _, status, passos = metodo(A, b, tol=1e-8, max_iter=500, retornar_passos=True,
+                                        registrar_iteracoes=True)
+            convergiu = status.startswith("Convergiu") and np.allclose(x, 1.0, atol=1e-6)
+            ok = convergiu == deve_convergir
+            iteracoes = len(passos["iteracoes"])
+            if not deve_convergir and iteracoes > ITERACOES_ABORTO_MAX:
+                ok = False
+                status += f" [{iteracoes} iterações antes de abortar]"
+            falhas += not ok
+            print(f"[{'ok' if ok else 'FALHA'}] {nome:12s} {descricao}: {status}")
+    if falhas:
+        print(f"{falhas} caso(s) com falha.")
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
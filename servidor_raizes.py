@@ -0,0 +1,470 @@
+# ===============================================================
+# Servidor de raízes — pedidos JSON por linha (NDJSON) via socket
+# Unix ou stdin, sem abrir um processo por pedido
+#
+# Cada linha de entrada é um pedido:
+#   {"id": 1, "metodo": "Newton-Raphson", "expressao": "x**3 - 9*x + 3",
+#    "x0": 0.5, "tol": 1e-10, "maxIter": 100}
+# Campos: metodo (nomes de metodos_raizes.METODOS ou bissecao, newton,
+# secante, regula_falsi, ponto_fixo), expressao (f(x); phi(x) no ponto
+# fixo), derivada (opcional, Newton), a/b (intervalo), x0/x1 (chutes),
+# tol, maxIter. Sem expressao, usa as funções de exemplo de
+# metodos_raizes.
+#
+# Cada resposta é uma linha JSON com o mesmo id:
+#   {"id": 1, "raiz": ..., "iteracoes": ..., "erro": ..., "status": "..."}
+# As respostas saem assim que prontas (não necessariamente na ordem).
+#
+# Desempenho:
+#   - as expressões são validadas (só nomes/funções da lista abaixo) e
+#     compiladas uma única vez (cache);
+#   - pedidos que chegam juntos com o mesmo método e expressão são
+#     resolvidos em lote: cada pedido é uma posição de um vetor NumPy e
+#     todas iteram ao mesmo tempo, com os mesmos critérios de parada
+#     de metodos_raizes.
+#
+# Uso:
+#   python -m servidor_raizes --socket /tmp/raizes.sock
+#   python -m servidor_raizes --stdin < pedidos.ndjson
+# ===============================================================
+
+import argparse
+import ast
+import asyncio
+import functools
+import json
+import os
+import signal
+import sys
+
+import numpy as np
+
+LOTE_MAXIMO = 4096       # pedidos resolvidos de uma vez
+JANELA_LOTE = 0.0005     # s de espera por mais pedidos antes de resolver um lote
+LIMITE_LINHA = 1 << 20   # bytes por pedido
+MAX_ITER_MAXIMO = 10000  # teto de maxIter por pedido
+
+# Funções de exemplo de metodos_raizes (f, f' e phi), em forma vetorizada
+EXPRESSAO_PADRAO = "x**3 - 9*x + 3.0"
+DERIVADA_PADRAO = "3.0*x*x - 9.0"
+PHI_PADRAO = "cbrt(9.0*x - 3.0)"
+
+# Nomes permitidos nas expressões
+NOMES_PERMITIDOS = {
+    "x": None,
+    "pi": np.pi, "e": np.e,
+    "sin": np.sin, "cos": np.cos, "tan": np.tan, "asin": np.arcsin, "acos": np.arccos, "atan": np.arctan,
+    "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh,
+    "exp": np.exp, "log": np.log, "log10": np.log10, "log2": np.log2, "sqrt": np.sqrt, "cbrt": np.cbrt,
+    "abs": np.abs, "sign": np.sign,
+}
+NOS_PERMITIDOS = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant,
+                  ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.USub, ast.UAdd)
+
+METODOS_SERVIDOR = {
+    "bissecao": "bissecao", "Bisseção": "bissecao",
+    "newton": "newton", "Newton-Raphson": "newton",
+    "secante": "secante", "Secante": "secante",
+    "regula_falsi": "regula_falsi", "Regula Falsi": "regula_falsi",
+    "ponto_fixo": "ponto_fixo", "Ponto Fixo": "ponto_fixo",
+}
+
+
+# ---------------------------------------------------------------
+# Expressões compiladas
+# ---------------------------------------------------------------
+
+@functools.lru_cache(maxsize=256)
+def compilar(expressao):
+    """Valida e compila expressao (em x) uma única vez. Retorna f(x) vetorizada; ValueError se inválida."""
+    try:
+        arvore = ast.parse(expressao, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"expressão inválida: {e.msg}") from None
+    except (RecursionError, MemoryError):
+        raise ValueError("expressão grande demais") from None
+    for no in ast.walk(arvore):
+        if not isinstance(no, NOS_PERMITIDOS):
+            raise ValueError(f"construção não permitida na expressão: {type(no).__name__}")
+        if isinstance(no, ast.Name) and no.id not in NOMES_PERMITIDOS:
+            raise ValueError(f"nome desconhecido na expressão: {no.id}")
+        if isinstance(no, ast.Call) and (not isinstance(no.func, ast.Name) or no.func.id == "x"):
+            raise ValueError("só funções da lista permitida podem ser chamadas")
+        if isinstance(no, ast.Constant) and (isinstance(no.value, bool) or not isinstance(no.value, (int, float))):
+            raise ValueError(f"constante não permitida na expressão: {no.value!r}")
+    # constantes inteiras viram float: potências como 9**9**9 dão overflow em vez de
+    # um inteiro gigante calculado sem fim
+    for no in ast.walk(arvore):
+        if isinstance(no, ast.Constant):
+            try:
+                no.value = float(no.value)
+            except OverflowError:
+                raise ValueError("constante grande demais para float na expressão") from None
+    codigo = compile(arvore, "<expressao>", "eval")
+    ambiente = {"__builtins__": {}, **{k: v for k, v in NOMES_PERMITIDOS.items() if v is not None}}
+
+    def funcao(x):
+        with np.errstate(all="ignore"):
+            return np.asarray(eval(codigo, ambiente, {"x": x}), dtype=float) + np.zeros_like(x)
+    return funcao
+
+
+def _derivada_numerica(f):
+    def derivada(x):
+        h = 1e-6 * np.maximum(1.0, np.abs(x))
+        return (f(x + h) - f(x - h)) / (2.0 * h)
+    return derivada
+
+
+# ---------------------------------------------------------------
+# Métodos em lote (uma posição do vetor por pedido)
+#
+# Os critérios são os de metodos_raizes; "ativos" marca os pedidos que
+# ainda iteram. Retornam (raiz, iteracoes, erro, falha), com falha = ""
+# ou a mensagem de erro do pedido.
+# ---------------------------------------------------------------
+
+def _saida(n):
+    return np.full(n, np.nan), np.zeros(n, dtype=int), np.full(n, np.inf), np.full(n, "", dtype=object)
+
+
+def bissecao_lote(f, a, b, tol, max_iter):
+    raiz, iteracoes, erro, falha = _saida(a.size)
+    a, b = a.copy(), b.copy()
+    invalido = f(a) * f(b) > 0
+    falha[invalido] = "Intervalo inválido: f(a)*f(b) > 0"
+    erro = np.abs(b - a) / 2.0
+    ativos = ~invalido & (erro > tol)
+    while np.any(ativos):
+        xm = (a + b) / 2.0
+        erro = np.where(ativos, np.abs(b - a) / 2.0, erro)
+        raiz = np.where(ativos, xm, raiz)
+        iteracoes += ativos
+        esquerda = f(a) * f(xm) < 0
+        b = np.where(ativos & esquerda, xm, b)
+        a = np.where(ativos & ~esquerda, xm, a)
+        ativos &= (erro > tol) & (iteracoes < max_iter)
+    return raiz, iteracoes, erro, falha
+
+
+def newton_lote(f, df, x0, tol, max_iter):
+    raiz, iteracoes, erro, falha = _saida(x0.size)
+    x = x0.copy()
+    ativos = np.ones(x.size, dtype=bool)
+    while np.any(ativos):
+        fdx = df(x)
+        parou = ativos & (np.abs(fdx) < 1e-12)
+        falha[parou] = "Derivada próxima de zero. Encerrando."
+        ativos &= ~parou
+        novo = np.where(ativos, x - f(x) / np.where(ativos, fdx, 1.0), x)
+        erro = np.where(ativos, np.abs(novo - x), erro)
+        iteracoes += ativos
+        x = novo
+        ativos &= (erro > tol) & (iteracoes < max_iter)
+    return np.where(iteracoes > 0, x, raiz), iteracoes, erro, falha
+
+
+def secante_lote(f, x0, x1, tol, max_iter):
+    raiz, iteracoes, erro, falha = _saida(x0.size)
+    x0, x1 = x0.copy(), x1.copy()
+    ativos = np.ones(x0.size, dtype=bool)
+    while np.any(ativos):
+        f0, f1 = f(x0), f(x1)
+        parou = ativos & (np.abs(f1 - f0) < 1e-12)
+        falha[parou] = "Divisão por zero detectada. Encerrando."
+        ativos &= ~parou
+        x2 = np.where(ativos, x1 - f1 * (x1 - x0) / np.where(ativos, f1 - f0, 1.0), x1)
+        erro = np.where(ativos, np.abs(x2 - x1), erro)
+        iteracoes += ativos
+        x0, x1 = np.where(ativos, x1, x0), x2
+        ativos &= (erro > tol) & (iteracoes < max_iter)
+    return np.where(iteracoes > 0, x1, raiz), iteracoes, erro, falha
+
+
+def regula_falsi_lote(f, a, b, tol, max_iter):
+    raiz, iteracoes, erro, falha = _saida(a.size)
+    a, b = a.copy(), b.copy()
+    invalido = f(a) * f(b) > 0
+    falha[invalido] = "Intervalo inválido: f(a)*f(b) > 0"
+    ativos = ~invalido
+    while np.any(ativos):
+        fa, fb = f(a), f(b)
+        x = (a * fb - b * fa) / np.where(ativos, fb - fa, 1.0)
+        fx = f(x)
+        erro = np.where(ativos, np.abs(fx), erro)
+        raiz = np.where(ativos, x, raiz)
+        iteracoes += ativos
+        esquerda = fa * fx < 0
+        b = np.where(ativos & esquerda, x, b)
+        a = np.where(ativos & ~esquerda, x, a)
+        ativos &= (erro > tol) & (iteracoes < max_iter)
+    return raiz, iteracoes, erro, falha
+
+
+def ponto_fixo_lote(phi, x0, tol, max_iter):
+    raiz, iteracoes, erro, falha = _saida(x0.size)
+    x = x0.copy()
+    ativos = np.ones(x.size, dtype=bool)
+    while np.any(ativos):
+        novo = np.where(ativos, phi(x), x)
+        erro = np.where(ativos, np.abs(novo - x), erro)
+        iteracoes += ativos
+        x = novo
+        divergiu = ativos & ~np.isfinite(x)
+        falha[divergiu] = "Iteração divergiu (valor não finito)."
+        ativos &= ~divergiu & (erro > tol) & (iteracoes < max_iter)
+    return np.where(iteracoes > 0, x, raiz), iteracoes, erro, falha
+
+
+# ---------------------------------------------------------------
+# Pedidos e lotes
+# ---------------------------------------------------------------
+
+def _numero(pedido, nome, padrao=None):
+    """Campo numérico finito do pedido (ValueError se ausente ou inválido)."""
+    valor = pedido.get(nome, padrao)
+    if isinstance(valor, bool) or not isinstance(valor, (int, float)) or not np.isfinite(valor):
+        raise ValueError(f"campo {nome!r} deve ser um número finito (recebido {valor!r})")
+    return float(valor)
+
+
+def preparar_pedido(pedido):
+    """Valida um pedido; retorna (chave, valores), onde pedidos com a mesma chave vão para o mesmo lote."""
+    metodo = METODOS_SERVIDOR.get(pedido.get("metodo"))
+    if metodo is None:
+        raise ValueError(f"método desconhecido: {pedido.get('metodo')!r}")
+    padrao = PHI_PADRAO if metodo == "ponto_fixo" else EXPRESSAO_PADRAO
+    expressao = str(pedido.get("expressao") or padrao)
+    derivada = pedido.get("derivada") or (DERIVADA_PADRAO if expressao == EXPRESSAO_PADRAO else None)
+    compilar(expressao)
+    if derivada is not None:
+        compilar(str(derivada))
+
+    valores = {"tol": _numero(pedido, "tol", 1e-6), "maxIter": _numero(pedido, "maxIter", 100)}
+    if valores["tol"] <= 0:
+        raise ValueError("tol deve ser positiva")
+    if not 1 <= valores["maxIter"] <= MAX_ITER_MAXIMO or valores["maxIter"] != int(valores["maxIter"]):
+        raise ValueError(f"maxIter deve ser um inteiro entre 1 e {MAX_ITER_MAXIMO}")
+    campos = {"bissecao": ("a", "b"), "regula_falsi": ("a", "b"), "newton": ("x0",),
+              "secante": ("x0", "x1"), "ponto_fixo": ("x0",)}[metodo]
+    for nome in campos:
+        valores[nome] = _numero(pedido, nome)
+    return (metodo, expressao, derivada), valores
+
+
+def resolver_lote(chave, lote):
+    """Resolve vários pedidos já validados com a mesma chave; lote = [(id, valores)]. Respostas na mesma ordem."""
+    metodo, expressao, derivada = chave
+    f = compilar(expressao)
+    campo = lambda nome: np.array([valores[nome] for _, valores in lote])
+    tol = campo("tol")
+    max_iter = campo("maxIter").astype(int)
+
+    if metodo == "bissecao":
+        raiz, iteracoes, erro, falha = bissecao_lote(f, campo("a"), campo("b"), tol, max_iter)
+    elif metodo == "regula_falsi":
+        raiz, iteracoes, erro, falha = regula_falsi_lote(f, campo("a"), campo("b"), tol, max_iter)
+    elif metodo == "newton":
+        df = compilar(str(derivada)) if derivada is not None else _derivada_numerica(f)
+        raiz, iteracoes, erro, falha = newton_lote(f, df, campo("x0"), tol, max_iter)
+    elif metodo == "secante":
+        raiz, iteracoes, erro, falha = secante_lote(f, campo("x0"), campo("x1"), tol, max_iter)
+    else:
+        raiz, iteracoes, erro, falha = ponto_fixo_lote(f, campo("x0"), tol, max_iter)
+
+    respostas = []
+    for i, (identificador, _) in enumerate(lote):
+        convergiu = not falha[i] and erro[i] <= tol[i]
+        if falha[i]:
+            status = f"ERRO: {falha[i]}"
+        elif convergiu:
+            status = f"Convergiu em {iteracoes[i]} iterações."
+        else:
+            status = "Atenção: Método atingiu o número máximo de iterações e pode não ter convergido."
+        respostas.append({
+            "id": identificador,
+            "raiz": None if not np.isfinite(raiz[i]) else float(raiz[i]),
+            "iteracoes": int(iteracoes[i]),
+            "erro": None if not np.isfinite(erro[i]) else float(erro[i]),
+            "convergiu": bool(convergiu),
+            "status": status,
+        })
+    return respostas
+
+
+class Agrupador:
+    """Junta os pedidos que chegam quase ao mesmo tempo e os resolve em lotes."""
+
+    def __init__(self, lote_maximo=LOTE_MAXIMO, janela=JANELA_LOTE):
+        self.fila = asyncio.Queue()
+        self.lote_maximo = lote_maximo
+        self.janela = janela
+        self.lotes = 0
+        self.pedidos = 0
+        self._tarefa = None
+
+    def iniciar(self):
+        self._tarefa = asyncio.get_running_loop().create_task(self._laco())
+
+    async def parar(self):
+        if self._tarefa is not None:
+            self._tarefa.cancel()
+            try:
+                await self._tarefa
+            except asyncio.CancelledError:
+                pass
+
+    async def resolver(self, pedido):
+        """Enfileira o pedido e espera a resposta."""
+        futuro = asyncio.get_running_loop().create_future()
+        await self.fila.put((pedido, futuro))
+        return await futuro
+
+    async def _laco(self):
+        laco = asyncio.get_running_loop()
+        while True:
+            itens = [await self.fila.get()]
+            if self.janela:
+                await asyncio.sleep(self.janela)
+            while len(itens) < self.lote_maximo and not self.fila.empty():
+                itens.append(self.fila.get_nowait())
+
+            # validação por pedido: um campo inválido só afeta o próprio pedido
+            grupos = {}
+            for pedido, futuro in itens:
+                try:
+                    chave, valores = preparar_pedido(pedido)
+                except Exception as e:  # qualquer falha vira resposta de erro; o laço não pode morrer
+                    futuro.set_result({"id": pedido.get("id"), "status": f"ERRO: {e}"})
+                    continue
+                grupos.setdefault(chave, []).append((pedido.get("id"), valores, futuro))
+            # os lotes rodam numa thread: o laço continua lendo e escrevendo para os outros clientes
+            for chave, grupo in grupos.items():
+                laco.create_task(self._resolver_grupo(laco, chave, grupo))
+
+    async def _resolver_grupo(self, laco, chave, grupo):
+        lote = [(identificador, valores) for identificador, valores, _ in grupo]
+        try:
+            respostas = await laco.run_in_executor(None, resolver_lote, chave, lote)
+        except ArithmeticError as e:
+            respostas = [{"id": identificador, "status": f"ERRO: falha ao avaliar a expressão ({type(e).__name__})"}
+                         for identificador, _ in lote]
+        except Exception as e:  # nenhum pedido pode ficar sem resposta
+            respostas = [{"id": identificador, "status": f"ERRO: {e}"} for identificador, _ in lote]
+        for (_, _, futuro), resposta in zip(grupo, respostas):
+            if not futuro.done():
+                futuro.set_result(resposta)
+        self.lotes += 1
+        self.pedidos += len(grupo)
+
+
+# ---------------------------------------------------------------
+# Transporte: socket Unix ou stdin/stdout
+# ---------------------------------------------------------------
+
+async def _atender(leitor, escrever, agrupador):
+    """Lê pedidos linha a linha e escreve cada resposta assim que fica pronta."""
+    pendentes = set()
+
+    async def responder(linha):
+        try:
+            pedido = json.loads(linha)
+            if not isinstance(pedido, dict):
+                raise ValueError("o pedido deve ser um objeto JSON")
+        except ValueError as e:
+            resposta = {"id": None, "status": f"ERRO: pedido inválido ({e})"}
+        else:
+            resposta = await agrupador.resolver(pedido)
+        await escrever(json.dumps(resposta, ensure_ascii=False) + "\n")
+
+    while True:
+        try:
+            linha = await leitor.readline()
+        except ValueError:  # linha maior que LIMITE_LINHA
+            await escrever(json.dumps({"id": None, "status": "ERRO: pedido grande demais"}) + "\n")
+            break
+        if not linha:
+            break
+        if not linha.strip():
+            continue
+        tarefa = asyncio.ensure_future(responder(linha))
+        pendentes.add(tarefa)
+        tarefa.add_done_callback(pendentes.discard)
+    if pendentes:
+        await asyncio.gather(*pendentes)
+
+
+async def servir_socket(caminho, agrupador=None):
+    """Servidor em socket Unix (um cliente por conexão, várias conexões ao mesmo tempo)."""
+    agrupador = agrupador or Agrupador()
+    agrupador.iniciar()
+
+    async def conexao(leitor, escritor):
+        async def escrever(texto):
+            escritor.write(texto.encode("utf-8"))
+            await escritor.drain()
+        try:
+            await _atender(leitor, escrever, agrupador)
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    if os.path.exists(caminho):
+        os.unlink(caminho)
+    servidor = await asyncio.start_unix_server(conexao, path=caminho, limit=LIMITE_LINHA)
+    # SIGTERM encerra normalmente (e remove o arquivo do socket)
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, servidor.close)
+    except (NotImplementedError, RuntimeError):
+        pass
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await agrupador.parar()
+        if os.path.exists(caminho):
+            os.unlink(caminho)
+
+
+async def servir_stdin(agrupador=None):
+    """Lê pedidos de stdin e escreve as respostas em stdout até o fim da entrada."""
+    agrupador = agrupador or Agrupador()
+    agrupador.iniciar()
+    laco = asyncio.get_running_loop()
+    leitor = asyncio.StreamReader(limit=LIMITE_LINHA)
+    await laco.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(leitor), sys.stdin)
+
+    async def escrever(texto):
+        sys.stdout.write(texto)
+        sys.stdout.flush()
+
+    try:
+        await _atender(leitor, escrever, agrupador)
+    finally:
+        await agrupador.parar()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servidor de raízes: pedidos JSON por linha (NDJSON).")
+    grupo = parser.add_mutually_exclusive_group(required=True)
+    grupo.add_argument("--socket", metavar="CAMINHO", help="escuta num socket Unix")
+    grupo.add_argument("--stdin", action="store_true", help="lê pedidos de stdin e responde em stdout")
+    parser.add_argument("--janela", type=float, default=JANELA_LOTE,
+                        help="espera (s) por mais pedidos antes de resolver um lote")
+    args = parser.parse_args(argv)
+
+    agrupador = Agrupador(janela=args.janela)
+    try:
+        if args.socket:
+            asyncio.run(servir_socket(args.socket, agrupador))
+        else:
+            asyncio.run(servir_stdin(agrupador))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+# ===============================================================
+# Sistemas não lineares F(x) = 0 (x em R^n)
+#
+# Newton (com reaproveitamento do jacobiano — método da corda) e
+# Broyden (quase-Newton). O passo linear J dx = -F(x) usa os solvers
+# de metodos_lineares.METODOS; para os métodos baseados em LU a
+# fatoração é feita uma vez e reaproveitada enquanto o jacobiano for
+# reaproveitado.
+#
+# Jacobiano: função J(x) do usuário, diferenças finitas ("diferencas")
+# ou passo complexo ("complexo", exato até o arredondamento, exige que
+# F aceite números complexos). Com lote=True, F recebe uma matriz
+# n x k (um ponto por coluna) e devolve n x k, e cada jacobiano custa
+# uma única chamada de F. Com banda=(p, q), colunas que não se
+# sobrepõem são perturbadas juntas (p + q + 1 avaliações).
+#
+# Retornos no padrão de metodos_lineares:
+#   x, tempo, status  ou  x, tempo, status, passos
+# ===============================================================
+
+import time
+
+import numpy as np
+
+import metodos_lineares as ML
+
+# Métodos cujo passo linear reaproveita a fatoração LU (valor: pivotear?)
+_FATORACAO_REAPROVEITAVEL = {
+    "Gauss com pivoteamento parcial": True,
+    "Gauss sem pivoteamento": False,
+    "Fatoração LU": False,
+}
+
+
+# ---------------------------------------------------------------
+# Avaliação de F e jacobianos
+# ---------------------------------------------------------------
+
+def _avaliar_lote(F, X, lote):
+    """Avalia F em cada coluna de X (numa única chamada quando lote=True)."""
+    if lote:
+        return np.asarray(F(X))
+    return np.column_stack([np.asarray(F(X[:, j])) for j in range(X.shape[1])])
+
+
+def _grupos_colunas(n, banda):
+    """Grupos de colunas perturbadas juntas: todas as colunas, uma a uma, ou por cores da banda."""
+    if banda is None:
+        return [np.array([j]) for j in range(n)]
+    p, q = banda
+    largura = p + q + 1
+    return [np.arange(g, n, largura) for g in range(min(largura, n))]
+
+
+def _espalhar_grupos(D, grupos, n, banda):
+    """Monta o jacobiano a partir das diferenças de cada grupo (uma coluna de D por grupo)."""
+    J = np.zeros((D.shape[0], n))
+    if banda is None:
+        J[:, :] = D
+        return J
+    p, q = banda
+    for g, colunas in enumerate(grupos):
+        for j in colunas:
+            inicio, fim = max(0, j - q), min(D.shape[0], j + p + 1)
+            J[inicio:fim, j] = D[inicio:fim, g]
+    return J
+
+
+def jacobiano_diferencas(F, x, Fx=None, lote=False, banda=None):
+    """Jacobiano por diferenças finitas progressivas (passo sqrt(eps) relativo a |x_j|)."""
+    x = np.asarray(x, dtype=float)
+    n = x.size
+    Fx = np.asarray(F(x)) if Fx is None else Fx
+    h = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(x), 1.0)
+    grupos = _grupos_colunas(n, banda)
+    X = np.repeat(x[:, None], len(grupos), axis=1)
+    for g, colunas in enumerate(grupos):
+        X[colunas, g] += h[colunas]
+    # passo efetivamente representado em ponto flutuante
+    passo = X - x[:, None]
+    D = _avaliar_lote(F, X, lote) - Fx[:, None]
+    if banda is None:
+        return D / np.diag(passo)[None, :]
+    for g, colunas in enumerate(grupos):
+        D[:, g] /= passo[colunas[0], g]
+    return _espalhar_grupos(D, grupos, n, banda)
+
+
+def jacobiano_passo_complexo(F, x, lote=False, banda=None, h=1e-20):
+    """Jacobiano pelo passo complexo: Im(F(x + i h e_j)) / h, sem cancelamento."""
+    x = np.asarray(x, dtype=float)
+    n = x.size
+    grupos = _grupos_colunas(n, banda)
+    X = np.repeat(x[:, None].astype(complex), len(grupos), axis=1)
+    for g, colunas in enumerate(grupos):
+        X[colunas, g] += 1j * h
+    D = np.imag(_avaliar_lote(F, X, lote)) / h
+    return _espalhar_grupos(D, grupos, n, banda)
+
+
+def _funcao_jacobiano(F, jacobiano, lote, banda):
+    """Normaliza o parâmetro jacobiano para uma função J(x, Fx)."""
+    if callable(jacobiano):
+        return lambda x, Fx: np.asarray(jacobiano(x), dtype=float)
+    if jacobiano == "diferencas":
+        return lambda x, Fx: jacobiano_diferencas(F, x, Fx, lote=lote, banda=banda)
+    if jacobiano == "complexo":
+        return lambda x, Fx: jacobiano_passo_complexo(F, x, lote=lote, banda=banda)
+    raise ValueError(f"Jacobiano desconhecido: {jacobiano!r} (use uma função, 'diferencas' ou 'complexo').")
+
+
+# ---------------------------------------------------------------
+# Passo linear com os solvers de METODOS
+# ---------------------------------------------------------------
+
+def preparar_resolvedor(J, metodo_linear="Gauss com pivoteamento parcial", **opcoes):
+    """Retorna uma função r -> J^{-1} r (ou None se J for singular para o método).
+
+    Para os métodos baseados em LU a fatoração é feita aqui, uma única vez;
+    os demais métodos de METODOS são chamados a cada resolução.
+    """
+    if metodo_linear in _FATORACAO_REAPROVEITAVEL:
+        LU, piv = ML._fatorar_lu(np.array(J, dtype=float), pivotear=_FATORACAO_REAPROVEITAVEL[metodo_linear])
+        if LU is None:
+            return None
+        return lambda r: ML._resolver_lu(LU, piv, r)
+
+    if metodo_linear == "LU em banda":
+        p, q = ML.largura_banda(J)
+        B = ML._armazenar_banda(J, p, q)
+        if ML._fatorar_lu_banda(B, p, q) is not None:
+            return None
+        return lambda r: ML._resolver_lu_banda(B, p, q, np.array(r, dtype=float))
+
+    if metodo_linear not in ML.METODOS:
+        raise ValueError(f"Método '{metodo_linear}' não encontrado em METODOS.")
+
+    def resolver(r):
+        x, _, status = ML.METODOS[metodo_linear](J, r, **opcoes)[:3]
+        if x is None or not status.split("] ", 1)[-1].startswith(("Sucesso", "Convergiu")):
+            return None
+        return x
+
+    return resolver
+
+
+# ---------------------------------------------------------------
+# Newton / método da corda
+# ---------------------------------------------------------------
+
+def newton_sistema(F, x0, jacobiano="diferencas", tol=1e-10, max_iter=50, reutilizar=1,
+                   metodo_linear="Gauss com pivoteamento parcial", lote=False, banda=None,
+                   retornar_passos=False, **opcoes_lineares):
+    """Newton para F(x) = 0.
+
+    reutilizar=k mantém o jacobiano (e sua fatoração) por até k iterações
+    (método da corda); ele é recalculado antes disso se o passo não reduzir
+    ||F|| pela metade. reutilizar=1 é o Newton clássico.
+    """
+    inicio = time.time()
+    x = np.array(x0, dtype=float).reshape(-1)
+    passos = {"acoes": [], "residuos": [], "avaliacoes_F": 0, "jacobianos": 0}
+    funcao_J = _funcao_jacobiano(F, jacobiano, lote, banda)
+
+    Fx = np.asarray(F(x), dtype=float)
+    passos["avaliacoes_F"] += 1
+    norma = np.linalg.norm(Fx, ord=np.inf)
+    passos["residuos"].append(norma)
+    resolver, idade = None, 0
+
+    for k in range(1, max_iter + 1):
+        if norma < tol:
+            status = f"Convergiu em {k - 1} iterações (Newton, {passos['jacobianos']} jacobianos)."
+            return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+
+        novo_jacobiano = resolver is None or idade >= reutilizar
+        if novo_jacobiano:
+            J = funcao_J(x, Fx)
+            passos["jacobianos"] += 1
+            passos["avaliacoes_F"] += 0 if callable(jacobiano) else (1 if lote else len(_grupos_colunas(x.size, banda)))
+            resolver, idade = preparar_resolvedor(J, metodo_linear, **opcoes_lineares), 0
+            if resolver is None:
+                status = f"ERRO: Jacobiano singular na iteração {k} ({metodo_linear})."
+                return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+
+        dx = resolver(-Fx)
+        if dx is None:
+            status = f"ERRO: O passo linear falhou na iteração {k} ({metodo_linear})."
+            return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+        idade += 1
+
+        x_novo = x + dx
+        F_novo = np.asarray(F(x_novo), dtype=float)
+        passos["avaliacoes_F"] += 1
+        norma_nova = np.linalg.norm(F_novo, ord=np.inf)
+
+        if not novo_jacobiano and not norma_nova <= 0.5 * norma:
+            # jacobiano velho demais: descarta o passo e recalcula em x
+            passos["acoes"].append(f"Iteração {k}: passo da corda fraco (||F|| {norma:.3e} → {norma_nova:.3e}); novo jacobiano.")
+            resolver = None
+            continue
+
+        x, Fx, norma = x_novo, F_novo, norma_nova
+        passos["residuos"].append(norma)
+        passos["acoes"].append(f"Iteração {k}: ||F||∞ = {norma:.3e}, ||dx||∞ = {np.linalg.norm(dx, ord=np.inf):.3e}")
+        if not np.isfinite(norma):
+            status = f"ERRO: Divergência (||F|| não finito) na iteração {k}."
+            return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+        if np.linalg.norm(dx, ord=np.inf) < tol * (1.0 + np.linalg.norm(x, ord=np.inf)) and norma < np.sqrt(tol):
+            status = f"Convergiu em {k} iterações (Newton, {passos['jacobianos']} jacobianos; passo abaixo da tolerância)."
+            return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+
+    if norma < tol:
+        status = f"Convergiu em {max_iter} iterações (Newton, {passos['jacobianos']} jacobianos)."
+    else:
+        status = f"Atenção: não convergiu dentro do número máximo de iterações (Newton, ||F||∞ = {norma:.3e})."
+    return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+
+
+# ---------------------------------------------------------------
+# Broyden (quase-Newton)
+# ---------------------------------------------------------------
+
+def broyden(F, x0, jacobiano="diferencas", tol=1e-10, max_iter=100, max_atualizacoes=30,
+            metodo_linear="Gauss com pivoteamento parcial", lote=False, banda=None,
+            retornar_passos=False, **opcoes_lineares):
+    """Método de Broyden ("bom") para F(x) = 0.
+
+    O jacobiano inicial é fatorado uma vez; as correções de posto 1 são
+    aplicadas à inversa na forma recursiva (pares s_k, H_k y_k), sem
+    refatorar. Reinicia com um jacobiano novo quando ||F|| cresce ou após
+    max_atualizacoes correções.
+    """
+    inicio = time.time()
+    x = np.array(x0, dtype=float).reshape(-1)
+    passos = {"acoes": [], "residuos": [], "avaliacoes_F": 0, "jacobianos": 0}
+    funcao_J = _funcao_jacobiano(F, jacobiano, lote, banda)
+
+    Fx = np.asarray(F(x), dtype=float)
+    passos["avaliacoes_F"] += 1
+    norma = np.linalg.norm(Fx, ord=np.inf)
+    passos["residuos"].append(norma)
+    resolver, pares = None, []
+
+    def aplicar_H(r):
+        z = resolver(r)
+        if z is None:
+            return None
+        for s, w, sw in pares:
+            z = z + (s - w) * (np.dot(s, z) / sw)
+        return z
+
+    for k in range(1, max_iter + 1):
+        if norma < tol:
+            status = f"Convergiu em {k - 1} iterações (Broyden, {passos['jacobianos']} jacobianos)."
+            return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+
+        if resolver is None or len(pares) >= max_atualizacoes:
+            J = funcao_J(x, Fx)
+            passos["jacobianos"] += 1
+            passos["avaliacoes_F"] += 0 if callable(jacobiano) else (1 if lote else len(_grupos_colunas(x.size, banda)))
+            resolver, pares = preparar_resolvedor(J, metodo_linear, **opcoes_lineares), []
+            if resolver is None:
+                status = f"ERRO: Jacobiano singular na iteração {k} ({metodo_linear})."
+                return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+            recem_calculado = True
+        else:
+            recem_calculado = False
+
+        s = aplicar_H(-Fx)
+        if s is None:
+            status = f"ERRO: O passo linear falhou na iteração {k} ({metodo_linear})."
+            return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+
+        x_novo = x + s
+        F_novo = np.asarray(F(x_novo), dtype=float)
+        passos["avaliacoes_F"] += 1
+        norma_nova = np.linalg.norm(F_novo, ord=np.inf)
+
+        if not recem_calculado and not norma_nova < norma:
+            passos["acoes"].append(f"Iteração {k}: ||F|| não diminuiu ({norma:.3e} → {norma_nova:.3e}); reiniciando com novo jacobiano.")
+            resolver = None
+            continue
+
+        # atualização de posto 1 da inversa: guarda s e w = H_k y
+        w = aplicar_H(F_novo - Fx)
+        sw = np.dot(s, w) if w is not None else 0.0
+        if w is not None and abs(sw) > 1e-14 * np.dot(s, s):
+            pares.append((s, w, sw))
+
+        x, Fx, norma = x_novo, F_novo, norma_nova
+        passos["residuos"].append(norma)
+        passos["acoes"].append(f"Iteração {k}: ||F||∞ = {norma:.3e}, ||s||∞ = {np.linalg.norm(s, ord=np.inf):.3e}")
+        if not np.isfinite(norma):
+            status = f"ERRO: Divergência (||F|| não finito) na iteração {k}."
+            return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+
+    if norma < tol:
+        status = f"Convergiu em {max_iter} iterações (Broyden, {passos['jacobianos']} jacobianos)."
+    else:
+        status = f"Atenção: não convergiu dentro do número máximo de iterações (Broyden, ||F||∞ = {norma:.3e})."
+    return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+
+
+# ---------------------------------------------------------------
+# Ponto fixo vetorial x = phi(x) com aceleração de Anderson
+# ---------------------------------------------------------------
+
+def ponto_fixo_anderson(phi, x0, m=5, beta=1.0, tol=1e-10, max_iter=500, retornar_passos=False):
+    """Iteração de ponto fixo com mistura de Anderson (memória m; m=0 é a iteração simples).
+
+    Usa as m últimas diferenças dos resíduos r = phi(x) - x: γ minimiza
+    ||r_k - ΔR γ|| (mínimos quadrados) e x_{k+1} = x_k - ΔX γ + beta (r_k - ΔR γ).
+    """
+    inicio = time.time()
+    x = np.array(x0, dtype=float).reshape(-1)
+    passos = {"acoes": [], "residuos": [], "avaliacoes_phi": 1}
+
+    r = np.asarray(phi(x), dtype=float) - x
+    historico_x, historico_r = [], []
+
+    for k in range(1, max_iter + 1):
+        norma = np.linalg.norm(r, ord=np.inf)
+        passos["residuos"].append(norma)
+        if norma < tol:
+            status = f"Convergiu em {k - 1} iterações (Ponto Fixo com Anderson, m={m})."
+            return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+        if not np.isfinite(norma):
+            status = f"ERRO: Divergência (resíduo não finito) na iteração {k}."
+            return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+
+        if historico_r:
+            delta_x = np.column_stack(historico_x)
+            delta_r = np.column_stack(historico_r)
+            gama = np.linalg.lstsq(delta_r, r, rcond=None)[0]
+            x_novo = x - delta_x @ gama + beta * (r - delta_r @ gama)
+        else:
+            x_novo = x + beta * r
+
+        r_novo = np.asarray(phi(x_novo), dtype=float) - x_novo
+        passos["avaliacoes_phi"] += 1
+        if m > 0:
+            historico_x.append(x_novo - x)
+            historico_r.append(r_novo - r)
+            if len(historico_r) > m:
+                historico_x.pop(0)
+                historico_r.pop(0)
+        x, r = x_novo, r_novo
+
+    norma = np.linalg.norm(r, ord=np.inf)
+    if norma < tol:
+        status = f"Convergiu em {max_iter} iterações (Ponto Fixo com Anderson, m={m})."
+    else:
+        status = f"Atenção: não convergiu dentro do número máximo de iterações (Ponto Fixo com Anderson, ||phi(x) - x||∞ = {norma:.3e})."
+    return ML._empacotar_retorno(x, time.time() - inicio, status, passos, retornar_passos)
+
+
+METODOS_SISTEMAS = {
+    "Newton": newton_sistema,
+    "Newton (corda)": lambda F, x0, **kw: newton_sistema(F, x0, **{"reutilizar": 5, **kw}),
+    "Broyden": broyden,
+}